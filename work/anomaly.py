@@ -0,0 +1,104 @@
+import numpy as np
+
+NORMAL, SPIKE, DIP = 0, 1, 2
+LABELS = {SPIKE: "급증", DIP: "급감"}
+
+
+class AnomalyDetector:
+    """서버별 CPU의 지수 가중 이동 평균(EWMA)과 분산으로 급증/급감을 표시합니다.
+
+    서버마다 평균, 분산, 샘플 수, 현재 표시만 보관하므로 상태는 서버당 일정하고,
+    틱마다 실행 중인 서버 전체를 벡터 연산 한 번으로 갱신합니다.
+    새 샘플이 평균에서 z_threshold 표준편차 이상 벗어나면 급증(SPIKE)이나
+    급감(DIP)으로, 평균이 busy_mean(%) 이상이던 서버가 평균의 idle_ratio배 아래로
+    떨어지면 갑자기 유휴가 된 것으로 보고 급감으로 표시합니다.
+    표시는 다음 샘플이 정상이면 풀리고, 이상 샘플도 평균에 반영하므로
+    수준이 바뀐 채로 유지되면 곧 정상으로 돌아옵니다.
+
+    fleet.anomalies에 붙이면 서버 목록에 표시되고, plan_stops와 일괄 중지는
+    표시된 서버를 중지하지 않습니다.
+    """
+
+    def __init__(self, size, alpha=0.1, z_threshold=3.0, idle_ratio=0.2, busy_mean=10.0,
+                 warmup=12, min_std=1.0):
+        if not 0 < alpha <= 1:
+            raise ValueError("alpha는 0 초과 1 이하여야 합니다.")
+        self.alpha = alpha
+        self.z_threshold = z_threshold
+        self.idle_ratio = idle_ratio
+        self.busy_mean = busy_mean
+        self.warmup = warmup
+        # 거의 일정한 서버가 작은 흔들림으로 표시되지 않도록 표준편차의 하한(%p)
+        self.min_std = min_std
+        self.mean = np.zeros(size)
+        self.var = np.zeros(size)
+        self.count = np.zeros(size, dtype=np.uint16)
+        self.flags = np.zeros(size, dtype=np.uint8)
+        self._was_running = np.zeros(size, dtype=bool)
+        self.spikes = 0  # 지금까지 표시한 급증/급감 샘플 수
+        self.dips = 0
+
+    def __len__(self):
+        return len(self.count)
+
+    def attach(self, engine):
+        """엔진의 틱마다 실행 중인 서버의 CPU를 반영하도록 구독합니다."""
+        return engine.subscribe(lambda e: self.record_fleet(e.fleet))
+
+    def record_fleet(self, fleet):
+        """실행 중인 서버의 현재 CPU를 반영합니다. 중지되거나 다시 시작된 서버는 새로 배웁니다."""
+        with fleet.lock:
+            running = fleet.running.copy()
+            rows = np.flatnonzero(running)
+            values = fleet.cpu_usage[rows]
+        self.reset(np.flatnonzero(running != self._was_running))
+        self._was_running = running
+        self.record(rows, values)
+
+    def reset(self, rows):
+        """rows 서버의 통계와 표시를 지웁니다."""
+        self.count[rows] = 0
+        self.flags[rows] = NORMAL
+
+    def record(self, rows, values):
+        """rows 서버에 values 샘플을 하나씩 반영하고 표시를 갱신합니다. rows는 겹치지 않아야 합니다."""
+        rows = np.asarray(rows, dtype=np.int64)
+        values = np.asarray(values, dtype=np.float64)
+        mean = self.mean[rows]
+        var = self.var[rows]
+        count = self.count[rows]
+
+        z = (values - mean) / np.maximum(np.sqrt(var), self.min_std)
+        ready = count >= self.warmup
+        spike = ready & (z > self.z_threshold)
+        idle = (mean >= self.busy_mean) & (values < mean * self.idle_ratio)
+        dip = ready & ((z < -self.z_threshold) | idle)
+        # 급증은 평균 위, 급감은 평균 아래라 겹치지 않으므로 비트 연산으로 표시를 만듦
+        self.flags[rows] = spike.view(np.uint8) * SPIKE | dip.view(np.uint8) * DIP
+        self.spikes += int(np.count_nonzero(spike))
+        self.dips += int(np.count_nonzero(dip))
+
+        # 증분 EWMA 평균/분산, 첫 샘플은 그대로 평균으로 씀
+        diff = values - mean
+        increment = self.alpha * diff
+        mean += increment
+        var += diff * increment
+        var *= 1 - self.alpha
+        first = np.flatnonzero(count == 0)
+        mean[first] = values[first]
+        var[first] = 0.0
+        self.mean[rows] = mean
+        self.var[rows] = var
+        self.count[rows] = np.minimum(count, np.iinfo(np.uint16).max - 1) + 1
+
+    def flagged(self, rows=None):
+        """rows 서버가 지금 이상 상태로 표시되어 있는지 bool 배열로 반환합니다."""
+        rows = slice(None) if rows is None else rows
+        return self.flags[rows] != NORMAL
+
+    def flagged_count(self):
+        return int(np.count_nonzero(self.flags))
+
+    def label(self, index):
+        """서버 하나의 표시 문자열을 반환합니다. 정상이면 빈 문자열입니다."""
+        return LABELS.get(int(self.flags[index]), "")
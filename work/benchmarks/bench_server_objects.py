@@ -0,0 +1,97 @@
+"""서버 한 대당 메모리와 전체 틱 시간을 표현 방식별로 비교합니다.
+
+    eager    dict 기반 객체, 갱신마다 시각을 "HH:MM:SS" 문자열로 만드는 예전 Server
+    slotted  __slots__ Server, epoch 초만 저장하고 표시할 때 문자열로 변환
+    fleet    열 기반 Fleet (numpy 배열)
+
+메모리는 tracemalloc으로 잰 생성 직후 할당량(이름, 값, 목록 포함)을 서버 수로 나눈 값입니다.
+
+    python benchmarks/bench_server_objects.py --size 1000000
+"""
+import argparse
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from os.path import abspath, dirname
+
+sys.path.insert(0, dirname(dirname(abspath(__file__))))
+
+from engine import SimulationEngine  # noqa: E402
+from fleet import Fleet  # noqa: E402
+from server import Server  # noqa: E402
+
+
+class EagerServer:
+    """비교용으로 남겨 둔 예전 Server의 저장 방식과 갱신 경로입니다."""
+
+    def __init__(self, name, cpu_usage, cost_per_hour, rng):
+        self.name = name
+        self.cpu_usage = cpu_usage
+        self.cost_per_hour = cost_per_hour
+        self.rng = rng
+        self.running = True
+        self.last_updated = datetime.now().strftime("%H:%M:%S")
+
+    def update_usage(self):
+        if self.running:
+            if self.cpu_usage < 5:
+                self.cpu_usage = self.rng.uniform(1, 10)
+            else:
+                self.cpu_usage = self.rng.uniform(5, 30)
+            self.last_updated = datetime.now().strftime("%H:%M:%S")
+
+
+def build_objects(cls, size):
+    rng = random.Random(size)
+    return [cls(f"Server-{i + 1}", rng.uniform(5, 15), rng.uniform(5, 15), rng)
+            for i in range(size)]
+
+
+def measure_build(build):
+    tracemalloc.start()
+    try:
+        result = build()
+        allocated, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, allocated
+
+
+def median_ms(func, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="서버 표현 방식별 메모리/틱 시간 비교")
+    parser.add_argument('--size', type=int, default=1000000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"서버 {args.size:,}대")
+    print(f"{'kind':<8} {'bytes/server':>13} {'tick ms':>10}")
+    for kind in ('eager', 'slotted', 'fleet'):
+        if kind == 'fleet':
+            fleet, allocated = measure_build(lambda: Fleet.random(args.size, seed=args.size))
+            tick = SimulationEngine(fleet, start_time=0).tick
+        else:
+            cls = EagerServer if kind == 'eager' else Server
+            servers, allocated = measure_build(lambda: build_objects(cls, args.size))
+
+            def tick():
+                for server in servers:
+                    server.update_usage()
+        print(f"{kind:<8} {allocated / args.size:>13.1f} {median_ms(tick, args.repeat):>10.1f}")
+        # 다음 측정 전에 메모리를 돌려줌
+        fleet = servers = tick = None
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""헤드리스 CLI 명령의 시작 시간을 main.STARTUP_BUDGETS와 비교합니다.
+
+명령마다 새 프로세스를 여러 번 띄워 종료까지 걸린 시간의 중앙값을 재고,
+-X importtime 출력으로 tkinter가 불러와지지 않았는지도 확인합니다.
+예산을 넘거나 tkinter를 불러오면 종료 코드 1을 반환합니다.
+
+    python benchmarks/bench_startup.py --repeat 7
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+WORK_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MAIN = os.path.join(WORK_DIR, 'main.py')
+sys.path.insert(0, WORK_DIR)
+
+from main import STARTUP_BUDGETS  # noqa: E402
+
+
+def run(argv):
+    """main.py를 새 프로세스로 실행하고 (초, 불러온 최상위 모듈 집합)을 반환합니다."""
+    started = time.perf_counter()
+    completed = subprocess.run([sys.executable, '-X', 'importtime', MAIN] + argv,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                               universal_newlines=True, check=True)
+    elapsed = time.perf_counter() - started
+    modules = {line.rsplit('|', 1)[-1].strip().split('.')[0]
+               for line in completed.stderr.splitlines() if line.startswith('import time:')}
+    return elapsed, modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CLI 시작 시간 예산 확인")
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        db_path = os.path.join(directory, 'metrics.db')
+        run(['simulate', '--size', '50', '--duration', '10m', '--db', db_path])
+        cases = {
+            'help': ['--help'],
+            'report': ['report', '--db', db_path],
+            'optimize': ['optimize', '--dry-run', '--size', '100', '--warmup', '1m'],
+        }
+
+        failed = False
+        print(f"{'command':<10} {'median ms':>10} {'budget ms':>10} {'tkinter':>8}")
+        for name, argv in cases.items():
+            timings, modules = [], set()
+            for _ in range(args.repeat):
+                elapsed, loaded = run(argv)
+                timings.append(elapsed)
+                modules |= loaded
+            median = statistics.median(timings)
+            budget = STARTUP_BUDGETS[name]
+            uses_tk = 'tkinter' in modules
+            ok = median <= budget and not uses_tk
+            failed |= not ok
+            print(f"{name:<10} {median * 1000:>10.1f} {budget * 1000:>10.0f} "
+                  f"{'yes' if uses_tk else 'no':>8}{'' if ok else '  <- 초과'}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,93 @@
+"""TreeviewSync가 틱마다 호출하는 Tk 명령 수를 측정합니다.
+
+실제 Treeview 대신 호출 횟수만 세는 CountingTree를 사용하므로
+디스플레이 없이 실행할 수 있습니다. 실제 틱처럼 실행 중인 모든 서버의 갱신 시각을
+바꾸면서 일부 서버의 값만 바꾼 경우와, 시뮬레이션 엔진의 engine.tick() 한 번을 잽니다.
+
+    python benchmarks/bench_tree_sync.py
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine import SimulationEngine  # noqa: E402
+from fleet import Fleet  # noqa: E402
+from tree_sync import TreeviewSync  # noqa: E402
+
+
+class CountingTree:
+    """ttk.Treeview의 insert/item/delete 호출 수를 세는 대역입니다."""
+
+    def __init__(self):
+        self.calls = 0
+        self._next = 0
+
+    def get_children(self):
+        self.calls += 1
+        return ()
+
+    def delete(self, *items):
+        self.calls += 1
+
+    def insert(self, parent, index, values=()):
+        self.calls += 1
+        self._next += 1
+        return f"I{self._next:06X}"
+
+    def item(self, item_id, values=()):
+        self.calls += 1
+
+
+def synced(fleet):
+    tree = CountingTree()
+    sync = TreeviewSync(tree, fleet)
+    sync.refresh()
+    tree.calls = 0
+    return tree, sync
+
+
+def timed_refresh(tree, sync):
+    start = time.perf_counter()
+    updated = sync.refresh()
+    return tree.calls, updated, time.perf_counter() - start
+
+
+def measure(size, changed_rows):
+    """실행 중인 모든 서버의 샘플이 들어왔지만 changed_rows개 값만 바뀐 틱을 잽니다."""
+    fleet = Fleet.random(size, rng=np.random.default_rng(0))
+    tree, sync = synced(fleet)
+    values = fleet.cpu_usage.copy()
+    values[:changed_rows] += 1.0
+    # 수집기 틱처럼 last_updated는 실행 중인 모든 서버에서 바뀜
+    fleet.apply_samples(np.arange(size), values, now=fleet.last_updated.max() + 60)
+    return timed_refresh(tree, sync)
+
+
+def measure_engine_tick(size):
+    """시뮬레이션 엔진의 실제 틱 하나 뒤의 Tk 호출 수와 소요 시간을 반환합니다."""
+    fleet = Fleet.random(size, rng=np.random.default_rng(0))
+    engine = SimulationEngine(fleet, start_time=0.0)
+    tree, sync = synced(fleet)
+    engine.tick()
+    return timed_refresh(tree, sync)
+
+
+def main():
+    print(f"{'fleet':>10} {'changed':>8} {'tk_calls':>9} {'ms':>8}")
+    for size in (1000, 10000, 100000):
+        for changed_rows in (0, 10, 100, 1000):
+            calls, updated, elapsed = measure(size, changed_rows)
+            assert calls == updated == changed_rows
+            print(f"{size:>10} {changed_rows:>8} {calls:>9} {elapsed * 1000:>8.2f}")
+        # 시뮬레이션 분포는 틱마다 대부분의 서버 CPU를 표시 단위 이상 바꿈
+        calls, updated, elapsed = measure_engine_tick(size)
+        assert calls == updated
+        print(f"{size:>10} {'tick':>8} {calls:>9} {elapsed * 1000:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
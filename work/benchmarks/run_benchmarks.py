@@ -0,0 +1,205 @@
+"""틱, 화면 갱신, 최적화 경로의 성능을 플릿 크기별로 측정합니다.
+
+10, 1천, 10만, 100만 대의 합성 플릿을 만들어 각 경로의 소요 시간과
+최대 메모리를 재고, 커밋 간 비교할 수 있도록 JSON으로 저장합니다.
+디스플레이가 있으면 실제 Tk 대시보드로 화면 갱신을 재고, 없으면
+Tk 호출 수만 세는 대역(stand-in)을 사용합니다.
+
+    python benchmarks/run_benchmarks.py
+    python benchmarks/run_benchmarks.py --sizes 10 1000 --compare results/old.json
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+from bench_tree_sync import CountingTree  # noqa: E402
+from engine import SimulationEngine  # noqa: E402
+from fleet import Fleet  # noqa: E402
+from optimizer import OptimizationPolicy, plan_stops  # noqa: E402
+from tree_sync import VIRTUAL_LIST_THRESHOLD, TreeviewSync, VirtualRows, format_row  # noqa: E402
+
+DEFAULT_SIZES = (10, 1000, 100000, 1000000)
+RESULTS_DIR = os.path.join(BENCH_DIR, 'results')
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def measure(func, repeat):
+    """func를 repeat번 실행해 시간(초) 통계와 최대 추적 메모리를 반환합니다."""
+    timings = []
+    tracemalloc.start()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {
+        'min_ms': min(timings) * 1000,
+        'median_ms': statistics.median(timings) * 1000,
+        'peak_bytes': peak,
+    }
+
+
+def make_tk_root():
+    """디스플레이가 있으면 숨겨진 Tk 루트를, 없으면 None을 반환합니다."""
+    try:
+        import tkinter as tk
+        root = tk.Tk()
+    except Exception:
+        return None
+    root.withdraw()
+    return root
+
+
+class HeadlessRedraw:
+    """대시보드와 같은 기준으로 목록 갱신 경로를 고르되 Tk 대신 대역을 씁니다."""
+
+    def __init__(self, fleet, threshold):
+        self.fleet = fleet
+        if len(fleet) > threshold:
+            self.rows = VirtualRows(fleet, visible=20)
+            self.sync = None
+        else:
+            self.rows = None
+            self.sync = TreeviewSync(CountingTree(), fleet)
+            self.sync.refresh()
+
+    def __call__(self):
+        if self.sync is not None:
+            self.sync.refresh()
+        else:
+            if self.rows.sort_key == 'cpu':
+                self.rows.resort()
+            [format_row(self.fleet, index) for index in self.rows.window()]
+        self.fleet.monthly_cost()
+
+
+def bench_size(size, repeat, root):
+    fleet = Fleet.random(size, rng=np.random.default_rng(size))
+    engine = SimulationEngine(fleet, start_time=0)
+    result = {
+        'size': size,
+        'fleet_bytes': sum(array.nbytes for array in (
+            fleet.names, fleet.cpu_usage, fleet.cost_per_hour, fleet.running,
+            fleet.last_updated, fleet.capacity, fleet.groups, fleet.group_codes)),
+    }
+
+    result['tick'] = measure(engine.tick, repeat)
+
+    window = None
+    if root is not None:
+        import tkinter as tk
+        from dashboard import FinOpsDashboard
+        window = tk.Toplevel(root)
+        app = FinOpsDashboard(window, fleet=fleet)
+
+        def redraw():
+            engine.tick()
+            app.update_server_display()
+            window.update_idletasks()
+        result['redraw_mode'] = 'tk'
+    else:
+        headless = HeadlessRedraw(fleet, VIRTUAL_LIST_THRESHOLD)
+
+        def redraw():
+            engine.tick()
+            headless()
+        result['redraw_mode'] = 'headless'
+    # 화면 갱신 시간에는 갱신할 변경을 만드는 틱 시간이 포함됨
+    result['redraw'] = measure(redraw, repeat)
+    if window is not None:
+        window.destroy()
+
+    policy = OptimizationPolicy(cpu_threshold=10.0, min_running=1)
+    result['optimize'] = measure(lambda: plan_stops(fleet, policy), repeat)
+    return result
+
+
+def git_revision():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], cwd=BENCH_DIR,
+                                       stderr=subprocess.DEVNULL).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def compare(results, baseline_path):
+    """이전 결과 파일과 median 시간을 비교해 출력합니다."""
+    with open(baseline_path, encoding='utf-8') as f:
+        baseline = {entry['size']: entry for entry in json.load(f)['results']}
+    print(f"\n{baseline_path} 대비 median 비율 (1보다 크면 느려짐)")
+    for entry in results:
+        old = baseline.get(entry['size'])
+        if old is None:
+            continue
+        ratios = []
+        for path in ('tick', 'redraw', 'optimize'):
+            before = old[path]['median_ms']
+            ratio = entry[path]['median_ms'] / before if before else float('nan')
+            ratios.append(f"{path}={ratio:.2f}x")
+        print(f"{entry['size']:>9}  " + "  ".join(ratios))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--output', help='결과 JSON 경로 (기본: benchmarks/results/<커밋>.json)')
+    parser.add_argument('--compare', help='비교할 이전 결과 JSON 경로')
+    parser.add_argument('--headless', action='store_true', help='디스플레이가 있어도 대역 사용')
+    args = parser.parse_args(argv)
+
+    root = None if args.headless else make_tk_root()
+    revision = git_revision()
+    results = []
+    print(f"{'size':>9} {'tick ms':>9} {'redraw ms':>10} {'optimize ms':>12} "
+          f"{'fleet MB':>9} {'peak MB':>9}")
+    for size in args.sizes:
+        entry = bench_size(size, args.repeat, root)
+        results.append(entry)
+        peak = max(entry[path]['peak_bytes'] for path in ('tick', 'redraw', 'optimize'))
+        print(f"{size:>9} {entry['tick']['median_ms']:>9.2f} {entry['redraw']['median_ms']:>10.2f} "
+              f"{entry['optimize']['median_ms']:>12.2f} {entry['fleet_bytes'] / 2**20:>9.1f} "
+              f"{peak / 2**20:>9.1f}")
+
+    report = {
+        'revision': revision,
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'redraw_mode': 'tk' if root is not None else 'headless',
+        'max_rss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss if resource else None,
+        'results': results,
+    }
+    output = args.output or os.path.join(RESULTS_DIR, f"{revision}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"\n결과 저장: {output}")
+
+    if args.compare:
+        compare(results, args.compare)
+    if root is not None:
+        root.destroy()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,276 @@
+"""여러 서버의 시작/중지를 동시에 실행하는 일괄 작업 실행기입니다.
+
+클라우드 SDK 호출은 대부분 블로킹이므로 스레드 풀에서 실행하고,
+모든 작업이 하나의 토큰 버킷을 나눠 써서 API 호출 속도를 제한합니다.
+일시적 오류(TransientActionError)는 지수 백오프로 재시도하고,
+작업마다 진행 상황을 콜백으로 알리며 언제든 취소할 수 있습니다.
+"""
+import random
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+ACTIONS = ('start', 'stop')
+
+
+class TransientActionError(Exception):
+    """재시도하면 성공할 수 있는 오류입니다 (스로틀링, 5xx 등)."""
+
+
+class InstanceActions:
+    """인스턴스 하나를 시작/중지하는 API의 공통 인터페이스입니다.
+
+    메서드는 완료될 때까지 블로킹하고, 실패하면 예외를 던집니다.
+    """
+
+    def start(self, name):
+        raise NotImplementedError
+
+    def stop(self, name):
+        raise NotImplementedError
+
+
+class SimulatedActions(InstanceActions):
+    """API 지연과 일시적 오류를 흉내 내는 시뮬레이션 구현입니다."""
+
+    def __init__(self, latency=0.05, failure_rate=0.05, seed=None):
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def _call(self, name):
+        with self._lock:
+            delay = self.latency * (0.5 + self.random.random())
+            failed = self.random.random() < self.failure_rate
+        time.sleep(delay)
+        if failed:
+            raise TransientActionError(f"{name}: 요청이 스로틀링되었습니다.")
+
+    def start(self, name):
+        self._call(name)
+
+    def stop(self, name):
+        self._call(name)
+
+
+class TokenBucket:
+    """초당 rate개, 최대 burst개까지 쌓이는 토큰 버킷입니다. 여러 스레드가 함께 씁니다."""
+
+    def __init__(self, rate, burst=None):
+        self.rate = float(rate)
+        self.burst = float(burst if burst is not None else max(1.0, rate))
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, cancelled=None):
+        """토큰 하나를 얻을 때까지 기다립니다. cancelled가 설정되면 False를 반환합니다."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return True
+                wait = (1 - self._tokens) / self.rate
+            if cancelled is not None:
+                if cancelled.wait(wait):
+                    return False
+            else:
+                time.sleep(wait)
+
+
+class BulkProgress:
+    """일괄 작업의 진행 상황 스냅샷입니다."""
+
+    def __init__(self, action, total):
+        self.action = action
+        self.total = total
+        self.succeeded = 0
+        self.failed = 0
+        self.skipped = 0  # 취소, 이미 원하는 상태, 이상 상태라 중지하지 않은 서버
+        self.retries = 0
+        self.cancelled = False
+        self.errors = []  # (서버 이름, 오류 메시지), 최근 것 일부만 보관
+
+    @property
+    def done(self):
+        return self.succeeded + self.failed + self.skipped
+
+    @property
+    def finished(self):
+        return self.done >= self.total
+
+    def copy(self):
+        snapshot = BulkProgress(self.action, self.total)
+        snapshot.__dict__.update(self.__dict__, errors=list(self.errors))
+        return snapshot
+
+    def __repr__(self):
+        return (f"BulkProgress({self.action} {self.done}/{self.total}, ok={self.succeeded}, "
+                f"failed={self.failed}, skipped={self.skipped}, retries={self.retries}, "
+                f"cancelled={self.cancelled})")
+
+
+class BulkJob:
+    """submit()이 반환하는 일괄 작업 핸들입니다."""
+
+    MAX_ERRORS = 20
+
+    def __init__(self, action, total, on_progress=None, on_done=None):
+        self._progress = BulkProgress(action, total)
+        self._lock = threading.Lock()
+        self._cancelled = threading.Event()
+        self._finished = threading.Event()
+        self._on_progress = on_progress
+        self._on_done = on_done
+        if total == 0:
+            self._finish()
+
+    @property
+    def progress(self):
+        with self._lock:
+            return self._progress.copy()
+
+    def cancel(self):
+        """아직 시작하지 않은 서버는 건너뛰고, 백오프 대기 중인 재시도도 멈춥니다.
+
+        이미 API를 호출 중인 서버는 그 호출이 끝날 때까지 기다립니다.
+        """
+        with self._lock:
+            self._progress.cancelled = True
+        self._cancelled.set()
+
+    def cancelled(self):
+        return self._cancelled.is_set()
+
+    def done(self):
+        return self._finished.is_set()
+
+    def wait(self, timeout=None):
+        """작업이 끝날 때까지 기다리고, 끝났으면 True를 반환합니다."""
+        return self._finished.wait(timeout)
+
+    def _record(self, outcome, name=None, error=None, retries=0):
+        with self._lock:
+            progress = self._progress
+            setattr(progress, outcome, getattr(progress, outcome) + 1)
+            progress.retries += retries
+            if error is not None:
+                progress.errors.append((name, str(error)))
+                del progress.errors[:-self.MAX_ERRORS]
+            snapshot = progress.copy()
+        if self._on_progress is not None:
+            self._on_progress(snapshot)
+        if snapshot.finished:
+            self._finish()
+
+    def _finish(self):
+        self._finished.set()
+        if self._on_done is not None:
+            self._on_done(self.progress)
+
+
+class BulkActionExecutor:
+    """서버 시작/중지를 동시에, 속도 제한과 재시도를 지키며 실행합니다.
+
+    API 호출이 성공한 서버만 fleet.lock을 잡고 Fleet 상태에 반영하므로
+    화면과 비용 집계는 실제로 완료된 작업만 보여줍니다.
+    진행/완료 콜백은 워커 스레드에서 호출되므로 UI는 UIUpdateQueue로 넘겨야 합니다.
+    pending()은 제출했지만 아직 끝나지 않은 서버를 돌려주므로, 새 계획을 세울 때
+    대기 중인 중지를 한도에 반영할 수 있습니다.
+    """
+
+    def __init__(self, actions=None, max_workers=16, rate_per_second=10.0, burst=None,
+                 max_retries=3, backoff=0.5, max_backoff=8.0):
+        self.actions = actions if actions is not None else SimulatedActions()
+        self.rate_limit = TokenBucket(rate_per_second, burst)
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='bulk-action')
+        self._jitter = random.Random()
+        # (플릿 id, 작업) -> 끝나지 않은 서버 인덱스별 요청 수
+        self._pending = {}
+        self._pending_lock = threading.Lock()
+
+    def pending(self, fleet, action='stop'):
+        """fleet에 제출한 action 중 아직 끝나지 않은 서버 인덱스 목록을 반환합니다."""
+        with self._pending_lock:
+            return sorted(self._pending.get((id(fleet), action), ()))
+
+    def _track(self, fleet, action, indices, delta):
+        with self._pending_lock:
+            counts = self._pending.setdefault((id(fleet), action), Counter())
+            for index in indices:
+                counts[index] += delta
+                if counts[index] <= 0:
+                    del counts[index]
+
+    def submit(self, fleet, action, indices, on_progress=None, on_done=None):
+        """indices 서버에 action('start' 또는 'stop')을 실행하는 작업을 시작합니다."""
+        if action not in ACTIONS:
+            raise ValueError(f"알 수 없는 작업입니다: {action}")
+        indices = [int(index) for index in indices]
+        job = BulkJob(action, len(indices), on_progress, on_done)
+        self._track(fleet, action, indices, +1)
+        for index in indices:
+            self._pool.submit(self._run_one, job, fleet, action, index)
+        return job
+
+    def _run_one(self, job, fleet, action, index):
+        try:
+            self._run_action(job, fleet, action, index)
+        finally:
+            # 플릿에 반영된 뒤에 빼므로, 대기 중이거나 이미 반영된 상태 중 하나로 보임
+            self._track(fleet, action, (index,), -1)
+
+    def _run_action(self, job, fleet, action, index):
+        name = str(fleet.names[index])
+        with fleet.lock:
+            already = bool(fleet.running[index]) == (action == 'start')
+            # 계획 이후 이상 상태가 된 서버는 중지하지 않음
+            held = (action == 'stop' and fleet.anomalies is not None
+                    and bool(fleet.anomalies.flagged(index)))
+        if already or held or job.cancelled():
+            job._record('skipped')
+            return
+
+        call = getattr(self.actions, action)
+        retries = 0
+        while True:
+            if not self.rate_limit.acquire(job._cancelled):
+                job._record('skipped', retries=retries)
+                return
+            try:
+                call(name)
+                break
+            except TransientActionError as error:
+                if retries >= self.max_retries:
+                    job._record('failed', name, error, retries)
+                    return
+                delay = min(self.max_backoff, self.backoff * 2 ** retries)
+                retries += 1
+                # 동시에 실패한 요청이 한꺼번에 재시도하지 않도록 지터를 줌
+                if job._cancelled.wait(delay * (0.5 + self._jitter.random() / 2)):
+                    job._record('skipped', retries=retries)
+                    return
+            except Exception as error:
+                job._record('failed', name, error, retries)
+                return
+
+        with fleet.lock:
+            if action == 'start':
+                fleet.start(index)
+            else:
+                fleet.stop(index)
+        job._record('succeeded', retries=retries)
+
+    def shutdown(self, cancel_jobs=()):
+        """주어진 작업을 취소하고 워커 스레드를 정리합니다."""
+        for job in cancel_jobs:
+            job.cancel()
+        self._pool.shutdown(wait=True)
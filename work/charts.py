@@ -0,0 +1,180 @@
+import tkinter as tk
+
+import numpy as np
+
+from downsample import downsample
+from fleet import format_timestamp
+
+CHART_BG = '#34495e'
+GRID_COLOR = '#4a6278'
+TEXT_COLOR = 'white'
+PADDING = (44, 18, 8, 18)  # 왼쪽, 위, 오른쪽, 아래 여백 (픽셀)
+
+
+class TimeSeries:
+    """(시각, 값) 샘플을 이어 붙이는 배열입니다. 공간이 모자라면 두 배로 늘립니다."""
+
+    def __init__(self, capacity=1024):
+        self.times = np.empty(capacity, dtype=np.float64)
+        self.values = np.empty(capacity, dtype=np.float32)
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def _reserve(self, extra):
+        needed = self.size + extra
+        if needed > len(self.times):
+            capacity = max(needed, 2 * len(self.times))
+            self.times = np.resize(self.times, capacity)
+            self.values = np.resize(self.values, capacity)
+
+    def append(self, timestamp, value):
+        self._reserve(1)
+        self.times[self.size] = timestamp
+        self.values[self.size] = value
+        self.size += 1
+
+    def extend(self, timestamps, values):
+        timestamps = np.asarray(timestamps, dtype=np.float64)
+        self._reserve(len(timestamps))
+        self.times[self.size:self.size + len(timestamps)] = timestamps
+        self.values[self.size:self.size + len(timestamps)] = values
+        self.size += len(timestamps)
+
+    def arrays(self):
+        """지금까지 쌓인 (시각, 값) 배열의 뷰를 반환합니다."""
+        return self.times[:self.size], self.values[:self.size]
+
+
+class ChartHistory:
+    """엔진 틱마다 차트용 시계열을 기록합니다.
+
+    플릿 전체의 월 예상 비용과 실행 중 서버 평균 CPU는 항상 기록하고,
+    watch()로 고른 서버 하나 또는 계층 그룹 하나의 CPU를 추가로 기록합니다.
+    """
+
+    def __init__(self, fleet):
+        self.fleet = fleet
+        self.cost = TimeSeries()
+        self.cpu = TimeSeries()
+        self.watched = None
+        self.watched_cpu = TimeSeries()
+
+    def attach(self, engine):
+        return engine.subscribe(lambda e: self.record(e.now))
+
+    def record(self, now):
+        fleet = self.fleet
+        with fleet.lock:
+            running = fleet.running_count()
+            self.cost.append(now, fleet.monthly_cost())
+            # 중지된 서버의 CPU는 0이므로 합계를 실행 중 서버 수로 나눔
+            self.cpu.append(now, fleet.cpu_usage.sum() / running if running else 0.0)
+            if self.watched is not None:
+                self.watched_cpu.append(now, self._watched_value())
+
+    def _watched_value(self):
+        kind, key = self.watched
+        if kind == 'server':
+            return float(self.fleet.cpu_usage[key])
+        depth, node = key
+        return float(self.fleet.hierarchy.summary(depth)[3][node])
+
+    def watch(self, selection, backfill=None):
+        """('server', 인덱스) 또는 ('group', (깊이, 노드))의 CPU 기록을 새로 시작합니다.
+
+        backfill=(시각 배열, 값 배열)을 주면 그 기록으로 시계열을 미리 채웁니다.
+        """
+        self.watched = selection
+        self.watched_cpu = TimeSeries()
+        if backfill is not None:
+            self.watched_cpu.extend(*backfill)
+
+    def watched_label(self):
+        if self.watched is None:
+            return "플릿 평균"
+        kind, key = self.watched
+        if kind == 'server':
+            return str(self.fleet.names[key])
+        return self.fleet.hierarchy.label(*key)
+
+
+class LineChart(tk.Canvas):
+    """시계열 하나를 선으로 그리는 캔버스입니다.
+
+    캔버스 항목(선, 눈금 글자)은 처음에 한 번만 만들고 plot()에서는 좌표와 글자만 바꿉니다.
+    점은 먼저 차트 너비(픽셀)만큼으로 다운샘플링하므로 그리는 비용은 기록 길이와 무관합니다.
+    """
+
+    def __init__(self, parent, title, value_format="{:.1f}", color='#2ecc71',
+                 width=460, height=130, method='lttb', **kwargs):
+        super().__init__(parent, width=width, height=height, background=CHART_BG,
+                         highlightthickness=0, **kwargs)
+        self.title = title
+        self.value_format = value_format
+        self.method = method
+        self.requested_size = (width, height)
+        left, top, right, bottom = PADDING
+        self._frame = self.create_rectangle(0, 0, 0, 0, outline=GRID_COLOR)
+        self._line = self.create_line(0, 0, 0, 0, fill=color, width=1.5, state=tk.HIDDEN)
+        self._title = self.create_text(left, 2, anchor=tk.NW, fill=TEXT_COLOR,
+                                       font=('Helvetica', 9, 'bold'), text=title)
+        self._current = self.create_text(0, 2, anchor=tk.NE, fill=color,
+                                         font=('Helvetica', 9, 'bold'))
+        self._y_max = self.create_text(left - 4, top, anchor=tk.NE, fill=TEXT_COLOR,
+                                       font=('Helvetica', 8))
+        self._y_min = self.create_text(left - 4, 0, anchor=tk.SE, fill=TEXT_COLOR,
+                                       font=('Helvetica', 8))
+        self._x_start = self.create_text(left, 0, anchor=tk.SW, fill=TEXT_COLOR,
+                                         font=('Helvetica', 8))
+        self._x_end = self.create_text(0, 0, anchor=tk.SE, fill=TEXT_COLOR,
+                                       font=('Helvetica', 8))
+        self.points_drawn = 0
+
+    def _size(self):
+        width, height = self.winfo_width(), self.winfo_height()
+        if width <= 1 or height <= 1:  # 아직 배치되지 않음
+            return self.requested_size
+        return width, height
+
+    def plot(self, times, values, title=None):
+        """시계열을 다시 그리고, 그린 점 수를 반환합니다."""
+        width, height = self._size()
+        left, top, right, bottom = PADDING
+        x0, y0, x1, y1 = left, top, width - right, height - bottom
+        self.coords(self._frame, x0, y0, x1, y1)
+        self.coords(self._current, x1, 2)
+        self.coords(self._y_min, x0 - 4, y1)
+        self.coords(self._x_start, x0, height - 2)
+        self.coords(self._x_end, x1, height - 2)
+        if title is not None and title != self.title:
+            self.title = title
+            self.itemconfigure(self._title, text=title)
+
+        if len(times) < 2:
+            self.itemconfigure(self._line, state=tk.HIDDEN)
+            self.points_drawn = 0
+            return 0
+
+        keep = downsample(times, values, max(int(x1 - x0), 3), self.method)
+        times, values = times[keep], values[keep].astype(np.float64)
+        low, high = float(values.min()), float(values.max())
+        if high - low < 1e-9:
+            low, high = low - 1, high + 1
+        start, end = float(times[0]), float(times[-1])
+        span = end - start or 1.0
+
+        points = np.empty((len(times), 2))
+        points[:, 0] = x0 + (times - start) * ((x1 - x0) / span)
+        points[:, 1] = y1 - (values - low) * ((y1 - y0) / (high - low))
+        self.coords(self._line, *points.ravel().tolist())
+        self.itemconfigure(self._line, state=tk.NORMAL)
+
+        self.itemconfigure(self._current, text=self.value_format.format(values[-1]))
+        self.itemconfigure(self._y_max, text=self.value_format.format(high))
+        self.itemconfigure(self._y_min, text=self.value_format.format(low))
+        self.itemconfigure(self._x_start, text=format_timestamp(start))
+        self.itemconfigure(self._x_end, text=format_timestamp(end))
+        self.points_drawn = len(points)
+        return self.points_drawn
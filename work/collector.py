@@ -0,0 +1,246 @@
+import asyncio
+import json
+import threading
+from urllib.parse import urlsplit
+
+import numpy as np
+
+DESCRIBE_PATH = '/v1/instances/metrics:describe'
+
+
+class MetricsSource:
+    """서버 CPU 사용률을 플릿에 공급하는 소스의 공통 인터페이스입니다.
+
+    엔진은 틱마다 fleet.lock을 잡은 채 update(fleet, now)를 호출합니다.
+    구현은 이 호출 안에서 네트워크를 기다리면 안 됩니다.
+    """
+
+    def update(self, fleet, now):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class SimulatedSource(MetricsSource):
+    """random 분포로 사용량을 만들어내는 기본 시뮬레이션 소스입니다."""
+
+    def update(self, fleet, now):
+        fleet.update_usage(now=now)
+
+
+class HttpError(Exception):
+    """메트릭 API가 2xx가 아닌 응답을 보냈을 때 발생합니다."""
+
+
+class _Connection:
+    """keep-alive HTTP/1.1 연결 하나입니다. Content-Length 응답만 지원합니다."""
+
+    def __init__(self, reader, writer, host):
+        self.reader = reader
+        self.writer = writer
+        self.host = host
+
+    async def request(self, method, path, body=b''):
+        head = (f"{method} {path} HTTP/1.1\r\n"
+                f"Host: {self.host}\r\n"
+                "Content-Type: application/json\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                "Connection: keep-alive\r\n\r\n")
+        self.writer.write(head.encode('latin-1') + body)
+        await self.writer.drain()
+
+        status_line = await self.reader.readline()
+        if not status_line:
+            raise ConnectionError("서버가 연결을 닫았습니다.")
+        status = int(status_line.split()[1])
+        length = 0
+        keep_alive = True
+        while True:
+            line = await self.reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            name = name.strip().lower()
+            if name == 'content-length':
+                length = int(value)
+            elif name == 'connection' and value.strip().lower() == 'close':
+                keep_alive = False
+        payload = await self.reader.readexactly(length)
+        return status, payload, keep_alive
+
+    def close(self):
+        self.writer.close()
+
+
+class ConnectionPool:
+    """호스트 하나에 대한 keep-alive 연결 풀입니다. 최대 size개까지 엽니다."""
+
+    def __init__(self, host, port, size=10):
+        self.host = host
+        self.port = port
+        self.size = size
+        self._idle = []
+        self._opened = 0
+        self._available = None
+
+    async def _open(self):
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        return _Connection(reader, writer, f"{self.host}:{self.port}")
+
+    async def acquire(self):
+        if self._available is None:
+            self._available = asyncio.Semaphore(self.size)
+        await self._available.acquire()
+        if self._idle:
+            return self._idle.pop()
+        try:
+            connection = await self._open()
+        except BaseException:
+            self._available.release()
+            raise
+        self._opened += 1
+        return connection
+
+    def release(self, connection, reusable=True):
+        if reusable:
+            self._idle.append(connection)
+        else:
+            connection.close()
+            self._opened -= 1
+        self._available.release()
+
+    def close(self):
+        for connection in self._idle:
+            connection.close()
+        self._idle.clear()
+        self._opened = 0
+
+
+class AsyncHttpCollector(MetricsSource):
+    """클라우드 API에서 여러 인스턴스의 CPU를 한꺼번에 조회하는 수집기입니다.
+
+    백그라운드 스레드의 asyncio 루프에서 batch_size개 인스턴스씩 묶어
+    "describe" 요청을 보내며, 동시 요청 수는 max_concurrency로 제한하고
+    요청마다 timeout을 둡니다. update()는 완료된 수집 결과를 반영하고
+    다음 수집을 시작시킬 뿐 응답을 기다리지 않으므로 Tk 루프를 막지 않습니다.
+    응답이 오지 않은 배치의 서버는 이전 값을 유지합니다.
+    """
+
+    def __init__(self, base_url, batch_size=200, max_concurrency=16, timeout=2.0,
+                 pool_size=None):
+        parts = urlsplit(base_url)
+        if parts.scheme != 'http':
+            raise ValueError("http:// URL만 지원합니다.")
+        self.host = parts.hostname
+        self.port = parts.port or 80
+        self.path = parts.path.rstrip('/') + DESCRIBE_PATH
+        self.batch_size = batch_size
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.pool = ConnectionPool(self.host, self.port, pool_size or max_concurrency)
+        self.stats = {'requests': 0, 'errors': 0, 'timeouts': 0, 'cycles': 0}
+
+        self._latest = None
+        self._latest_lock = threading.Lock()
+        self._in_flight = None
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever,
+                                        name='metrics-collector', daemon=True)
+        self._thread.start()
+
+    def update(self, fleet, now):
+        with self._latest_lock:
+            latest, self._latest = self._latest, None
+        if latest is not None:
+            indices, values = latest
+            fleet.apply_samples(indices, values, now=now)
+
+        if self._in_flight is None or self._in_flight.done():
+            indices = np.flatnonzero(fleet.running)
+            names = fleet.names[indices].tolist()
+            self._in_flight = asyncio.run_coroutine_threadsafe(
+                self._collect(indices, names), self._loop)
+
+    def collect_now(self, fleet):
+        """한 번 수집해 결과를 기다립니다. 배치 작업과 테스트용입니다."""
+        indices = np.flatnonzero(fleet.running)
+        future = asyncio.run_coroutine_threadsafe(
+            self._collect(indices, fleet.names[indices].tolist()), self._loop)
+        future.result()
+        with self._latest_lock:
+            latest, self._latest = self._latest, None
+        return latest
+
+    async def _collect(self, indices, names):
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        batches = [(indices[start:start + self.batch_size], names[start:start + self.batch_size])
+                   for start in range(0, len(names), self.batch_size)]
+        results = await asyncio.gather(*(self._describe(semaphore, batch_names)
+                                         for _, batch_names in batches))
+        got_indices, got_values = [], []
+        for (batch_indices, _), values in zip(batches, results):
+            if values is None:
+                continue
+            values = np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+            valid = ~np.isnan(values)
+            got_indices.append(batch_indices[valid])
+            got_values.append(values[valid])
+        self.stats['cycles'] += 1
+        if got_indices:
+            with self._latest_lock:
+                self._latest = (np.concatenate(got_indices), np.concatenate(got_values))
+
+    async def _describe(self, semaphore, names):
+        """인스턴스 묶음 하나의 CPU 값을 조회합니다. 실패하면 None을 반환합니다."""
+        body = json.dumps({'instance_ids': names}).encode('utf-8')
+        async with semaphore:
+            self.stats['requests'] += 1
+            try:
+                connection = await asyncio.wait_for(self.pool.acquire(), self.timeout)
+            except asyncio.TimeoutError:
+                self.stats['timeouts'] += 1
+                return None
+            except OSError:
+                self.stats['errors'] += 1
+                return None
+            reusable = False
+            try:
+                status, payload, reusable = await asyncio.wait_for(
+                    connection.request('POST', self.path, body), self.timeout)
+                if not 200 <= status < 300:
+                    raise HttpError(f"HTTP {status}")
+                values = json.loads(payload)['cpu']
+                if len(values) != len(names):
+                    raise HttpError("응답 길이가 요청한 인스턴스 수와 다릅니다.")
+                return values
+            except asyncio.TimeoutError:
+                self.stats['timeouts'] += 1
+                reusable = False
+                return None
+            except (OSError, ValueError, KeyError, HttpError, asyncio.IncompleteReadError):
+                self.stats['errors'] += 1
+                reusable = False
+                return None
+            finally:
+                self.pool.release(connection, reusable)
+
+    def close(self):
+        """수집 루프와 연결을 정리합니다."""
+        asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    async def _shutdown(self):
+        await cancel_other_tasks()
+        self.pool.close()
+
+
+async def cancel_other_tasks():
+    """현재 루프에서 실행 중인 다른 작업을 모두 취소하고 끝날 때까지 기다립니다."""
+    current = asyncio.current_task()
+    tasks = [task for task in asyncio.all_tasks() if task is not current]
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,599 @@
+"""Tkinter 대시보드입니다. GUI가 필요할 때만 main.py가 이 모듈을 불러옵니다."""
+import tkinter as tk
+from tkinter import ttk
+import time
+import threading
+
+import numpy as np
+
+from anomaly import AnomalyDetector
+from bulk import BulkActionExecutor
+from charts import ChartHistory, LineChart
+from engine import SimulationEngine
+from fleet import HOURS_PER_MONTH, Fleet
+from group_tree import GroupedServerList
+from history import CpuHistory
+from metrics_store import MetricsStore
+from optimizer import OptimizationPolicy, plan_stops
+from perf import PerfRegistry
+from rightsizing import InstanceCatalog, recommend_rightsizing
+from scheduler import AutoOptimizer
+from tree_sync import VIRTUAL_LIST_THRESHOLD, TreeviewSync
+from ui_queue import UIUpdateQueue
+from virtual_list import VirtualServerList
+
+# 일괄 시작/중지 시 초당 API 호출 수와 동시 실행 수
+BULK_RATE_PER_SECOND = 20.0
+BULK_MAX_WORKERS = 8
+
+# 성능 지표 파일을 다시 쓰는 최소 간격 (초), 수집기의 보통 주기와 맞춤
+PERF_DUMP_INTERVAL = 15.0
+
+
+class FinOpsDashboard:
+    def __init__(self, root, fleet=None, engine=None, perf_dump_path=None, bulk=None):
+        self.root = root
+        self.root.title("FinOps Cloud Cost Optimizer")
+        self.root.geometry("1000x780")
+        self.root.configure(bg='#2c3e50')
+        
+        # 서버 데이터 초기화 (처음 2개는 저사용 서버, 시간당 $5~15 비용)
+        if engine is None:
+            fleet = fleet if fleet is not None else Fleet.random(5, low_usage_count=2)
+            engine = SimulationEngine(fleet, realtime=True)
+        self.engine = engine
+        self.servers = engine.fleet
+        
+        # 최적화 조건 (최근 5분 CPU p95가 10% 미만, 최소 1개 서버 유지)
+        self.optimization_policy = OptimizationPolicy(cpu_threshold=10.0, min_running=1)
+        self.cpu_history = CpuHistory(len(self.servers))
+        self.cpu_history.attach(self.engine)
+        # 틱마다 급증/급감을 표시하고, 표시된 서버는 최적화 중지 대상에서 제외
+        self.anomalies = AnomalyDetector(len(self.servers))
+        self.anomalies.attach(self.engine)
+        self.servers.anomalies = self.anomalies
+        # 중지하지 않는 서버에는 최근 최대 CPU 기준 다운사이징을 제안
+        self.instance_catalog = InstanceCatalog()
+        self.rightsizing = None
+        
+        # 비용/CPU 추이 차트용 시계열
+        self.chart_history = ChartHistory(self.servers)
+        self.chart_history.attach(self.engine)
+        
+        # 틱/화면 갱신/최적화 지연 시간과 틱 지연(drift) 계측
+        self.perf = PerfRegistry()
+        self.perf_dump_path = perf_dump_path
+        self._next_perf_dump = 0.0
+        self._next_tick_due = None
+        
+        # 서버 시작/중지는 속도 제한과 재시도를 지키며 워커 스레드에서 실행
+        if bulk is None:
+            bulk = BulkActionExecutor(rate_per_second=BULK_RATE_PER_SECOND,
+                                      max_workers=BULK_MAX_WORKERS)
+        self.bulk = bulk
+        self.bulk_job = None
+        self._bulk_token = None
+        self.auto_optimizer = None
+        
+        # UI 초기화
+        self.setup_ui()
+        
+        # 워커 스레드의 UI 변경은 큐를 거쳐 Tk 스레드에서 프레임당 한 번 반영
+        self.ui_queue = UIUpdateQueue(self.root, self.update_server_display)
+        self.ui_queue.start()
+        
+        # 대시보드는 엔진의 틱을 구독해 화면만 갱신
+        self.engine.subscribe(self.on_engine_tick)
+        
+        # 5초마다 서버 상태 업데이트
+        self.update_server_status()
+    
+    def setup_ui(self):
+        """UI 컴포넌트들을 설정합니다."""
+        # 메인 프레임
+        self.main_frame = ttk.Frame(self.root, padding="10")
+        self.main_frame.pack(fill=tk.BOTH, expand=True)
+        
+        # 제목 라벨
+        title_label = ttk.Label(
+            self.main_frame, 
+            text="클라우드 비용 최적화 대시보드",
+            font=('Helvetica', 16, 'bold')
+        )
+        title_label.grid(row=0, column=0, columnspan=2, pady=(0, 20))
+        
+        # 왼쪽 프레임 (서버 목록)
+        self.left_frame = ttk.LabelFrame(self.main_frame, text="서버 상태 모니터링", padding=10)
+        self.left_frame.grid(row=1, column=0, padx=5, pady=5, sticky="nsew")
+        
+        # 서버 목록: 태그 계층이 있으면 그룹 트리, 대규모 플릿은 보이는 행만 그리는 가상 목록 사용
+        if self.servers.hierarchy is not None:
+            self.server_list = GroupedServerList(self.left_frame, self.servers)
+            self.server_list.pack(fill=tk.BOTH, expand=True)
+            self.tree = self.server_list.tree
+        elif len(self.servers) > VIRTUAL_LIST_THRESHOLD:
+            self.server_list = VirtualServerList(self.left_frame, self.servers)
+            self.server_list.pack(fill=tk.BOTH, expand=True)
+            self.tree = self.server_list.tree
+        else:
+            self.setup_server_tree()
+            self.server_list = TreeviewSync(self.tree, self.servers)
+        
+        # 오른쪽 프레임 (비용 정보)
+        self.right_frame = ttk.LabelFrame(self.main_frame, text="비용 분석", padding=10)
+        self.right_frame.grid(row=1, column=1, padx=5, pady=5, sticky="nsew")
+        
+        # 현재 월간 예상 비용
+        self.monthly_cost_label = ttk.Label(
+            self.right_frame, 
+            text="현재 예상 월 청구액",
+            font=('Helvetica', 10)
+        )
+        self.monthly_cost_label.pack(pady=(10, 5))
+        
+        self.cost_value = tk.StringVar()
+        self.cost_display = ttk.Label(
+            self.right_frame, 
+            textvariable=self.cost_value,
+            font=('Helvetica', 24, 'bold'),
+            foreground='red'
+        )
+        self.cost_display.pack(pady=(0, 20))
+        
+        # AI 최적화 결과 메시지
+        self.optimization_result = tk.StringVar()
+        self.optimization_label = ttk.Label(
+            self.right_frame, 
+            textvariable=self.optimization_result,
+            font=('Helvetica', 10),
+            foreground='green'
+        )
+        self.optimization_label.pack(pady=10)
+        
+        # 버튼 프레임
+        button_frame = ttk.Frame(self.right_frame)
+        button_frame.pack(pady=10, fill=tk.X)
+        
+        # AI 비용 최적화 버튼
+        self.optimize_btn = ttk.Button(
+            button_frame,
+            text="AI 비용 최적화 실행",
+            command=self.start_optimization,
+            style='Accent.TButton'
+        )
+        self.optimize_btn.pack(side=tk.LEFT, expand=True, padx=5, pady=5, fill=tk.X)
+        
+        # 서버 재시작 버튼
+        self.restart_btn = ttk.Button(
+            button_frame,
+            text="서버 재시작",
+            command=self.start_all_servers,
+            style='Success.TButton'
+        )
+        self.restart_btn.pack(side=tk.RIGHT, expand=True, padx=5, pady=5, fill=tk.X)
+        
+        # 일괄 작업 진행률과 취소 버튼
+        bulk_frame = ttk.Frame(self.right_frame)
+        bulk_frame.pack(pady=(0, 10), fill=tk.X)
+        self.bulk_progressbar = ttk.Progressbar(bulk_frame, mode='determinate', maximum=1)
+        self.bulk_progressbar.pack(side=tk.LEFT, expand=True, padx=5, fill=tk.X)
+        self.cancel_btn = ttk.Button(
+            bulk_frame,
+            text="작업 취소",
+            command=self.cancel_bulk_action,
+            state='disabled'
+        )
+        self.cancel_btn.pack(side=tk.RIGHT, padx=5)
+        
+        # 자동 최적화 (기본 꺼짐, 켜면 틱마다 바뀐 서버만 평가)
+        self.auto_optimize = tk.BooleanVar(value=False)
+        ttk.Checkbutton(
+            self.right_frame,
+            text="자동 최적화",
+            variable=self.auto_optimize,
+            command=self.toggle_auto_optimize
+        ).pack(pady=(0, 10), anchor=tk.W)
+        
+        # 성능 패널 (기본 숨김)
+        self.perf_btn = ttk.Button(
+            self.right_frame,
+            text="성능 패널",
+            command=self.toggle_perf_panel
+        )
+        self.perf_btn.pack(pady=5, fill=tk.X)
+        
+        self.perf_frame = ttk.LabelFrame(self.right_frame, text="성능", padding=10)
+        self.perf_text = tk.StringVar()
+        ttk.Label(
+            self.perf_frame,
+            textvariable=self.perf_text,
+            font=('Courier', 9),
+            justify=tk.LEFT
+        ).pack(fill=tk.X)
+        
+        # 아래쪽 차트 영역 (월 예상 비용 추이, 선택한 서버/그룹 또는 플릿 평균 CPU 추이)
+        self.chart_frame = ttk.LabelFrame(self.main_frame, text="사용량 추이", padding=10)
+        self.chart_frame.grid(row=2, column=0, columnspan=2, padx=5, pady=5, sticky="nsew")
+        self.cost_chart = LineChart(self.chart_frame, "월 예상 비용 ($)",
+                                    value_format="${:,.0f}", color='#e74c3c')
+        self.cost_chart.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 5))
+        self.cpu_chart = LineChart(self.chart_frame, "CPU 사용률 (%)", color='#2ecc71')
+        self.cpu_chart.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(5, 0))
+        self.tree.bind('<<TreeviewSelect>>', self.on_server_select, add='+')
+        
+        # 그리드 가중치 설정
+        self.main_frame.columnconfigure(0, weight=2)
+        self.main_frame.columnconfigure(1, weight=1)
+        self.main_frame.rowconfigure(1, weight=1)
+        
+        # 스타일 설정
+        self.setup_styles()
+        
+        # 초기 서버 상태 업데이트
+        self.update_server_display()
+    
+    def setup_server_tree(self):
+        """서버 상태 표시를 위한 Treeview를 만듭니다."""
+        self.tree = ttk.Treeview(
+            self.left_frame, 
+            columns=('name', 'cpu', 'cost', 'status', 'last_updated'),
+            show='headings',
+            height=5
+        )
+        
+        # 컬럼 설정
+        self.tree.heading('name', text='서버명')
+        self.tree.heading('cpu', text='CPU 사용률 (%)')
+        self.tree.heading('cost', text='시간당 비용 ($)')
+        self.tree.heading('status', text='상태')
+        self.tree.heading('last_updated', text='마지막 업데이트')
+        
+        # 컬럼 너비 설정
+        self.tree.column('name', width=100)
+        self.tree.column('cpu', width=100, anchor=tk.CENTER)
+        self.tree.column('cost', width=100, anchor=tk.CENTER)
+        self.tree.column('status', width=100, anchor=tk.CENTER)
+        self.tree.column('last_updated', width=150, anchor=tk.CENTER)
+        
+        self.tree.pack(fill=tk.BOTH, expand=True)
+    
+    def setup_styles(self):
+        """위젯 스타일을 설정합니다."""
+        style = ttk.Style()
+        style.theme_use('clam')
+        
+        # 기본 스타일 설정
+        style.configure('.', 
+                      background='#2c3e50', 
+                      foreground='white',
+                      font=('Helvetica', 10))
+        
+        # 프레임 스타일
+        style.configure('TFrame', background='#2c3e50')
+        
+        # 라벨 스타일
+        style.configure('TLabel', 
+                      background='#2c3e50', 
+                      foreground='white')
+        
+        # 라벨프레임 스타일
+        style.configure('TLabelframe', 
+                      background='#2c3e50', 
+                      foreground='white')
+        style.configure('TLabelframe.Label', 
+                      background='#2c3e50', 
+                      foreground='white')
+        
+        # 버튼 스타일
+        style.configure('TButton', 
+                      background='#3498db', 
+                      foreground='white',
+                      font=('Helvetica', 10, 'bold'))
+        style.map('TButton',
+                background=[('active', '#2980b9')],
+                foreground=[('active', 'white')])
+        
+        # 버튼 스타일
+        style.configure('Accent.TButton', 
+                      font=('Helvetica', 11, 'bold'),
+                      background='#e74c3c',  # 빨간색
+                      foreground='white')
+        style.map('Accent.TButton',
+                background=[('active', '#c0392b')],
+                foreground=[('active', 'white')])
+                
+        style.configure('Success.TButton',
+                      font=('Helvetica', 11, 'bold'),
+                      background='#2ecc71',  # 초록색
+                      foreground='white')
+        style.map('Success.TButton',
+                background=[('active', '#27ae60')],
+                foreground=[('active', 'white')])
+        
+        # Treeview 스타일
+        style.configure('Treeview', 
+                      fieldbackground='#34495e',
+                      background='#34495e',
+                      foreground='white',
+                      rowheight=30,
+                      font=('Helvetica', 10))
+        style.configure('Treeview.Heading', 
+                      background='#2c3e50',
+                      foreground='white',
+                      font=('Helvetica', 10, 'bold'))
+        style.map('Treeview', 
+                background=[('selected', '#3498db')],
+                foreground=[('selected', 'white')])
+    
+    def update_server_status(self):
+        """서버 상태를 주기적으로 업데이트합니다."""
+        # 예정 시각보다 얼마나 늦게 실행됐는지 기록
+        if self._next_tick_due is not None:
+            self.perf.record_drift('tick_drift', self._next_tick_due, time.monotonic())
+        
+        with self.perf.timed('tick'):
+            self.engine.tick()
+        
+        # 5초마다 업데이트
+        interval_ms = int(self.engine.tick_seconds * 1000)
+        self._next_tick_due = time.monotonic() + interval_ms / 1000
+        self.root.after(interval_ms, self.update_server_status)
+        
+        if self.perf_frame.winfo_ismapped():
+            self.update_perf_panel()
+        if self.perf_dump_path and time.monotonic() >= self._next_perf_dump:
+            # 파일 쓰기는 UI 스레드에서 하므로 틱마다가 아니라 PERF_DUMP_INTERVAL마다
+            self._next_perf_dump = time.monotonic() + PERF_DUMP_INTERVAL
+            self.perf.dump(self.perf_dump_path)
+    
+    def on_engine_tick(self, engine):
+        """엔진이 한 틱을 진행할 때마다 호출됩니다."""
+        self.ui_queue.request_redraw()
+    
+    def update_server_display(self):
+        """서버 상태를 화면에 표시합니다."""
+        with self.perf.timed('redraw'):
+            with self.servers.lock:
+                # 값이 바뀐 행만 갱신 (선택 항목과 스크롤 위치 유지)
+                self.server_list.refresh()
+            
+            self.update_cost_display()
+        
+        with self.perf.timed('charts'):
+            self.update_charts()
+    
+    def update_charts(self):
+        """비용/CPU 추이 차트를 다시 그립니다. 점은 차트 너비만큼으로 다운샘플링됩니다."""
+        history = self.chart_history
+        self.cost_chart.plot(*history.cost.arrays())
+        title = f"CPU 사용률 (%) - {history.watched_label()}"
+        cpu = history.cpu if history.watched is None else history.watched_cpu
+        self.cpu_chart.plot(*cpu.arrays(), title=title)
+    
+    def on_server_select(self, event=None):
+        """목록에서 고른 서버나 그룹의 CPU 추이를 차트에 보여줍니다."""
+        selection = self.server_list.selection()
+        backfill = None
+        if selection is not None and selection[0] == 'server':
+            # 링 버퍼에 남은 최근 샘플로 차트를 미리 채움
+            samples = self.cpu_history.recent(selection[1])
+            ticks = np.arange(len(samples) - 1, -1, -1)
+            backfill = (self.engine.now - ticks * self.engine.tick_seconds, samples)
+        with self.servers.lock:
+            self.chart_history.watch(selection, backfill)
+        self.update_charts()
+    
+    def update_cost_display(self):
+        """비용 패널만 갱신합니다. 집계값을 읽으므로 서버 목록을 훑지 않습니다."""
+        # 월간 예상 비용 업데이트 (30일 기준)
+        self.cost_value.set(f"${self.servers.monthly_cost():,.2f}")
+    
+    def toggle_perf_panel(self):
+        """성능 패널을 보이거나 숨깁니다."""
+        if self.perf_frame.winfo_ismapped():
+            self.perf_frame.pack_forget()
+        else:
+            self.update_perf_panel()
+            self.perf_frame.pack(pady=5, fill=tk.X)
+    
+    def update_perf_panel(self):
+        """경로별 지연 시간 요약(ms)을 성능 패널에 표시합니다."""
+        lines = [f"{'경로':<12}{'횟수':>6}{'p50':>8}{'p95':>8}{'최대':>8}"]
+        for name, (count, p50, p95, maximum, _) in self.perf.summary().items():
+            lines.append(f"{name:<12}{count:>6}{p50 * 1000:>8.1f}{p95 * 1000:>8.1f}"
+                         f"{maximum * 1000:>8.1f}")
+        self.perf_text.set("\n".join(lines))
+    
+    def start_optimization(self):
+        """AI 비용 최적화를 시작합니다."""
+        # 버튼 비활성화
+        self.optimize_btn['state'] = 'disabled'
+        self.optimization_result.set("AI가 서버를 분석 중입니다...")
+        
+        # 별도 스레드에서 최적화 실행
+        threading.Thread(target=self.optimize_costs, daemon=True).start()
+    
+    def toggle_auto_optimize(self):
+        """자동 최적화를 켜거나 끕니다. 처음 켤 때 스케줄러를 만들어 엔진에 붙입니다."""
+        enabled = bool(self.auto_optimize.get())
+        if enabled and self.auto_optimizer is None:
+            self.auto_optimizer = AutoOptimizer(
+                self.servers, self.optimization_policy, apply=self.apply_auto_action,
+                pending=lambda: self.bulk.pending(self.servers, 'stop'))
+            self.auto_optimizer.attach(self.engine)
+        if self.auto_optimizer is not None:
+            self.auto_optimizer.enabled = enabled
+        self.optimization_result.set("자동 최적화를 켰습니다." if enabled
+                                     else "자동 최적화를 껐습니다.")
+    
+    def apply_auto_action(self, action, indices, now):
+        """스케줄러가 고른 서버를 일괄 작업 실행기로 시작/중지합니다.
+
+        엔진 스레드에서 fleet.lock을 잡은 채로 호출됩니다.
+        """
+        verb = "시작" if action == 'start' else "중지"
+        self.bulk.submit(self.servers, action, indices, on_done=lambda progress: self.ui_queue.post(
+            lambda: self.optimization_result.set(
+                f"자동 최적화: {progress.succeeded}개의 서버를 {verb}했습니다."),
+            key='optimization_result'))
+    
+    def start_all_servers(self):
+        """중지된 모든 서버를 일괄 작업으로 재시작합니다."""
+        with self.servers.lock:
+            stopped = np.flatnonzero(~self.servers.running)
+            extra_cost = float(self.servers.cost_per_hour[stopped].sum()) * HOURS_PER_MONTH
+        if not len(stopped):
+            self.optimization_result.set("재시작할 서버가 없습니다.")
+            return
+        if self.servers.events is not None:
+            self.servers.events.record_decision('manual', stopped, -extra_cost, action='start')
+        self.run_bulk_action('start', stopped, self.on_restart_done)
+    
+    def on_restart_done(self, progress):
+        return f"{progress.succeeded}개의 서버를 재시작했습니다."
+    
+    def optimize_costs(self):
+        """저사용 서버를 식별하고, 중지는 일괄 작업으로 넘깁니다."""
+        # 시뮬레이션을 위한 딜레이
+        time.sleep(2)
+        
+        # 조건을 지키는 범위에서 중지할 서버 전체를 한 번에 선택하고,
+        # 나머지 서버는 한 번의 패스로 다운사이징 후보를 찾음
+        # 아직 끝나지 않은 중지(자동 최적화 등)는 이미 중지된 것으로 보고 계획하며,
+        # 다음 계획이 이번 중지를 볼 수 있도록 잠금을 잡은 채로 제출함
+        with self.perf.timed('optimize'), self.servers.lock:
+            pending = np.asarray(self.bulk.pending(self.servers, 'stop'), dtype=np.int64)
+            plan = plan_stops(self.servers, self.optimization_policy, self.cpu_history,
+                              pending=pending)
+            self.rightsizing = recommend_rightsizing(
+                self.servers, self.cpu_history, self.instance_catalog,
+                min_samples=self.optimization_policy.min_samples,
+                exclude=np.concatenate([plan.indices, pending]))
+            if len(plan):
+                plan.record()
+                # UI 업데이트 (워커 스레드이므로 위젯은 직접 건드리지 않음)
+                self.ui_queue.post(lambda: self.show_bulk_started(len(plan)))
+                self.submit_bulk_action(
+                    'stop', plan.indices, lambda progress: self.on_optimize_done(plan, progress))
+        
+        if not len(plan):
+            message = "최적화가 필요 없는 서버 상태입니다." + self.rightsizing_summary()
+            self.ui_queue.post(lambda: self.optimization_result.set(message),
+                               key='optimization_result')
+            self.ui_queue.post(lambda: self.optimize_btn.configure(state='normal'),
+                               key='optimize_btn')
+    
+    def on_optimize_done(self, plan, progress):
+        # 실제로 중지된 서버만 절감액에 반영
+        with self.servers.lock:
+            stopped = plan.indices[~self.servers.running[plan.indices]]
+            total_savings = float(self.servers.cost_per_hour[stopped].sum()) * HOURS_PER_MONTH
+        message = f"성공적으로 {progress.succeeded}개의 서버를 중지했습니다.\n"
+        message += f"월간 예상 절감액: ${total_savings:,.2f}"
+        return message + self.rightsizing_summary()
+    
+    def rightsizing_summary(self):
+        advice = self.rightsizing
+        if advice is None or not len(advice):
+            return ""
+        name, current, suggested, _, _ = advice.rows(1)[0]
+        return (f"\n다운사이징 제안 {len(advice)}대 (예: {name} {current} → {suggested}), "
+                f"월 ${advice.monthly_savings:,.2f} 추가 절감 가능")
+    
+    def run_bulk_action(self, action, indices, describe):
+        """일괄 작업을 시작하고 진행률을 표시합니다. Tk 스레드에서 호출해야 합니다.
+        
+        describe(progress)는 완료 후 Tk 스레드에서 호출되어 결과 메시지를 반환합니다.
+        """
+        self.show_bulk_started(len(indices))
+        self.submit_bulk_action(action, indices, describe)
+    
+    def show_bulk_started(self, total):
+        self.optimize_btn.configure(state='disabled')
+        self.restart_btn.configure(state='disabled')
+        self.cancel_btn.configure(state='normal')
+        self.bulk_progressbar.configure(maximum=max(1, total), value=0)
+    
+    def submit_bulk_action(self, action, indices, describe):
+        """일괄 작업을 제출합니다. 진행 표시는 UI 큐로 넘기므로 어느 스레드에서나 호출할 수 있습니다."""
+        # 이전 작업에서 늦게 도착한 진행 알림은 무시
+        token = self._bulk_token = object()
+        self.bulk_job = self.bulk.submit(
+            self.servers, action, indices,
+            on_progress=lambda progress: self.ui_queue.post(
+                lambda: self.show_bulk_progress(token, progress), key='bulk_progress'),
+            on_done=lambda progress: self.ui_queue.post(
+                lambda: self.finish_bulk_action(token, progress, describe), key='bulk_done'))
+    
+    def show_bulk_progress(self, token, progress):
+        if token is not self._bulk_token:
+            return
+        verb = "시작" if progress.action == 'start' else "중지"
+        text = f"서버 {verb} 중... {progress.done}/{progress.total}"
+        if progress.failed:
+            text += f" (실패 {progress.failed})"
+        self.optimization_result.set(text)
+        self.bulk_progressbar.configure(value=progress.done)
+        self.update_cost_display()
+        self.ui_queue.request_redraw()
+    
+    def finish_bulk_action(self, token, progress, describe):
+        if token is not self._bulk_token:
+            return
+        self._bulk_token = None
+        self.bulk_job = None
+        message = describe(progress)
+        if progress.cancelled:
+            message += f"\n작업이 취소되어 {progress.skipped}개를 건너뛰었습니다."
+        if progress.failed:
+            name, error = progress.errors[-1]
+            message += f"\n{progress.failed}개 실패 (마지막 오류: {error})"
+        self.optimization_result.set(message)
+        self.bulk_progressbar.configure(value=progress.done)
+        self.optimize_btn.configure(state='normal')
+        self.restart_btn.configure(state='normal')
+        self.cancel_btn.configure(state='disabled')
+        self.update_cost_display()
+        self.ui_queue.request_redraw()
+    
+    def cancel_bulk_action(self):
+        """진행 중인 일괄 작업을 취소합니다. 호출 중인 API 요청은 끝까지 기다립니다."""
+        if self.bulk_job is not None:
+            self.bulk_job.cancel()
+            self.cancel_btn.configure(state='disabled')
+            self.optimization_result.set("작업을 취소하는 중입니다...")
+
+def run(engine, metrics_db_path=None, perf_dump_path=None, bulk_rate=None):
+    """대시보드 창을 띄우고 닫힐 때까지 실행합니다."""
+    root = tk.Tk()
+    
+    # 윈도우를 화면 중앙에 배치
+    window_width = 1000
+    window_height = 780
+    screen_width = root.winfo_screenwidth()
+    screen_height = root.winfo_screenheight()
+    x = (screen_width // 2) - (window_width // 2)
+    y = (screen_height // 2) - (window_height // 2)
+    root.geometry(f'{window_width}x{window_height}+{x}+{y}')
+    
+    # 애플리케이션 실행
+    bulk = BulkActionExecutor(rate_per_second=bulk_rate or BULK_RATE_PER_SECOND,
+                              max_workers=BULK_MAX_WORKERS)
+    app = FinOpsDashboard(root, engine=engine, perf_dump_path=perf_dump_path, bulk=bulk)
+    
+    # 틱별 사용량과 상태 전이를 SQLite에 기록
+    metrics_store = MetricsStore(metrics_db_path) if metrics_db_path else None
+    if metrics_store is not None:
+        metrics_store.attach(app.engine)
+    try:
+        root.mainloop()
+    finally:
+        app.engine.source.close()
+        # 남은 일괄 작업은 취소하고 워커 스레드를 정리
+        app.bulk.shutdown(cancel_jobs=[app.bulk_job] if app.bulk_job is not None else [])
+        # 다음 실행이 로그 꼬리 없이 바로 복원되도록 마지막 스냅샷을 씀
+        if app.servers.events is not None:
+            app.servers.events.close(app.servers)
+        # 기록 실패는 여기서 드러나므로 다른 정리를 모두 마친 뒤에 닫음
+        if metrics_store is not None:
+            metrics_store.close()
@@ -0,0 +1,57 @@
+import numpy as np
+
+
+class DirtySet:
+    """마지막 평가 이후 의미 있게 바뀐 서버를 모아 두는 집합입니다.
+
+    서버마다 마지막으로 평가했을 때의 CPU 값(reference)을 기억하고,
+    새 값이 그보다 threshold 이상 달라진 서버만 집합에 넣습니다.
+    시작/중지처럼 상태가 바뀐 서버는 값과 무관하게 넣습니다.
+    drain()은 그동안 들어온 서버만 돌려주므로 소비자의 비용은
+    플릿 크기가 아니라 변경 수에 비례합니다.
+    """
+
+    def __init__(self, size, threshold=1.0):
+        self.threshold = threshold
+        # 아직 평가하지 않은 서버는 NaN이라 첫 관측에서 반드시 들어감
+        self.reference = np.full(size, np.nan)
+        self._member = np.zeros(size, dtype=bool)
+        self._pending = []
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def observe(self, rows, values):
+        """rows 서버의 새 CPU 값 중 기준값에서 threshold 이상 벗어난 서버를 넣습니다.
+
+        rows에는 같은 서버가 두 번 나오지 않아야 합니다.
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        reference = self.reference[rows]
+        changed = ~(np.abs(np.asarray(values) - reference) < self.threshold)  # NaN도 포함
+        self._add(rows[changed], unique=True)
+
+    def mark(self, rows):
+        """값과 관계없이 rows 서버를 넣습니다."""
+        self._add(np.atleast_1d(np.asarray(rows, dtype=np.int64)))
+
+    def _add(self, rows, unique=False):
+        rows = rows[~self._member[rows]]
+        if len(rows):
+            if not unique:
+                rows = np.unique(rows)
+            self._member[rows] = True
+            self._pending.append(rows)
+            self._count += len(rows)
+
+    def drain(self, values):
+        """모인 서버의 인덱스를 반환하고, 그 서버의 기준값을 values로 갱신합니다."""
+        if not self._pending:
+            return np.empty(0, dtype=np.int64)
+        rows = np.concatenate(self._pending)
+        self._pending = []
+        self._count = 0
+        self._member[rows] = False
+        self.reference[rows] = values[rows]
+        return rows
@@ -0,0 +1,87 @@
+"""긴 시계열을 화면 픽셀 수 정도의 점으로 줄이는 다운샘플링 함수입니다.
+
+두 함수 모두 원본에서 고른 점의 인덱스(오름차순)를 반환하므로
+x, y 배열을 같은 인덱스로 잘라 쓰면 됩니다.
+"""
+import numpy as np
+
+
+def lttb(x, y, threshold):
+    """Largest-Triangle-Three-Buckets로 threshold개 점을 고릅니다.
+
+    첫 점과 마지막 점은 항상 남기고, 나머지 구간을 threshold - 2개 버킷으로 나눠
+    버킷마다 앞에서 고른 점과 다음 버킷 평균점이 이루는 삼각형 넓이가 가장 큰 점을 고릅니다.
+    버킷 평균은 누적 합으로 한 번에 계산하고, 버킷 순회는 threshold번만 돕니다.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    # 앞뒤 끝점을 뺀 [1, n-1) 구간의 버킷 경계
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.int64)
+    x = x - x[0]  # 누적 합의 정밀도 손실을 줄이기 위해 원점 이동
+    sum_x = np.r_[0.0, np.cumsum(x)]
+    sum_y = np.r_[0.0, np.cumsum(y)]
+    sizes = np.maximum(edges[1:] - edges[:-1], 1)
+    average_x = (sum_x[edges[1:]] - sum_x[edges[:-1]]) / sizes
+    average_y = (sum_y[edges[1:]] - sum_y[edges[:-1]]) / sizes
+
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+    anchor = 0
+    buckets = threshold - 2
+    for bucket in range(buckets):
+        start, end = edges[bucket], max(edges[bucket + 1], edges[bucket] + 1)
+        if bucket + 1 < buckets:
+            next_x, next_y = average_x[bucket + 1], average_y[bucket + 1]
+        else:
+            next_x, next_y = x[-1], y[-1]
+        ax, ay = x[anchor], y[anchor]
+        area = np.abs((ax - next_x) * (y[start:end] - ay) - (ax - x[start:end]) * (next_y - ay))
+        anchor = start + int(np.argmax(area))
+        selected[bucket + 1] = anchor
+    return selected
+
+
+def minmax(y, buckets):
+    """y를 buckets개 구간으로 나눠 구간마다 최솟값과 최댓값 점을 고릅니다.
+
+    반복문 없이 (구간, 구간 길이) 배열로 바꿔 argmin/argmax를 한 번에 구하므로
+    LTTB보다 빠르고, 짧은 스파이크를 놓치지 않습니다.
+    """
+    y = np.asarray(y, dtype=np.float64)
+    n = len(y)
+    if n <= 2 * buckets or buckets < 1:
+        return np.arange(n)
+    width = -(-n // buckets)
+    rows = -(-n // width)
+    padded = np.empty(rows * width)
+    padded[:n] = y
+    padded[n:] = y[-1]  # 남는 칸은 마지막 값으로 채워 마지막 점과 같게 취급
+    grid = padded.reshape(rows, width)
+    base = np.arange(rows) * width
+    picked = np.r_[0, base + grid.argmin(axis=1), base + grid.argmax(axis=1), n - 1]
+    return np.unique(np.minimum(picked, n - 1))
+
+
+# 점이 화면 점 수의 이 배수를 넘으면 LTTB 전에 최솟값/최댓값 구간으로 먼저 줄임
+PREPASS_FACTOR = 8
+
+
+def downsample(x, y, points, method='lttb'):
+    """화면에 그릴 points개 안팎의 점 인덱스를 고릅니다.
+
+    method='lttb'이면 아주 긴 시계열은 minmax로 points * PREPASS_FACTOR / 2 구간까지
+    먼저 줄인 뒤 LTTB를 적용해, 수백만 개 샘플도 수 ms 안에 처리합니다.
+    """
+    if method == 'minmax':
+        return minmax(y, points // 2)
+    if method != 'lttb':
+        raise ValueError(f"알 수 없는 다운샘플링 방식입니다: {method}")
+    if len(y) <= points * PREPASS_FACTOR:
+        return lttb(x, y, points)
+    candidates = minmax(y, points * PREPASS_FACTOR // 2)
+    return candidates[lttb(np.asarray(x)[candidates], np.asarray(y)[candidates], points)]
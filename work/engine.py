@@ -0,0 +1,64 @@
+import time
+
+from collector import SimulatedSource
+
+DEFAULT_TICK_SECONDS = 5.0
+
+
+class SimulationEngine:
+    """Tk와 분리된 헤드리스 시뮬레이션 엔진입니다.
+
+    tick()을 호출할 때마다 시뮬레이션 시계를 tick_seconds만큼 진행하고
+    플릿 사용량을 갱신한 뒤 구독자에게 알립니다. realtime=False이면
+    시계가 벽시계와 무관하게 진행되므로 run()으로 한 달치 틱도
+    기다림 없이 돌릴 수 있습니다.
+
+    사용량은 source(MetricsSource)가 공급하며, 기본값은 random 분포의
+    SimulatedSource입니다.
+    """
+
+    def __init__(self, fleet, tick_seconds=DEFAULT_TICK_SECONDS, start_time=None, realtime=False,
+                 source=None):
+        self.fleet = fleet
+        self.source = source if source is not None else SimulatedSource()
+        self.tick_seconds = tick_seconds
+        self.realtime = realtime
+        self.now = time.time() if start_time is None else start_time
+        self.tick_count = 0
+        self._subscribers = []
+
+    def subscribe(self, callback):
+        """틱마다 callback(engine)을 호출하도록 등록하고, 해제 함수를 반환합니다."""
+        self._subscribers.append(callback)
+        return lambda: self.unsubscribe(callback)
+
+    def unsubscribe(self, callback):
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+
+    def advance_clock(self):
+        """시뮬레이션 시계를 한 틱만큼 진행합니다."""
+        if self.realtime:
+            self.now = time.time()
+        else:
+            self.now += self.tick_seconds
+        self.tick_count += 1
+        return self.now
+
+    def tick(self):
+        """한 틱을 진행하고 구독자에게 알립니다."""
+        now = self.advance_clock()
+        with self.fleet.lock:
+            self.source.update(self.fleet, now)
+        for callback in list(self._subscribers):
+            callback(self)
+
+    def run(self, ticks):
+        """ticks번의 틱을 쉬지 않고 진행합니다."""
+        for _ in range(ticks):
+            self.tick()
+        return self
+
+    def run_for(self, seconds):
+        """시뮬레이션 시간으로 seconds초만큼 진행합니다."""
+        return self.run(int(seconds // self.tick_seconds))
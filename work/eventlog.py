@@ -0,0 +1,312 @@
+"""플릿 상태 전이와 최적화 결정을 남기는 추가 전용(append-only) 바이너리 이벤트 로그입니다.
+
+파일은 8바이트 헤더 뒤에 22바이트 고정 길이 레코드가 이어지는 형식이라
+numpy 구조화 배열로 한 번에 읽을 수 있습니다. 주기적으로 플릿 전체를
+스냅샷(.npz)으로 저장하면서 그 시점의 로그 오프셋을 함께 적어 두므로,
+다시 시작할 때는 최신 스냅샷을 읽고 그 뒤의 꼬리만 재생합니다.
+로그 자체는 지우지 않으므로 모든 중지/시작과 결정의 감사 기록으로 남습니다.
+
+레코드 종류 (server, value의 의미):
+    START     시작된 서버, 시작 시 CPU 사용률
+    STOP      중지된 서버, 그 서버의 시간당 비용
+    DECISION  중지 결정에 포함된 서버 수, 월간 예상 절감액
+    RESTART   다시 시작하는 결정에 포함된 서버 수, 월간 추가 비용(음수)
+    TARGET    바로 앞 DECISION 또는 RESTART에 포함된 서버 하나
+"""
+import os
+import threading
+import time
+
+import numpy as np
+
+MAGIC = b'FOEL'
+VERSION = 1
+HEADER_SIZE = 8
+
+RECORD = np.dtype([
+    ('kind', 'u1'),
+    ('source', 'u1'),
+    ('server', '<u4'),
+    ('ts', '<f8'),
+    ('value', '<f8'),
+])
+
+START, STOP, DECISION, TARGET, RESTART = range(1, 6)
+KINDS = {START: 'start', STOP: 'stop', DECISION: 'decision', TARGET: 'target',
+         RESTART: 'restart'}
+# 레코드 하나로 결정을 여는 종류 (뒤에 TARGET이 이어짐)
+DECISION_KINDS = (DECISION, RESTART)
+# 결정을 내린 주체
+SOURCES = ('manual', 'optimize', 'auto')
+
+# 이만큼 이벤트가 쌓이면 다음 틱에 스냅샷을 새로 씀
+SNAPSHOT_EVERY = 50000
+SNAPSHOT_SUFFIX = '.snapshot.npz'
+
+STAT_KEYS = ('starts', 'stops', 'decisions', 'targets', 'decided_monthly_savings')
+
+
+class StateMismatchError(ValueError):
+    """저장된 상태의 플릿이 요청한 플릿과 다를 때 발생합니다."""
+
+
+def _header():
+    return MAGIC + np.array([VERSION, RECORD.itemsize], dtype='<u2').tobytes()
+
+
+def read_records(path, offset=HEADER_SIZE):
+    """로그 파일의 offset 이후 레코드를 구조화 배열로 읽습니다. 잘린 마지막 레코드는 무시합니다."""
+    with open(path, 'rb') as log_file:
+        header = log_file.read(HEADER_SIZE)
+        if header != _header():
+            raise ValueError(f"이벤트 로그 형식이 아닙니다: {path}")
+        log_file.seek(offset)
+        data = log_file.read()
+    usable = len(data) - len(data) % RECORD.itemsize
+    return np.frombuffer(data[:usable], dtype=RECORD)
+
+
+def summarize(records, stats=None):
+    """레코드 배열을 stats(dict)에 누적합니다."""
+    stats = dict.fromkeys(STAT_KEYS, 0) if stats is None else stats
+    kinds = records['kind']
+    stats['starts'] += int(np.count_nonzero(kinds == START))
+    stats['stops'] += int(np.count_nonzero(kinds == STOP))
+    stats['targets'] += int(np.count_nonzero(kinds == TARGET))
+    decisions = np.isin(kinds, DECISION_KINDS)
+    stats['decisions'] += int(np.count_nonzero(decisions))
+    stats['decided_monthly_savings'] += float(records['value'][decisions].sum())
+    return stats
+
+
+class EventLog:
+    """플릿 하나의 이벤트 로그와 스냅샷을 관리합니다.
+
+    record_*()는 어느 스레드에서나 호출할 수 있고, 파일 쓰기는 내부 버퍼를 거칩니다.
+    attach(engine)으로 붙이면 틱마다 버퍼를 비우고, SNAPSHOT_EVERY개가 쌓일 때마다
+    백그라운드 스레드에서 스냅샷을 씁니다. 따라서 복원 시 재생할 꼬리는 대략
+    스냅샷 주기만큼으로 제한됩니다.
+    """
+
+    def __init__(self, path, snapshot_every=SNAPSHOT_EVERY, spec=None):
+        self.path = path
+        # 플릿을 만든 옵션 (문자열), 스냅샷에 함께 저장해 다시 열 때 비교
+        self.spec = spec
+        self.snapshot_path = path + SNAPSHOT_SUFFIX
+        self.snapshot_every = snapshot_every
+        self.stats = dict.fromkeys(STAT_KEYS, 0)
+        self._lock = threading.Lock()
+        self._since_snapshot = 0
+        self.restored_tail = 0  # 마지막 restore()에서 재생한 레코드 수
+        self.restored_spec = None
+        self._writer = None
+
+        if not os.path.exists(path) or os.path.getsize(path) == 0:
+            with open(path, 'wb') as log_file:
+                log_file.write(_header())
+        self._file = open(path, 'r+b')
+        if self._file.read(HEADER_SIZE) != _header():
+            self._file.close()
+            raise ValueError(f"이벤트 로그 형식이 아닙니다: {path}")
+        # 쓰다가 끊긴 마지막 레코드는 잘라냄
+        size = os.path.getsize(path)
+        self._file.truncate(size - (size - HEADER_SIZE) % RECORD.itemsize)
+        self._file.seek(0, os.SEEK_END)
+
+    @classmethod
+    def open(cls, path, new_fleet, snapshot_every=SNAPSHOT_EVERY, spec=None):
+        """path의 상태를 복원하거나, 없으면 new_fleet()으로 만든 플릿으로 기록을 시작합니다.
+
+        (EventLog, Fleet)을 반환하며, 플릿에는 이 로그가 붙어 있습니다.
+        저장된 spec이 주어진 spec과 다르면 기존 기록을 덮어쓰지 않도록 StateMismatchError를
+        던집니다. 어느 한쪽에 spec이 없을 때만 new_fleet()을 만들어 서버 이름을 비교합니다.
+        """
+        log = cls(path, snapshot_every, spec)
+        if os.path.exists(log.snapshot_path):
+            try:
+                fleet = log.restore()
+                log._check_matches(fleet, new_fleet, spec)
+            except Exception:
+                log.close()
+                raise
+        else:
+            fleet = new_fleet()
+            # 첫 스냅샷이 있어야 로그만으로 플릿 구성을 되살릴 수 있음
+            log.snapshot(fleet)
+        fleet.events = log
+        return log, fleet
+
+    def _check_matches(self, fleet, new_fleet, spec):
+        if spec is not None and self.restored_spec is not None:
+            # spec이 플릿 구성을 정하므로 같으면 플릿을 새로 만들어 비교할 필요가 없음
+            if spec == self.restored_spec:
+                return
+            raise StateMismatchError(
+                f"상태 로그 {self.path}는 다른 옵션으로 만든 플릿입니다 "
+                f"(저장: {self.restored_spec}, 요청: {spec}). "
+                f"다른 --state 경로를 쓰거나 기존 로그를 지우세요.")
+        requested = new_fleet()
+        if len(fleet) != len(requested) or not np.array_equal(fleet.names, requested.names):
+            raise StateMismatchError(
+                f"상태 로그 {self.path}의 서버 {len(fleet)}대가 요청한 플릿"
+                f"({len(requested)}대)과 다릅니다. 다른 --state 경로를 쓰거나 기존 로그를 지우세요.")
+
+    def _append(self, records):
+        with self._lock:
+            self._file.write(records.tobytes())
+            self._since_snapshot += len(records)
+            summarize(records, self.stats)
+
+    def record_transitions(self, servers, running, now, values):
+        """서버 시작(running=True) 또는 중지를 기록합니다."""
+        servers = np.atleast_1d(servers)
+        records = np.zeros(len(servers), dtype=RECORD)
+        records['kind'] = START if running else STOP
+        records['server'] = servers
+        records['ts'] = now
+        records['value'] = values
+        self._append(records)
+
+    def record_decision(self, source, servers, monthly_savings, now=None, action='stop'):
+        """최적화 결정과 그 대상 서버들을 기록합니다.
+
+        source는 SOURCES 중 하나이고, action은 'stop'(중지) 또는 'start'(다시 시작)입니다.
+        """
+        if action not in ('stop', 'start'):
+            raise ValueError(f"알 수 없는 결정입니다: {action}")
+        servers = np.atleast_1d(servers)
+        records = np.zeros(len(servers) + 1, dtype=RECORD)
+        records['source'] = SOURCES.index(source)
+        records['ts'] = time.time() if now is None else now
+        records['kind'][0] = DECISION if action == 'stop' else RESTART
+        records['server'][0] = len(servers)
+        records['value'][0] = monthly_savings
+        records['kind'][1:] = TARGET
+        records['server'][1:] = servers
+        self._append(records)
+
+    def flush(self):
+        with self._lock:
+            self._file.flush()
+
+    def snapshot(self, fleet, background=False):
+        """플릿 전체와 현재 로그 오프셋을 스냅샷으로 저장합니다.
+
+        잠금은 배열을 복사하는 동안만 잡습니다. background=True이면 파일 쓰기를
+        별도 스레드에서 하고, 이전 스냅샷을 아직 쓰는 중이면 이번 것은 건너뜁니다.
+        """
+        if background and self._writer is not None and self._writer.is_alive():
+            return False
+        with fleet.lock, self._lock:
+            self._file.flush()
+            arrays = fleet.state_arrays()
+            arrays['log_offset'] = np.array(self._file.tell())
+            if self.spec is not None:
+                arrays['spec'] = np.array(self.spec)
+            arrays.update(('stat_' + key, np.array(value)) for key, value in self.stats.items())
+            self._since_snapshot = 0
+        if background:
+            self._writer = threading.Thread(target=self._write_snapshot, args=(arrays,),
+                                            name='eventlog-snapshot', daemon=True)
+            self._writer.start()
+        else:
+            if self._writer is not None:
+                self._writer.join()
+            self._write_snapshot(arrays)
+        return True
+
+    def _write_snapshot(self, arrays):
+        # 쓰는 도중 끊겨도 이전 스냅샷이 남도록 임시 파일에 쓴 뒤 교체
+        temporary = self.snapshot_path + '.tmp.npz'
+        np.savez(temporary, **arrays)
+        os.replace(temporary, self.snapshot_path)
+
+    def restore(self):
+        """최신 스냅샷을 읽고 그 뒤의 로그를 재생한 플릿을 반환합니다."""
+        from fleet import Fleet
+
+        with np.load(self.snapshot_path, allow_pickle=False) as arrays:
+            fleet = Fleet.from_state_arrays(arrays)
+            offset = int(arrays['log_offset'])
+            self.restored_spec = str(arrays['spec']) if 'spec' in arrays.files else None
+            self.stats = {key: arrays['stat_' + key].item() for key in STAT_KEYS}
+        tail = read_records(self.path, offset)
+        summarize(tail, self.stats)
+
+        transitions = tail[(tail['kind'] == START) | (tail['kind'] == STOP)]
+        if len(transitions):
+            # 서버마다 마지막 전이만 적용
+            reversed_servers = transitions['server'][::-1].astype(np.int64)
+            servers, first = np.unique(reversed_servers, return_index=True)
+            last = transitions[::-1][first]
+            started = last['kind'] == START
+            fleet.running[servers] = started
+            fleet.cpu_usage[servers] = np.where(started, last['value'], 0.0)
+            fleet.last_updated[servers] = last['ts']
+            fleet.recompute_aggregates()
+        self.restored_tail = len(tail)
+        return fleet
+
+    def attach(self, engine):
+        """틱마다 버퍼를 비우고, 필요하면 스냅샷을 쓰도록 구독합니다."""
+        return engine.subscribe(lambda e: self.on_tick(e.fleet))
+
+    def on_tick(self, fleet):
+        if not (self._since_snapshot >= self.snapshot_every
+                and self.snapshot(fleet, background=True)):
+            self.flush()
+
+    def close(self, fleet=None):
+        """fleet을 주면 마지막 스냅샷을 쓰고 파일을 닫습니다."""
+        if fleet is not None:
+            self.snapshot(fleet)
+        elif self._writer is not None:
+            self._writer.join()
+        with self._lock:
+            self._file.close()
+
+    def audit(self, server=None, limit=None):
+        """중지 기록을 오래된 순으로 반환합니다.
+
+        각 항목은 (시각, 서버 인덱스, 시간당 비용, 결정 주체, 결정 시각)입니다.
+        그 서버의 이전 중지 이후 그 서버를 중지하기로 한 결정이 없으면
+        (직접 중지한 경우) 주체와 결정 시각은 None입니다. 다시 시작하는 결정은
+        중지의 근거로 보지 않습니다.
+        """
+        self.flush()
+        records = read_records(self.path)
+        kinds = records['kind']
+        opens = np.isin(kinds, DECISION_KINDS)
+        decision_ids = np.cumsum(opens) - 1
+        decision_rows = np.flatnonzero(opens)
+        stop_decisions = kinds[decision_rows] == DECISION
+
+        targets = np.flatnonzero(kinds == TARGET)
+        targets = targets[stop_decisions[decision_ids[targets]]]
+        rows = np.union1d(np.flatnonzero(kinds == STOP), targets)
+        if server is not None:
+            rows = rows[records['server'][rows] == server]
+        # 서버별로 시간순 정렬한 뒤, 각 STOP 앞의 마지막 TARGET과 마지막 STOP을 앞으로 채워 찾음
+        rows = rows[np.lexsort((rows, records['server'][rows]))]
+        servers = records['server'][rows]
+        is_target = records['kind'][rows] == TARGET
+        index = np.arange(len(rows))
+        positions = np.maximum.accumulate(np.where(is_target, index, -1))
+        previous_stop = np.r_[-1, np.maximum.accumulate(np.where(is_target, -1, index))[:-1]]
+        valid = (positions >= 0) & (positions > previous_stop)
+        valid[valid] = servers[positions[valid]] == servers[valid]
+
+        stops = np.flatnonzero(~is_target)
+        stops = stops[np.argsort(rows[stops], kind='stable')]
+        if limit is not None:
+            stops = stops[-limit:]
+        entries = []
+        for position in stops:
+            record = records[rows[position]]
+            source = decided_at = None
+            if valid[position]:
+                decision = records[decision_rows[decision_ids[rows[positions[position]]]]]
+                source, decided_at = SOURCES[decision['source']], float(decision['ts'])
+            entries.append((float(record['ts']), int(record['server']), float(record['value']),
+                            source, decided_at))
+        return entries
@@ -0,0 +1,351 @@
+import json
+import threading
+import time
+
+import numpy as np
+
+from dirty_set import DirtySet
+from hierarchy import GroupHierarchy
+from server import TIME_FORMAT, format_timestamp  # noqa: F401 (기존 `from fleet import` 호환)
+from workload import CLASSIC, IDLE, WorkloadModel
+
+HOURS_PER_MONTH = 24 * 30
+
+
+class ServerView:
+    """Fleet의 한 행을 Server와 같은 인터페이스로 보여주는 뷰입니다."""
+
+    __slots__ = ('fleet', 'index')
+
+    def __init__(self, fleet, index):
+        self.fleet = fleet
+        self.index = index
+
+    @property
+    def name(self):
+        return str(self.fleet.names[self.index])
+
+    @property
+    def cpu_usage(self):
+        return float(self.fleet.cpu_usage[self.index])
+
+    @cpu_usage.setter
+    def cpu_usage(self, value):
+        self.fleet.cpu_usage[self.index] = value
+
+    @property
+    def cost_per_hour(self):
+        return float(self.fleet.cost_per_hour[self.index])
+
+    @property
+    def running(self):
+        return bool(self.fleet.running[self.index])
+
+    @property
+    def last_updated(self):
+        return format_timestamp(self.fleet.last_updated[self.index])
+
+    def update_usage(self):
+        """서버 사용량을 업데이트합니다."""
+        self.fleet.update_usage(np.array([self.index]))
+
+    def stop_server(self):
+        """서버를 중지합니다."""
+        return self.fleet.stop(self.index)
+
+    def start_server(self):
+        """서버를 시작합니다."""
+        return self.fleet.start(self.index)
+
+    def __repr__(self):
+        return f"ServerView({self.name!r}, cpu={self.cpu_usage:.1f}, running={self.running})"
+
+
+class Fleet:
+    """서버 속성을 병렬 배열로 보관하는 열(column) 기반 저장소입니다.
+
+    한 번의 벡터 연산으로 전체 서버의 사용량을 갱신하고,
+    개별 서버는 ServerView로 기존 Server처럼 다룰 수 있습니다.
+    여러 스레드가 접근할 때는 lock을 잡고 읽고 써야 합니다.
+
+    실행 중인 서버 수와 시간당 비용 합계(전체, 그룹별)는 시작/중지 때마다
+    증분으로 갱신되므로 비용 패널은 서버 목록을 훑지 않고 읽을 수 있습니다.
+    running 배열을 직접 바꾼 경우에는 recompute_aggregates()를 호출해야 합니다.
+    attach_hierarchy()로 태그 계층을 붙이면 그룹별 집계도 같은 방식으로 유지됩니다.
+    track_changes()를 호출하면 사용량이 크게 바뀌거나 상태가 바뀐 서버를 DirtySet에 모읍니다.
+    events에 EventLog를 붙이면 모든 시작/중지가 이벤트 로그에 기록됩니다.
+    anomalies에 AnomalyDetector를 붙이면 이상 상태인 서버가 목록에 표시되고 중지 대상에서 빠집니다.
+    """
+
+    def __init__(self, names, cpu_usage, cost_per_hour, rng=None, capacity=None, groups=None,
+                 workload=None):
+        self.names = np.asarray(names, dtype=str)
+        self.cpu_usage = np.asarray(cpu_usage, dtype=np.float64).copy()
+        self.cost_per_hour = np.asarray(cost_per_hour, dtype=np.float64).copy()
+        if not (len(self.names) == len(self.cpu_usage) == len(self.cost_per_hour)):
+            raise ValueError("names, cpu_usage, cost_per_hour의 길이가 같아야 합니다.")
+        # 서버별 처리 용량 (기본 1 단위)과 소속 그룹 (기본 'default')
+        self.capacity = (np.ones(len(self.names)) if capacity is None
+                         else np.asarray(capacity, dtype=np.float64).copy())
+        self.groups = (np.full(len(self.names), 'default') if groups is None
+                       else np.asarray(groups, dtype=str))
+        if not (len(self.capacity) == len(self.groups) == len(self.names)):
+            raise ValueError("capacity, groups의 길이가 서버 수와 같아야 합니다.")
+        self.running = np.ones(len(self.names), dtype=bool)
+        self.last_updated = np.full(len(self.names), time.time())
+        self.rng = rng if rng is not None else np.random.default_rng()
+        # 서버별 워크로드 프로파일 (기본은 기존 두 구간 분포)
+        self.workload = (WorkloadModel.classic(len(self.names), self.rng) if workload is None
+                         else workload)
+        if len(self.workload) != len(self.names):
+            raise ValueError("workload의 길이가 서버 수와 같아야 합니다.")
+        self.lock = threading.RLock()
+        self.group_names, self.group_codes = np.unique(self.groups, return_inverse=True)
+        self.group_codes = self.group_codes.ravel()
+        self.hierarchy = None
+        self.dirty = None
+        self.events = None
+        self.anomalies = None
+        self.recompute_aggregates()
+
+    @classmethod
+    def random(cls, size, low_usage_count=2, rng=None, seed=None, profiles=None):
+        """대시보드 기본값과 같은 분포로 임의의 플릿을 만듭니다.
+
+        seed를 주면 같은 시드끼리 같은 플릿과 사용량 기록이 나옵니다.
+        profiles는 {프로파일: 비율}이며, 없으면 저사용 서버는 idle, 나머지는 classic입니다.
+        classic 서버는 5분 구간 p95가 25~30%라 기본 임계값(10%)으로는 중지되지 않으므로,
+        저사용 서버가 계속 저사용으로 남아야 최적화가 중지할 대상이 생깁니다.
+        """
+        rng = rng if rng is not None else np.random.default_rng(seed)
+        names = [f"Server-{i+1}" for i in range(size)]
+        # 처음 low_usage_count개는 저사용 서버 (1-5%), 나머지는 5-15%
+        cpu_usage = rng.uniform(5, 15, size)
+        low = min(low_usage_count, size)
+        cpu_usage[:low] = rng.uniform(1, 5, low)
+        cost_per_hour = rng.uniform(5, 15, size)  # 시간당 $5~15 비용
+        if profiles is None:
+            codes = np.full(size, CLASSIC, dtype=np.int8)
+            codes[:low] = IDLE
+            workload = WorkloadModel(codes, rng)
+        else:
+            workload = WorkloadModel.mixed(size, profiles, rng)
+        return cls(names, cpu_usage, cost_per_hour, rng=rng, workload=workload)
+
+    @classmethod
+    def from_state_arrays(cls, arrays):
+        """state_arrays()로 저장한 배열에서 같은 상태의 플릿을 만듭니다."""
+        rng = np.random.default_rng()
+        rng.bit_generator.state = json.loads(str(arrays['rng_state']))
+        workload = WorkloadModel.from_state_arrays(
+            {name: arrays['workload_' + name] for name in WorkloadModel.STATE_FIELDS})
+        fleet = cls(arrays['names'], arrays['cpu_usage'], arrays['cost_per_hour'], rng=rng,
+                    capacity=arrays['capacity'], groups=arrays['groups'], workload=workload)
+        fleet.running[:] = arrays['running']
+        fleet.last_updated[:] = arrays['last_updated']
+        fleet.recompute_aggregates()
+        return fleet
+
+    @classmethod
+    def from_servers(cls, servers, rng=None):
+        """Server 객체 목록으로부터 플릿을 만듭니다."""
+        fleet = cls([s.name for s in servers],
+                    [s.cpu_usage for s in servers],
+                    [s.cost_per_hour for s in servers],
+                    rng=rng)
+        fleet.running[:] = [s.running for s in servers]
+        fleet.last_updated[:] = [s.updated_at for s in servers]
+        fleet.recompute_aggregates()
+        return fleet
+
+    def __len__(self):
+        return len(self.names)
+
+    def __getitem__(self, index):
+        if not -len(self) <= index < len(self):
+            raise IndexError("서버 인덱스가 범위를 벗어났습니다.")
+        return ServerView(self, index % len(self))
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield ServerView(self, index)
+
+    def update_usage(self, indices=None, now=None):
+        """실행 중인 서버의 CPU 사용률을 워크로드 프로파일에 따라 한 번에 갱신합니다.
+
+        now를 주면 그 시각(epoch 초)을 갱신 시각과 하루 주기 계산에 씁니다.
+        """
+        if indices is None:
+            mask = self.running.copy()
+        else:
+            mask = np.zeros(len(self), dtype=bool)
+            mask[indices] = True
+            mask &= self.running
+        now = time.time() if now is None else now
+        rows = np.flatnonzero(mask)
+        values = self.workload.sample(self.rng, rows, self.cpu_usage, now)
+        if self.hierarchy is not None:
+            self.hierarchy.usage_changed(rows, values - self.cpu_usage[rows])
+        if self.dirty is not None:
+            self.dirty.observe(rows, values)
+        self.cpu_usage[rows] = values
+        self.last_updated[rows] = now
+
+    def apply_samples(self, indices, values, now=None):
+        """외부에서 수집한 CPU 값을 반영합니다. 중지된 서버의 값은 무시합니다."""
+        indices = np.asarray(indices, dtype=np.int64)
+        values = np.asarray(values, dtype=np.float64)
+        live = self.running[indices]
+        indices = indices[live]
+        if self.hierarchy is not None or self.dirty is not None:
+            # 같은 서버가 여러 번 오면 마지막 값이 남으므로 서버별 변화분은 전후 차이로 계산
+            touched = np.unique(indices)
+            before = self.cpu_usage[touched]
+        self.cpu_usage[indices] = np.clip(values[live], 0, 100)
+        if self.hierarchy is not None:
+            self.hierarchy.usage_changed(touched, self.cpu_usage[touched] - before)
+        if self.dirty is not None:
+            self.dirty.observe(touched, self.cpu_usage[touched])
+        self.last_updated[indices] = time.time() if now is None else now
+        return indices
+
+    def stop(self, index, now=None):
+        """서버 하나를 중지합니다. 실행 중이었으면 True를 반환합니다."""
+        if not self.running[index]:
+            return False
+        if self.hierarchy is not None:
+            self.hierarchy.usage_changed(index, -self.cpu_usage[index])
+            self.hierarchy.running_changed(index, -1)
+        now = time.time() if now is None else now
+        self.running[index] = False
+        self.cpu_usage[index] = 0
+        self.last_updated[index] = now
+        cost = self.cost_per_hour[index]
+        self._running_count -= 1
+        self._hourly_cost -= cost
+        self.group_hourly_cost[self.group_codes[index]] -= cost
+        if self.dirty is not None:
+            self.dirty.mark(index)
+        if self.events is not None:
+            self.events.record_transitions(index, False, now, self.cost_per_hour[index])
+        return True
+
+    def start(self, index, now=None):
+        """서버 하나를 시작합니다. 중지 상태였으면 True를 반환합니다."""
+        if self.running[index]:
+            return False
+        now = time.time() if now is None else now
+        self.running[index] = True
+        self.cpu_usage[index] = self.rng.uniform(1, 10)  # 시작 시 저부하 상태로 시작
+        self.last_updated[index] = now
+        cost = self.cost_per_hour[index]
+        self._running_count += 1
+        self._hourly_cost += cost
+        self.group_hourly_cost[self.group_codes[index]] += cost
+        if self.hierarchy is not None:
+            self.hierarchy.running_changed(index, +1)
+            self.hierarchy.usage_changed(index, self.cpu_usage[index])
+        if self.dirty is not None:
+            self.dirty.mark(index)
+        if self.events is not None:
+            self.events.record_transitions(index, True, now, self.cpu_usage[index])
+        return True
+
+    def stop_many(self, indices, now=None):
+        """여러 서버를 한 번에 중지하고, 실제로 중지한 서버의 인덱스를 반환합니다."""
+        indices = np.unique(np.asarray(indices, dtype=np.int64))
+        stopped = indices[self.running[indices]]
+        if self.hierarchy is not None:
+            self.hierarchy.usage_changed(stopped, -self.cpu_usage[stopped])
+        now = time.time() if now is None else now
+        self.running[stopped] = False
+        self.cpu_usage[stopped] = 0
+        self.last_updated[stopped] = now
+        self._apply_running_change(stopped, -1)
+        if self.events is not None:
+            self.events.record_transitions(stopped, False, now, self.cost_per_hour[stopped])
+        return stopped
+
+    def start_all(self, now=None):
+        """중지된 모든 서버를 시작하고, 시작한 서버의 인덱스를 반환합니다."""
+        stopped = np.flatnonzero(~self.running)
+        now = time.time() if now is None else now
+        self.running[stopped] = True
+        self.cpu_usage[stopped] = self.rng.uniform(1, 10, len(stopped))
+        self.last_updated[stopped] = now
+        self._apply_running_change(stopped, +1)
+        if self.hierarchy is not None:
+            self.hierarchy.usage_changed(stopped, self.cpu_usage[stopped])
+        if self.events is not None:
+            self.events.record_transitions(stopped, True, now, self.cpu_usage[stopped])
+        return stopped
+
+    def _apply_running_change(self, indices, sign):
+        """indices 서버가 시작(+1) 또는 중지(-1)된 만큼 집계를 갱신합니다."""
+        costs = self.cost_per_hour[indices]
+        self._running_count += sign * len(indices)
+        self._hourly_cost += sign * float(costs.sum())
+        np.add.at(self.group_hourly_cost, self.group_codes[indices], sign * costs)
+        if self.hierarchy is not None:
+            self.hierarchy.running_changed(indices, sign)
+        if self.dirty is not None:
+            self.dirty.mark(indices)
+
+    def recompute_aggregates(self):
+        """실행 상태 배열로부터 비용 집계를 처음부터 다시 계산합니다."""
+        running_costs = np.where(self.running, self.cost_per_hour, 0.0)
+        self._running_count = int(np.count_nonzero(self.running))
+        self._hourly_cost = float(running_costs.sum())
+        self.group_hourly_cost = np.bincount(self.group_codes, weights=running_costs,
+                                             minlength=len(self.group_names))
+        if self.hierarchy is not None:
+            self.hierarchy.recompute()
+
+    def attach_hierarchy(self, tags, levels=None):
+        """{단계: 서버별 태그} 계층을 붙이고 그룹별 집계를 유지하기 시작합니다.
+
+        levels를 주지 않으면 tags의 키 순서를 위에서 아래 단계로 씁니다.
+        """
+        self.hierarchy = GroupHierarchy(self, tags, levels)
+        return self.hierarchy
+
+    def track_changes(self, threshold=1.0):
+        """CPU가 threshold(%p) 이상 바뀌었거나 시작/중지된 서버를 모으기 시작합니다.
+
+        처음에는 모든 서버가 들어 있으므로 첫 소비자는 전체를 한 번 평가합니다.
+        """
+        if self.dirty is None:
+            self.dirty = DirtySet(len(self), threshold)
+            self.dirty.mark(np.arange(len(self)))
+        return self.dirty
+
+    def state_arrays(self):
+        """스냅샷에 저장할 {이름: 배열} 사본을 반환합니다. 난수 상태도 포함합니다.
+
+        태그 계층은 저장하지 않으므로 복원 후 다시 붙여야 합니다.
+        """
+        arrays = {name: getattr(self, name).copy()
+                  for name in ('names', 'cpu_usage', 'cost_per_hour', 'capacity', 'groups',
+                               'running', 'last_updated')}
+        arrays.update(('workload_' + name, values.copy())
+                      for name, values in self.workload.state_arrays().items())
+        arrays['rng_state'] = np.array(json.dumps(self.rng.bit_generator.state))
+        return arrays
+
+    def running_count(self):
+        """실행 중인 서버 수를 반환합니다."""
+        return self._running_count
+
+    def hourly_cost(self):
+        """실행 중인 서버의 시간당 비용 합계를 반환합니다."""
+        return self._hourly_cost
+
+    def monthly_cost(self):
+        """월간 예상 비용 (30일 기준)을 반환합니다."""
+        return self.hourly_cost() * HOURS_PER_MONTH
+
+    def group_costs(self, monthly=False):
+        """그룹별 실행 중 서버 비용 합계를 {그룹: 비용}으로 반환합니다."""
+        scale = HOURS_PER_MONTH if monthly else 1
+        return {str(name): float(cost) * scale
+                for name, cost in zip(self.group_names, self.group_hourly_cost)}
@@ -0,0 +1,122 @@
+import tkinter as tk
+from tkinter import ttk
+
+from tree_sync import format_row
+
+# 펼친 leaf 그룹에서 한 번에 보여줄 최대 서버 수
+MAX_MEMBER_ROWS = 500
+
+
+def format_group_row(summary, node):
+    """그룹 행에 표시할 집계 값을 만듭니다."""
+    servers, running, cost, cpu_mean = summary
+    return (
+        "",
+        f"{cpu_mean[node]:.1f}%",
+        f"${cost[node]:.2f}",
+        f"실행 {int(running[node])}/{int(servers[node])}",
+        "",
+    )
+
+
+class GroupedServerList(ttk.Frame):
+    """태그 계층(region > team > service)별로 서버를 묶어 보여주는 트리 목록입니다.
+
+    처음에는 최상위 그룹만 넣고, 그룹을 펼칠 때 그 자식만 Treeview에 추가합니다.
+    그룹 행의 값은 fleet.hierarchy의 집계에서 읽으므로 서버를 훑지 않으며,
+    갱신 시에는 Treeview에 들어 있는 행 중 값이 바뀐 것만 다시 그립니다.
+    """
+
+    COLUMNS = ('name', 'cpu', 'cost', 'status', 'last_updated')
+
+    def __init__(self, parent, fleet, height=10, **kwargs):
+        super().__init__(parent, **kwargs)
+        if fleet.hierarchy is None:
+            raise ValueError("fleet.attach_hierarchy()로 계층을 먼저 붙여야 합니다.")
+        self.fleet = fleet
+        self.hierarchy = fleet.hierarchy
+        self._groups = {}    # 항목 id -> (깊이, 노드)
+        self._servers = {}   # 항목 id -> 서버 인덱스
+        self._pending = {}   # 아직 펼치지 않은 그룹 항목 id -> 자리표시 항목 id
+        self._shown = {}     # 항목 id -> 표시 중인 값
+
+        self.tree = ttk.Treeview(self, columns=self.COLUMNS, show='tree headings',
+                                 height=height)
+        self.tree.heading('#0', text=' > '.join(self.hierarchy.levels))
+        self.tree.heading('name', text='서버명')
+        self.tree.heading('cpu', text='CPU 사용률 (%)')
+        self.tree.heading('cost', text='시간당 비용 ($)')
+        self.tree.heading('status', text='상태')
+        self.tree.heading('last_updated', text='마지막 업데이트')
+
+        self.tree.column('#0', width=180)
+        self.tree.column('name', width=100)
+        self.tree.column('cpu', width=100, anchor=tk.CENTER)
+        self.tree.column('cost', width=100, anchor=tk.CENTER)
+        self.tree.column('status', width=100, anchor=tk.CENTER)
+        self.tree.column('last_updated', width=150, anchor=tk.CENTER)
+
+        self.scrollbar = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self.tree.yview)
+        self.tree.configure(yscrollcommand=self.scrollbar.set)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.tree.bind('<<TreeviewOpen>>', self._on_open)
+
+        for node in range(self.hierarchy.node_count(0)):
+            self._insert_group('', 0, node)
+        self.refresh()
+
+    def _insert_group(self, parent, depth, node):
+        item_id = self.tree.insert(parent, 'end', text=self.hierarchy.label(depth, node))
+        self._groups[item_id] = (depth, node)
+        # 펼침 표시가 보이도록 빈 자리표시 항목을 넣어 둠
+        self._pending[item_id] = self.tree.insert(item_id, 'end', text='')
+        return item_id
+
+    def _on_open(self, event=None):
+        self.expand(self.tree.focus())
+
+    def expand(self, item_id):
+        """그룹 항목을 처음 펼칠 때 자식 그룹이나 서버 행을 추가합니다."""
+        placeholder = self._pending.pop(item_id, None)
+        if placeholder is None:
+            return
+        self.tree.delete(placeholder)
+        depth, node = self._groups[item_id]
+        with self.fleet.lock:
+            if depth + 1 < self.hierarchy.depth_count:
+                for child in self.hierarchy.children(depth, node):
+                    self._insert_group(item_id, depth + 1, child)
+            else:
+                members = self.hierarchy.members(node)
+                for index in members[:MAX_MEMBER_ROWS]:
+                    self._servers[self.tree.insert(item_id, 'end', text='')] = int(index)
+                if len(members) > MAX_MEMBER_ROWS:
+                    self.tree.insert(item_id, 'end',
+                                     text=f"… 외 {len(members) - MAX_MEMBER_ROWS}대")
+        self.refresh()
+
+    def selection(self):
+        """선택된 행을 ('server', 인덱스) 또는 ('group', (깊이, 노드))로 반환합니다."""
+        selected = self.tree.selection()
+        if not selected:
+            return None
+        if selected[0] in self._servers:
+            return ('server', self._servers[selected[0]])
+        if selected[0] in self._groups:
+            return ('group', self._groups[selected[0]])
+        return None
+
+    def refresh(self):
+        """Treeview에 들어 있는 그룹/서버 행 중 값이 바뀐 것만 갱신합니다."""
+        with self.fleet.lock:
+            summaries = [self.hierarchy.summary(depth)
+                         for depth in range(self.hierarchy.depth_count)]
+            rows = {item_id: format_group_row(summaries[depth], node)
+                    for item_id, (depth, node) in self._groups.items()}
+            rows.update((item_id, format_row(self.fleet, index))
+                        for item_id, index in self._servers.items())
+        for item_id, values in rows.items():
+            if self._shown.get(item_id) != values:
+                self.tree.item(item_id, values=values)
+                self._shown[item_id] = values
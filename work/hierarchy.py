@@ -0,0 +1,141 @@
+"""서버를 region/team/service 같은 태그 계층으로 묶고 그룹별 집계를 유지합니다.
+
+계층의 노드는 (깊이, 노드 번호)로 가리킵니다. 가장 깊은 단계(leaf) 노드마다
+서버 수, 실행 중 서버 수, 실행 중 시간당 비용, CPU 합계를 배열로 유지하고,
+Fleet이 시작/중지/사용량 갱신 때 바뀐 서버의 변화분만 알려줍니다.
+상위 노드 집계는 leaf 집계를 합쳐 만들므로 비용은 서버 수가 아니라 그룹 수에 비례합니다.
+"""
+import numpy as np
+
+DEFAULT_LEVELS = ('region', 'team', 'service')
+
+# 예시 태그 값 (synthetic_tags)
+SAMPLE_TAGS = {
+    'region': ('ap-northeast-2', 'us-east-1', 'eu-west-1'),
+    'team': ('platform', 'data', 'commerce', 'search'),
+    'service': ('api', 'worker', 'batch', 'cache'),
+}
+
+
+def synthetic_tags(size, levels=DEFAULT_LEVELS, rng=None):
+    """데모/벤치마크용으로 서버마다 임의의 태그를 붙입니다."""
+    rng = rng if rng is not None else np.random.default_rng()
+    tags = {}
+    for level in levels:
+        values = SAMPLE_TAGS.get(level, tuple(f"{level}-{i}" for i in range(4)))
+        tags[level] = np.asarray(values)[rng.integers(0, len(values), size)]
+    return tags
+
+
+def _accumulate(target, codes, weights):
+    """target[codes] += weights. 스칼라는 바로 더하고, 배열은 bincount로 한 번에 더합니다."""
+    if np.ndim(codes) == 0:
+        target[codes] += weights
+    else:
+        target += np.bincount(codes, weights=weights, minlength=len(target))
+
+
+class GroupHierarchy:
+    """Fleet 서버의 태그 계층과 leaf 그룹별 집계입니다.
+
+    fleet.attach_hierarchy()로 만들면 Fleet의 변경 메서드가 집계를 증분으로 갱신합니다.
+    cpu_usage나 running 배열을 직접 바꾼 경우에는 recompute()를 호출해야 합니다.
+    """
+
+    def __init__(self, fleet, tags, levels=None):
+        self.fleet = fleet
+        self.levels = tuple(levels) if levels is not None else tuple(tags)
+        if not self.levels:
+            raise ValueError("계층 단계가 하나 이상 있어야 합니다.")
+        size = len(fleet)
+        self.labels = []   # 깊이별 노드 이름
+        self.parents = []  # 깊이별 상위 노드 번호 (최상위는 -1)
+
+        codes = np.zeros(size, dtype=np.int64)
+        for depth, level in enumerate(self.levels):
+            column = np.asarray(tags[level], dtype=str)
+            if len(column) != size:
+                raise ValueError(f"{level} 태그의 길이가 서버 수와 같아야 합니다.")
+            values, local = np.unique(column, return_inverse=True)
+            keys, codes = np.unique(codes * len(values) + local.ravel(), return_inverse=True)
+            codes = codes.ravel()
+            self.labels.append(values[keys % len(values)])
+            self.parents.append(keys // len(values) if depth else np.full(len(keys), -1))
+        self.leaf_codes = codes.astype(np.int32)
+        leaf_count = len(self.labels[-1])
+
+        # leaf -> 각 깊이의 조상 노드 번호
+        self.leaf_ancestors = [None] * len(self.levels)
+        ancestor = np.arange(leaf_count)
+        self.leaf_ancestors[-1] = ancestor
+        for depth in range(len(self.levels) - 1, 0, -1):
+            ancestor = self.parents[depth][ancestor]
+            self.leaf_ancestors[depth - 1] = ancestor
+
+        # 노드별 자식 목록과 leaf별 서버 목록을 정렬된 배열의 구간으로 보관
+        self._children = []
+        for depth in range(1, len(self.levels)):
+            order = np.argsort(self.parents[depth], kind='stable')
+            counts = np.bincount(self.parents[depth], minlength=len(self.labels[depth - 1]))
+            self._children.append((order, np.r_[0, np.cumsum(counts)]))
+        self._member_order = np.argsort(self.leaf_codes, kind='stable')
+        self.server_count = np.bincount(self.leaf_codes, minlength=leaf_count)
+        self._member_starts = np.r_[0, np.cumsum(self.server_count)]
+        self.recompute()
+
+    @property
+    def depth_count(self):
+        return len(self.levels)
+
+    def node_count(self, depth):
+        return len(self.labels[depth])
+
+    def label(self, depth, node):
+        return str(self.labels[depth][node])
+
+    def children(self, depth, node):
+        """depth 단계 node의 자식 노드 번호 배열 (depth + 1 단계)입니다."""
+        order, starts = self._children[depth]
+        return order[starts[node]:starts[node + 1]]
+
+    def members(self, leaf):
+        """leaf 노드에 속한 서버 인덱스 배열입니다."""
+        return self._member_order[self._member_starts[leaf]:self._member_starts[leaf + 1]]
+
+    def recompute(self):
+        """Fleet 배열로부터 leaf 집계를 처음부터 다시 계산합니다."""
+        fleet = self.fleet
+        leaf_count = len(self.labels[-1])
+        running = fleet.running
+        self.running_count = np.bincount(self.leaf_codes, weights=running,
+                                         minlength=leaf_count)
+        self.hourly_cost = np.bincount(self.leaf_codes,
+                                       weights=np.where(running, fleet.cost_per_hour, 0.0),
+                                       minlength=leaf_count)
+        self.cpu_sum = np.bincount(self.leaf_codes, weights=np.where(running, fleet.cpu_usage, 0.0),
+                                   minlength=leaf_count)
+
+    def running_changed(self, indices, sign):
+        """indices 서버가 시작(+1) 또는 중지(-1)된 만큼 집계를 갱신합니다."""
+        leaves = self.leaf_codes[indices]
+        _accumulate(self.running_count, leaves, sign * np.ones(np.shape(indices)))
+        _accumulate(self.hourly_cost, leaves, sign * self.fleet.cost_per_hour[indices])
+
+    def usage_changed(self, indices, delta):
+        """indices 서버의 CPU가 delta만큼 바뀌었음을 반영합니다."""
+        _accumulate(self.cpu_sum, self.leaf_codes[indices], delta)
+
+    def summary(self, depth):
+        """depth 단계 모든 노드의 (서버 수, 실행 수, 시간당 비용, 평균 CPU) 배열을 반환합니다.
+
+        평균 CPU는 실행 중인 서버 기준이며, 실행 중인 서버가 없으면 0입니다.
+        """
+        columns = (self.server_count, self.running_count, self.hourly_cost, self.cpu_sum)
+        if depth != len(self.levels) - 1:
+            ancestors = self.leaf_ancestors[depth]
+            length = len(self.labels[depth])
+            columns = [np.bincount(ancestors, weights=column, minlength=length)
+                       for column in columns]
+        servers, running, cost, cpu_sum = columns
+        cpu_mean = np.divide(cpu_sum, running, out=np.zeros(len(cpu_sum)), where=running > 0)
+        return servers, running, cost, cpu_mean
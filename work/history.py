@@ -0,0 +1,98 @@
+import numpy as np
+
+DEFAULT_WINDOW = 60  # 5초 틱 기준 5분
+
+
+class CpuHistory:
+    """서버별 최근 CPU 샘플을 고정 크기 링 버퍼로 보관합니다.
+
+    모든 서버의 버퍼는 (서버 수, window) 배열 하나에 들어 있어 서버당
+    메모리가 일정합니다. 평균은 누적 합으로, 최댓값은 밀려난 값이 최댓값일
+    때만 다시 계산하여 샘플당 O(1)로 유지합니다. p95는 필요할 때 버퍼를 행별로
+    정렬해 정확하게 구하며, 창이 작아(기본 60개) 추가 상태 없이도 충분히 쌉니다.
+    """
+
+    def __init__(self, size, window=DEFAULT_WINDOW):
+        if not 0 < window < np.iinfo(np.uint16).max:
+            raise ValueError("window는 1 이상 65535 미만이어야 합니다.")
+        self.window = window
+        self.samples = np.full((size, window), -np.inf, dtype=np.float32)
+        self.cursor = np.zeros(size, dtype=np.uint16)
+        self.count = np.zeros(size, dtype=np.uint16)
+        self.total = np.zeros(size, dtype=np.float64)
+        self.maximum = np.full(size, -np.inf, dtype=np.float32)
+
+    def __len__(self):
+        return len(self.count)
+
+    def attach(self, engine):
+        """엔진의 틱마다 실행 중인 서버의 CPU를 기록하도록 구독합니다."""
+        return engine.subscribe(lambda e: self.record_fleet(e.fleet))
+
+    def record_fleet(self, fleet):
+        """실행 중인 서버의 현재 CPU 사용률을 기록합니다."""
+        with fleet.lock:
+            rows = np.flatnonzero(fleet.running)
+            values = fleet.cpu_usage[rows]
+        self.record(rows, values)
+
+    def record(self, rows, values):
+        """rows 서버에 values 샘플을 하나씩 추가합니다."""
+        rows = np.asarray(rows, dtype=np.int64)
+        values = np.clip(np.asarray(values, dtype=np.float32), 0, 100)
+        cols = self.cursor[rows].astype(np.int64)
+        evicted = self.samples[rows, cols]
+        full = self.count[rows] == self.window
+
+        # 가득 찬 버퍼에서 밀려나는 값을 합계에서 제거
+        self.total[rows[full]] -= evicted[full]
+
+        self.samples[rows, cols] = values
+        self.total[rows] += values
+        self.cursor[rows] = (cols + 1) % self.window
+        self.count[rows] = np.minimum(self.count[rows] + 1, self.window)
+
+        # 최댓값이 밀려난 서버만 버퍼 전체에서 다시 계산
+        lost_max = full & (evicted >= self.maximum[rows]) & (values < evicted)
+        self.maximum[rows] = np.maximum(self.maximum[rows], values)
+        stale = rows[lost_max]
+        if len(stale):
+            self.maximum[stale] = self.samples[stale].max(axis=1)
+
+    def mean(self, rows=None):
+        """구간 평균 CPU를 반환합니다. 샘플이 없으면 nan입니다."""
+        rows = slice(None) if rows is None else rows
+        count = self.count[rows].astype(np.float64)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.where(count > 0, self.total[rows] / count, np.nan)
+
+    def max(self, rows=None):
+        """구간 최대 CPU를 반환합니다. 샘플이 없으면 nan입니다."""
+        rows = slice(None) if rows is None else rows
+        maximum = self.maximum[rows].astype(np.float64)
+        return np.where(self.count[rows] > 0, maximum, np.nan)
+
+    def percentile(self, q, rows=None):
+        """버퍼에 남은 샘플의 q 백분위수(nearest-rank)를 반환합니다. 샘플이 없으면 nan입니다."""
+        rows = slice(None) if rows is None else rows
+        count = self.count[rows].astype(np.int64)
+        # 빈 칸은 -inf라 정렬하면 앞에 모이므로, 유효 샘플은 window - count번째부터 시작
+        ordered = np.sort(self.samples[rows], axis=1)
+        rank = np.maximum(np.ceil(count * (q / 100.0)).astype(np.int64), 1)
+        position = np.clip(self.window - count + rank - 1, 0, self.window - 1)
+        values = np.take_along_axis(ordered, position[:, None], axis=1)[:, 0]
+        return np.where(count > 0, values.astype(np.float64), np.nan)
+
+    def p95(self, rows=None):
+        return self.percentile(95, rows)
+
+    def recent(self, row):
+        """서버 하나의 버퍼에 남은 샘플을 오래된 것부터 반환합니다."""
+        count = int(self.count[row])
+        order = (int(self.cursor[row]) - count + np.arange(count)) % self.window
+        return self.samples[row, order].copy()
+
+    def nbytes_per_server(self):
+        """서버 한 대가 차지하는 히스토리 메모리(바이트)를 반환합니다."""
+        arrays = (self.samples, self.cursor, self.count, self.total, self.maximum)
+        return sum(array.itemsize * (array.size // max(len(self), 1)) for array in arrays)
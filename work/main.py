@@ -1,376 +1,517 @@
-import tkinter as tk
-from tkinter import ttk, messagebox
-import random
+"""FinOps 클라우드 비용 최적화 시뮬레이터의 진입점입니다.
+
+    python main.py                           # 대시보드 (GUI)
+    python main.py simulate --size 1000 --duration 1d --db metrics.db
+    python main.py optimize --dry-run --size 1000
+    python main.py rightsize --size 1000
+    python main.py report --db metrics.db
+    python main.py serve --size 1000 --port 8000   # 웹 대시보드 (SSE)
+
+tkinter와 NumPy를 쓰는 모듈은 명령을 실행할 때 불러오므로 헤드리스 명령은
+디스플레이 없이 cron이나 컨테이너에서 동작하고, --help는 바로 응답합니다.
+시작 시간 예산은 benchmarks/bench_startup.py로 측정합니다.
+"""
+import argparse
+import json
+import os
+import sys
 import time
-import threading
-from datetime import datetime
-
-class Server:
-    def __init__(self, name, cpu_usage, cost_per_hour):
-        self.name = name
-        self.cpu_usage = cpu_usage
-        self.cost_per_hour = cost_per_hour
-        self.running = True
-        self.last_updated = datetime.now().strftime("%H:%M:%S")
-    
-    def update_usage(self):
-        """서버 사용량을 업데이트합니다."""
-        # 서버가 실행 중일 때만 업데이트
-        if self.running:
-            # 현재 CPU 사용률을 기반으로 약간의 변동을 줌
-            if self.cpu_usage < 5:  # 저부하 서버는 1-10% 사이에서 변동
-                self.cpu_usage = random.uniform(1, 10)
-            else:  # 일반 서버는 5-30% 사이에서 변동
-                self.cpu_usage = random.uniform(5, 30)
-            self.last_updated = datetime.now().strftime("%H:%M:%S")
-    
-    def stop_server(self):
-        """서버를 중지합니다."""
-        if self.running:  # 실행 중인 서버만 중지
-            self.running = False
-            self.cpu_usage = 0
-            self.last_updated = datetime.now().strftime("%H:%M:%S")
-            return True
-        return False
-        
-    def start_server(self):
-        """서버를 시작합니다."""
-        if not self.running:  # 중지된 서버만 시작
-            self.running = True
-            self.cpu_usage = random.uniform(1, 10)  # 시작 시 저부하 상태로 시작
-            self.last_updated = datetime.now().strftime("%H:%M:%S")
-            return True
-        return False
-
-class FinOpsDashboard:
-    def __init__(self, root):
-        self.root = root
-        self.root.title("FinOps Cloud Cost Optimizer")
-        self.root.geometry("1000x600")
-        self.root.configure(bg='#2c3e50')
-        
-        # 서버 데이터 초기화
-        self.servers = [
-            Server(f"Server-{i+1}", 
-                  random.uniform(5, 15) if i >= 2 else random.uniform(1, 5),  # 처음 2개는 저사용 서버 (1-5%)
-                  random.uniform(5, 15))  # 시간당 $5~15 비용
-            for i in range(5)
-        ]
-        
-        # UI 초기화
-        self.setup_ui()
-        
-        # 5초마다 서버 상태 업데이트
-        self.update_server_status()
-    
-    def setup_ui(self):
-        """UI 컴포넌트들을 설정합니다."""
-        # 메인 프레임
-        self.main_frame = ttk.Frame(self.root, padding="10")
-        self.main_frame.pack(fill=tk.BOTH, expand=True)
-        
-        # 제목 라벨
-        title_label = ttk.Label(
-            self.main_frame, 
-            text="클라우드 비용 최적화 대시보드",
-            font=('Helvetica', 16, 'bold')
-        )
-        title_label.grid(row=0, column=0, columnspan=2, pady=(0, 20))
-        
-        # 왼쪽 프레임 (서버 목록)
-        self.left_frame = ttk.LabelFrame(self.main_frame, text="서버 상태 모니터링", padding=10)
-        self.left_frame.grid(row=1, column=0, padx=5, pady=5, sticky="nsew")
-        
-        # 서버 상태 표시를 위한 Treeview
-        self.tree = ttk.Treeview(
-            self.left_frame, 
-            columns=('name', 'cpu', 'cost', 'status', 'last_updated'),
-            show='headings',
-            height=5
-        )
-        
-        # 컬럼 설정
-        self.tree.heading('name', text='서버명')
-        self.tree.heading('cpu', text='CPU 사용률 (%)')
-        self.tree.heading('cost', text='시간당 비용 ($)')
-        self.tree.heading('status', text='상태')
-        self.tree.heading('last_updated', text='마지막 업데이트')
-        
-        # 컬럼 너비 설정
-        self.tree.column('name', width=100)
-        self.tree.column('cpu', width=100, anchor=tk.CENTER)
-        self.tree.column('cost', width=100, anchor=tk.CENTER)
-        self.tree.column('status', width=100, anchor=tk.CENTER)
-        self.tree.column('last_updated', width=150, anchor=tk.CENTER)
-        
-        self.tree.pack(fill=tk.BOTH, expand=True)
-        
-        # 오른쪽 프레임 (비용 정보)
-        self.right_frame = ttk.LabelFrame(self.main_frame, text="비용 분석", padding=10)
-        self.right_frame.grid(row=1, column=1, padx=5, pady=5, sticky="nsew")
-        
-        # 현재 월간 예상 비용
-        self.monthly_cost_label = ttk.Label(
-            self.right_frame, 
-            text="현재 예상 월 청구액",
-            font=('Helvetica', 10)
-        )
-        self.monthly_cost_label.pack(pady=(10, 5))
-        
-        self.cost_value = tk.StringVar()
-        self.cost_display = ttk.Label(
-            self.right_frame, 
-            textvariable=self.cost_value,
-            font=('Helvetica', 24, 'bold'),
-            foreground='red'
-        )
-        self.cost_display.pack(pady=(0, 20))
-        
-        # AI 최적화 결과 메시지
-        self.optimization_result = tk.StringVar()
-        self.optimization_label = ttk.Label(
-            self.right_frame, 
-            textvariable=self.optimization_result,
-            font=('Helvetica', 10),
-            foreground='green'
-        )
-        self.optimization_label.pack(pady=10)
-        
-        # 버튼 프레임
-        button_frame = ttk.Frame(self.right_frame)
-        button_frame.pack(pady=10, fill=tk.X)
-        
-        # AI 비용 최적화 버튼
-        self.optimize_btn = ttk.Button(
-            button_frame,
-            text="AI 비용 최적화 실행",
-            command=self.start_optimization,
-            style='Accent.TButton'
-        )
-        self.optimize_btn.pack(side=tk.LEFT, expand=True, padx=5, pady=5, fill=tk.X)
-        
-        # 서버 재시작 버튼
-        self.restart_btn = ttk.Button(
-            button_frame,
-            text="서버 재시작",
-            command=self.start_all_servers,
-            style='Success.TButton'
-        )
-        self.restart_btn.pack(side=tk.RIGHT, expand=True, padx=5, pady=5, fill=tk.X)
-        
-        # 그리드 가중치 설정
-        self.main_frame.columnconfigure(0, weight=2)
-        self.main_frame.columnconfigure(1, weight=1)
-        self.main_frame.rowconfigure(1, weight=1)
-        
-        # 스타일 설정
-        self.setup_styles()
-        
-        # 초기 서버 상태 업데이트
-        self.update_server_display()
-    
-    def setup_styles(self):
-        """위젯 스타일을 설정합니다."""
-        style = ttk.Style()
-        style.theme_use('clam')
-        
-        # 기본 스타일 설정
-        style.configure('.', 
-                      background='#2c3e50', 
-                      foreground='white',
-                      font=('Helvetica', 10))
-        
-        # 프레임 스타일
-        style.configure('TFrame', background='#2c3e50')
-        
-        # 라벨 스타일
-        style.configure('TLabel', 
-                      background='#2c3e50', 
-                      foreground='white')
-        
-        # 라벨프레임 스타일
-        style.configure('TLabelframe', 
-                      background='#2c3e50', 
-                      foreground='white')
-        style.configure('TLabelframe.Label', 
-                      background='#2c3e50', 
-                      foreground='white')
-        
-        # 버튼 스타일
-        style.configure('TButton', 
-                      background='#3498db', 
-                      foreground='white',
-                      font=('Helvetica', 10, 'bold'))
-        style.map('TButton',
-                background=[('active', '#2980b9')],
-                foreground=[('active', 'white')])
-        
-        # 버튼 스타일
-        style.configure('Accent.TButton', 
-                      font=('Helvetica', 11, 'bold'),
-                      background='#e74c3c',  # 빨간색
-                      foreground='white')
-        style.map('Accent.TButton',
-                background=[('active', '#c0392b')],
-                foreground=[('active', 'white')])
-                
-        style.configure('Success.TButton',
-                      font=('Helvetica', 11, 'bold'),
-                      background='#2ecc71',  # 초록색
-                      foreground='white')
-        style.map('Success.TButton',
-                background=[('active', '#27ae60')],
-                foreground=[('active', 'white')])
-        
-        # Treeview 스타일
-        style.configure('Treeview', 
-                      fieldbackground='#34495e',
-                      background='#34495e',
-                      foreground='white',
-                      rowheight=30,
-                      font=('Helvetica', 10))
-        style.configure('Treeview.Heading', 
-                      background='#2c3e50',
-                      foreground='white',
-                      font=('Helvetica', 10, 'bold'))
-        style.map('Treeview', 
-                background=[('selected', '#3498db')],
-                foreground=[('selected', 'white')])
-    
-    def update_server_status(self):
-        """서버 상태를 주기적으로 업데이트합니다."""
-        for server in self.servers:
-            if server.running:
-                server.update_usage()
-        
-        self.update_server_display()
-        
-        # 5초마다 업데이트
-        self.root.after(5000, self.update_server_status)
-    
-    def update_server_display(self):
-        """서버 상태를 화면에 표시합니다."""
-        # 기존 항목 삭제
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
-        # 서버 상태 업데이트
-        total_cost = 0
-        for server in self.servers:
-            status = "실행 중" if server.running else "중지됨"
-            self.tree.insert('', 'end', values=(
-                server.name,
-                f"{server.cpu_usage:.1f}%",
-                f"${server.cost_per_hour:.2f}",
-                status,
-                server.last_updated
-            ))
-            
-            if server.running:
-                total_cost += server.cost_per_hour
-        
-        # 월간 예상 비용 업데이트 (30일 기준)
-        monthly_cost = total_cost * 24 * 30
-        self.cost_value.set(f"${monthly_cost:,.2f}")
-    
-    def start_optimization(self):
-        """AI 비용 최적화를 시작합니다."""
-        # 버튼 비활성화
-        self.optimize_btn['state'] = 'disabled'
-        self.optimization_result.set("AI가 서버를 분석 중입니다...")
-        
-        # 별도 스레드에서 최적화 실행
-        threading.Thread(target=self.optimize_costs, daemon=True).start()
-    
-    def start_all_servers(self):
-        """중지된 모든 서버를 재시작합니다."""
-        started_servers = []
-        
-        for server in self.servers:
-            if server.start_server():
-                started_servers.append(server.name)
-        
-        self.update_server_display()
-        
-        if started_servers:
-            message = f"{len(started_servers)}개의 서버를 재시작했습니다."
-            self.optimization_result.set(message)
-            messagebox.showinfo("서버 재시작 완료", 
-                              f"{len(started_servers)}개의 서버가 재시작되었습니다.")
-        else:
-            self.optimization_result.set("재시작할 서버가 없습니다.")
-    
-    def optimize_costs(self):
-        """저사용 서버를 식별하고 중지합니다."""
-        # 시뮬레이션을 위한 딜레이
-        time.sleep(2)
-        
-        # 1. 현재 실행 중인 서버 수 확인
-        running_servers = [s for s in self.servers if s.running]
-        
-        # 최소 1개의 서버는 항상 실행되도록 유지
-        if len(running_servers) <= 1:
-            self.optimization_result.set("최소 1개 이상의 서버가 필요합니다.")
-            self.optimize_btn['state'] = 'normal'
-            return
-        
-        # 2. CPU 사용률이 10% 미만이고, 비용이 가장 높은 서버 1개만 중지
-        target_server = None
-        max_cost = 0
-        
-        for server in running_servers:
-            if server.cpu_usage < 10 and server.cost_per_hour > max_cost:
-                target_server = server
-                max_cost = server.cost_per_hour
-        
-        # 3. 서버 중지 및 결과 처리
-        if target_server and target_server.stop_server():
-            monthly_savings = target_server.cost_per_hour * 24 * 30
-            message = f"서버 '{target_server.name}'을(를) 중지했습니다.\n"
-            message += f"월간 예상 절감액: ${monthly_savings:,.2f}"
-            
-            self.optimization_result.set(message)
-            messagebox.showinfo("최적화 완료", 
-                              f"서버 '{target_server.name}'이(가) 중지되었습니다.\n"
-                              f"월간 예상 절감액: ${monthly_savings:,.2f}")
-        else:
-            self.optimization_result.set("최적화할 서버가 없습니다.")
-        
-        self.update_server_display()
-        
-        # UI 업데이트
-        self.root.after(0, self.update_server_display)
-        
-        # 결과 메시지 표시
-        if stopped_servers:
-            message = f"성공적으로 {len(stopped_servers)}개의 서버를 중지했습니다.\n"
-            message += f"월간 예상 절감액: ${total_savings:,.2f}"
-            
-            self.root.after(0, lambda: self.optimization_result.set(message))
-            self.root.after(0, lambda: messagebox.showinfo("최적화 완료", 
-                f"{len(stopped_servers)}개의 저사용 서버가 중지되었습니다.\n"
-                f"월간 예상 절감액: ${total_savings:,.2f}"))
-        else:
-            self.root.after(0, lambda: self.optimization_result.set(
-                "최적화가 필요 없는 서버 상태입니다."))
-        
-        # 버튼 다시 활성화
-        self.root.after(0, lambda: self.optimize_btn.configure(state='normal'))
+
+from server import Server  # noqa: F401 (기존 `from main import Server` 호환)
+
+# 메트릭 기록용 SQLite 데이터베이스
+METRICS_DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'metrics.db')
+
+# 명령별 시작 시간 예산 (초, 프로세스 시작부터 종료까지)
+STARTUP_BUDGETS = {
+    'help': 0.1,
+    'report': 0.3,
+    'optimize': 0.4,
+}
+
+DURATION_UNITS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+
+
+def __getattr__(name):
+    # 기존 `from main import FinOpsDashboard`는 그대로 쓰되 tkinter는 그때 불러옴
+    if name in ('FinOpsDashboard', 'VIRTUAL_LIST_THRESHOLD'):
+        import dashboard
+        return getattr(dashboard, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def parse_duration(text):
+    """'90s', '15m', '12h', '30d' 또는 초 단위 숫자를 초로 변환합니다."""
+    text = text.strip().lower()
+    unit = DURATION_UNITS.get(text[-1:])
+    try:
+        return float(text[:-1]) * unit if unit else float(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"기간 형식이 올바르지 않습니다: {text}")
+
+
+def build_engine(args, realtime=False):
+    """명령행 옵션(없으면 FINOPS_* 환경 변수)으로 플릿과 엔진을 만듭니다.
+
+    상태 로그(--state 또는 FINOPS_STATE_LOG)를 주면 플릿을 그 로그에서 복원하고,
+    이후의 시작/중지를 같은 로그에 이어서 기록합니다. 로그의 플릿이 지금 옵션으로
+    만들 플릿과 다르면 오류를 출력하고 종료 코드 2로 끝냅니다.
+    """
+    from engine import SimulationEngine
+    from fleet import Fleet
+
+    replay_path = args.replay or os.environ.get('FINOPS_REPLAY_FILE')
+    metrics_url = getattr(args, 'metrics_url', None) or os.environ.get('FINOPS_METRICS_URL')
+    seed = args.seed if args.seed is not None else os.environ.get('FINOPS_SEED')
+    group_by = args.group_by or os.environ.get('FINOPS_GROUP_BY')
+    state_path = args.state or os.environ.get('FINOPS_STATE_LOG')
+
+    def new_fleet():
+        if replay_path:
+            from replay import fleet_for_replay
+            return fleet_for_replay(replay_path)
+        return Fleet.random(args.size, low_usage_count=args.low_usage,
+                            seed=None if seed is None else int(seed),
+                            profiles=args.profiles)
+
+    events = None
+    if state_path:
+        from eventlog import EventLog, StateMismatchError
+        # 플릿 구성을 정하는 옵션이 바뀌었는지 다시 열 때 확인
+        spec = ({'replay': os.path.abspath(replay_path)} if replay_path else
+                {'size': args.size, 'low_usage': args.low_usage,
+                 'seed': None if seed is None else int(seed),
+                 'profiles': args.profiles})
+        try:
+            events, fleet = EventLog.open(state_path, new_fleet,
+                                          spec=json.dumps(spec, sort_keys=True))
+        except StateMismatchError as error:
+            print(error, file=sys.stderr)
+            raise SystemExit(2)
+    else:
+        fleet = new_fleet()
+
+    source = None
+    if replay_path:
+        from replay import ReplaySource, open_usage_file
+        speed = args.speed or float(os.environ.get('FINOPS_REPLAY_SPEED', '1'))
+        source = ReplaySource(open_usage_file(replay_path), speed=speed,
+                              tick_seconds=args.tick_seconds, start=args.replay_start)
+    elif metrics_url:
+        # random 대신 클라우드 메트릭 API에서 CPU 수집
+        from collector import AsyncHttpCollector
+        source = AsyncHttpCollector(metrics_url)
+    if group_by:
+        from hierarchy import synthetic_tags
+        levels = [level.strip() for level in group_by.split(',') if level.strip()]
+        fleet.attach_hierarchy(synthetic_tags(len(fleet), levels, fleet.rng), levels)
+    engine = SimulationEngine(fleet, tick_seconds=args.tick_seconds, realtime=realtime,
+                              source=source)
+    if events is not None:
+        events.attach(engine)
+    return engine
+
+
+def close_engine(engine):
+    """메트릭 소스를 닫고, 상태 로그가 있으면 마지막 스냅샷을 씁니다."""
+    engine.source.close()
+    if engine.fleet.events is not None:
+        engine.fleet.events.close(engine.fleet)
+
+
+def detect_anomalies(engine):
+    """틱마다 서버별 급증/급감을 표시하는 탐지기를 붙입니다. 표시된 서버는 중지하지 않습니다."""
+    from anomaly import AnomalyDetector
+    detector = AnomalyDetector(len(engine.fleet))
+    detector.attach(engine)
+    engine.fleet.anomalies = detector
+    return detector
+
+
+def fleet_summary(fleet):
+    running = fleet.running_count()
+    return {
+        'servers': len(fleet),
+        'running': running,
+        'hourly_cost': round(fleet.hourly_cost(), 2),
+        'monthly_cost': round(fleet.monthly_cost(), 2),
+        'mean_cpu': round(float(fleet.cpu_usage.sum()) / running, 2) if running else 0.0,
+    }
+
+
+def emit(args, result, lines):
+    """--json이면 결과 dict를, 아니면 사람이 읽을 줄들을 출력합니다."""
+    if args.json:
+        print(json.dumps(result, ensure_ascii=False, indent=2))
+    else:
+        print("\n".join(lines))
+
+
+def cmd_gui(args):
+    engine = build_engine(args, realtime=True)
+    import dashboard
+    dashboard.run(engine, metrics_db_path=args.db or METRICS_DB_PATH,
+                  perf_dump_path=args.perf_dump or os.environ.get('FINOPS_PERF_DUMP'),
+                  bulk_rate=args.bulk_rate)
+    return 0
+
+
+def cmd_serve(args):
+    """엔진 하나를 실시간으로 돌리며 웹 대시보드를 여러 브라우저에 SSE로 보냅니다."""
+    engine = build_engine(args, realtime=True)
+    detect_anomalies(engine)
+    store = None
+    if args.db:
+        from metrics_store import MetricsStore
+        store = MetricsStore(args.db)
+        store.attach(engine)
+    import web
+    print(f"웹 대시보드: http://{args.host}:{args.port}/ (Ctrl+C로 종료)", file=sys.stderr)
+    try:
+        web.run(engine, args.host, args.port, buffer=args.buffer)
+    finally:
+        close_engine(engine)
+        if store is not None:
+            store.close()
+    return 0
+
+
+def cmd_simulate(args):
+    """디스플레이 없이 엔진을 돌리고 결과 요약을 출력합니다."""
+    engine = build_engine(args)
+    store = None
+    if args.db:
+        from metrics_store import MetricsStore
+        store = MetricsStore(args.db)
+        store.attach(engine)
+    scheduler = None
+    if args.auto_optimize:
+        from scheduler import AutoOptimizer
+        detect_anomalies(engine)
+        scheduler = AutoOptimizer(engine.fleet)
+        scheduler.attach(engine)
+    started = time.perf_counter()
+    ticks = int(args.duration // engine.tick_seconds)
+    try:
+        engine.run(ticks)
+    finally:
+        close_engine(engine)
+        if store is not None:
+            store.close()
+    elapsed = time.perf_counter() - started
+
+    result = dict(fleet_summary(engine.fleet), ticks=ticks,
+                  simulated_seconds=ticks * engine.tick_seconds,
+                  elapsed_seconds=round(elapsed, 3))
+    if scheduler is not None:
+        result.update(auto_stopped=scheduler.stopped_count, auto_started=scheduler.started_count)
+    lines = [
+        f"서버 {result['servers']}대, {ticks}틱 ({args.duration / 3600:g}시간) 시뮬레이션: "
+        f"{elapsed:.2f}초 ({ticks / elapsed if elapsed else 0:,.0f}틱/초)",
+        f"실행 중 {result['running']}대, 평균 CPU {result['mean_cpu']:.1f}%",
+        f"현재 예상 월 청구액: ${result['monthly_cost']:,.2f}",
+    ]
+    if scheduler is not None:
+        lines.append(f"자동 최적화: 중지 {scheduler.stopped_count}대, "
+                     f"시작 {scheduler.started_count}대")
+    if args.db:
+        lines.append(f"기록: {args.db}")
+    emit(args, result, lines)
+    return 0
+
+
+def cmd_optimize(args):
+    """워밍업 동안 CPU 기록을 쌓은 뒤 중지 계획을 세우고, --dry-run이 아니면 적용합니다."""
+    from history import CpuHistory
+    from optimizer import OptimizationPolicy, plan_stops
+
+    engine = build_engine(args)
+    fleet = engine.fleet
+    history = CpuHistory(len(fleet))
+    history.attach(engine)
+    anomalies = detect_anomalies(engine)
+    policy = OptimizationPolicy(cpu_threshold=args.threshold, min_running=args.min_running,
+                                min_capacity=args.min_capacity,
+                                usage_statistic=args.statistic)
+    try:
+        engine.run(int(args.warmup // engine.tick_seconds))
+        before = fleet_summary(fleet)
+        plan = plan_stops(fleet, policy, history)
+        if not args.dry_run:
+            plan.apply(now=engine.now)
+            if args.db:
+                # 적용 결과(상태 전이)를 메트릭 저장소에 남김
+                from metrics_store import MetricsStore
+                store = MetricsStore(args.db)
+                store.record_tick(fleet, engine.now)
+                store.close()
+    finally:
+        close_engine(engine)
+
+    result = {
+        'dry_run': args.dry_run,
+        'policy': repr(policy),
+        'stop': plan.names,
+        'monthly_savings': round(plan.monthly_savings, 2),
+        'anomalous': anomalies.flagged_count(),
+        'before': before,
+        'after': fleet_summary(fleet),
+    }
+    shown = plan.names[:args.limit]
+    lines = [f"정책: {policy!r}",
+             f"중지 대상 {len(plan)}대, 예상 월 절감액 ${plan.monthly_savings:,.2f}"]
+    if result['anomalous']:
+        lines.append(f"이상 상태(급증/급감) 서버 {result['anomalous']}대는 중지 대상에서 제외")
+    lines += [f"  - {name}" for name in shown]
+    if len(plan) > len(shown):
+        lines.append(f"  ... 외 {len(plan) - len(shown)}대")
+    lines.append("(dry-run: 변경하지 않음)" if args.dry_run else
+                 f"적용 후 예상 월 청구액: ${result['after']['monthly_cost']:,.2f}")
+    emit(args, result, lines)
+    return 0
+
+
+def cmd_rightsize(args):
+    """워밍업 동안 CPU 기록을 쌓은 뒤 서버별 다운사이징 제안과 예상 절감액을 출력합니다."""
+    from history import CpuHistory
+    from rightsizing import InstanceCatalog, recommend_rightsizing
+
+    catalog = InstanceCatalog.from_csv(args.catalog) if args.catalog else InstanceCatalog()
+    engine = build_engine(args)
+    fleet = engine.fleet
+    history = CpuHistory(len(fleet))
+    history.attach(engine)
+    try:
+        engine.run(int(args.warmup // engine.tick_seconds))
+        plan = recommend_rightsizing(fleet, history, catalog, statistic=args.statistic,
+                                     target_utilization=args.target)
+    finally:
+        close_engine(engine)
+
+    rows = plan.rows(args.limit)
+    result = {
+        'statistic': args.statistic,
+        'target_utilization': args.target,
+        'servers': len(plan),
+        'monthly_savings': round(plan.monthly_savings, 2),
+        'suggestions': [{'server': name, 'current': current, 'suggested': suggested,
+                         'peak_cpu': round(peak, 1), 'monthly_savings': round(saving, 2)}
+                        for name, current, suggested, peak, saving in rows],
+    }
+    lines = [f"다운사이징 제안 {len(plan)}대, 예상 월 절감액 ${plan.monthly_savings:,.2f} "
+             f"(최대 CPU 기준 {args.statistic}, 목표 사용률 {args.target:g}%)"]
+    lines += [f"  - {name:<14} {current:>8} -> {suggested:<8} 최대 {peak:5.1f}%  월 ${saving:,.2f}"
+              for name, current, suggested, peak, saving in rows]
+    if len(plan) > len(rows):
+        lines.append(f"  ... 외 {len(plan) - len(rows)}대")
+    emit(args, result, lines)
+    return 0
+
+
+def cmd_report(args):
+    """메트릭 데이터베이스의 비용 추이와 상태 전이를 요약합니다."""
+    db_path = args.db or METRICS_DB_PATH
+    if not os.path.exists(db_path):
+        print(f"메트릭 데이터베이스가 없습니다: {db_path}", file=sys.stderr)
+        return 2
+    from fleet import HOURS_PER_MONTH, format_timestamp
+    from metrics_store import MetricsStore
+
+    store = MetricsStore(db_path)
+    try:
+        servers = store.query("SELECT COUNT(*) FROM servers")[0][0]
+        costs = store.cost_series(args.level)
+        transitions = store.transitions()
+    finally:
+        store.close()
+
+    recent = [{'bucket': bucket, 'monthly_cost': round(cost * HOURS_PER_MONTH, 2)}
+              for bucket, cost in costs[-args.limit:]]
+    stops = sum(1 for _, _, running in transitions if not running)
+    result = {
+        'database': db_path,
+        'servers': servers,
+        'series': recent,
+        'stops': stops,
+        'starts': len(transitions) - stops,
+    }
+    if costs:
+        first, last = costs[0][1] * HOURS_PER_MONTH, costs[-1][1] * HOURS_PER_MONTH
+        result.update(first_monthly_cost=round(first, 2), last_monthly_cost=round(last, 2),
+                      monthly_savings=round(first - last, 2))
+
+    lines = [f"데이터베이스: {db_path} (서버 {servers}대)"]
+    if costs:
+        lines.append(f"예상 월 청구액: ${result['first_monthly_cost']:,.2f} -> "
+                     f"${result['last_monthly_cost']:,.2f} "
+                     f"(절감 ${result['monthly_savings']:,.2f})")
+        lines.append(f"최근 {len(recent)}개 {args.level} 구간:")
+        lines += [f"  {format_timestamp(row['bucket'])}  ${row['monthly_cost']:>14,.2f}"
+                  for row in recent]
+    else:
+        lines.append("롤업 데이터가 없습니다.")
+    lines.append(f"상태 전이: 중지 {stops}회, 시작 {result['starts']}회")
+    emit(args, result, lines)
+    return 0
+
+
+def cmd_audit(args):
+    """상태 이벤트 로그의 중지 기록과 그 중지를 낸 최적화 결정을 출력합니다."""
+    path = args.state or os.environ.get('FINOPS_STATE_LOG')
+    if not path:
+        print("--state 또는 FINOPS_STATE_LOG로 상태 이벤트 로그를 지정하세요.", file=sys.stderr)
+        return 2
+    if not os.path.exists(path):
+        print(f"상태 이벤트 로그가 없습니다: {path}", file=sys.stderr)
+        return 2
+    import numpy as np
+    from eventlog import SNAPSHOT_SUFFIX, EventLog
+    from fleet import format_timestamp
+
+    with np.load(path + SNAPSHOT_SUFFIX, allow_pickle=False) as arrays:
+        names = arrays['names']
+    server = None
+    if args.server:
+        matches = np.flatnonzero(names == args.server)
+        if not len(matches):
+            print(f"서버를 찾을 수 없습니다: {args.server}", file=sys.stderr)
+            return 2
+        server = int(matches[0])
+    log = EventLog(path)
+    try:
+        entries = log.audit(server=server, limit=args.limit)
+    finally:
+        log.close()
+
+    result = {'log': path, 'stops': [
+        {'ts': ts, 'server': str(names[index]), 'hourly_cost': round(cost, 2),
+         'decided_by': source, 'decided_at': decided_at}
+        for ts, index, cost, source, decided_at in entries]}
+    lines = [f"{'시각':<10} {'서버':<14} {'$/시간':>8}  결정"]
+    for ts, index, cost, source, decided_at in entries:
+        decision = (f"{source} ({format_timestamp(decided_at)})" if source is not None
+                    else "직접 중지")
+        lines.append(f"{format_timestamp(ts):<10} {names[index]:<14} {cost:>8.2f}  {decision}")
+    if not entries:
+        lines.append("(기록된 중지가 없습니다)")
+    emit(args, result, lines)
+    return 0
+
+
+COMMANDS = ('gui', 'serve', 'simulate', 'optimize', 'rightsize', 'report', 'audit')
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="FinOps 클라우드 비용 최적화 시뮬레이터")
+    commands = parser.add_subparsers(dest='command')
+
+    fleet_options = argparse.ArgumentParser(add_help=False)
+    fleet_options.add_argument('--size', type=int, default=5, help='시뮬레이션 서버 수')
+    fleet_options.add_argument('--low-usage', type=int, default=2,
+                               help='계속 저사용인 서버 수 (--profiles가 없으면 idle 프로파일)')
+    fleet_options.add_argument('--seed', type=int, help='재현용 시드 (기본: FINOPS_SEED)')
+    fleet_options.add_argument('--profiles', nargs='+', metavar='NAME=RATIO',
+                               help='워크로드 프로파일 비율 (예: diurnal=0.6 bursty=0.2)')
+    fleet_options.add_argument('--group-by', help='예시 태그 계층 (예: region,team,service)')
+    fleet_options.add_argument('--replay', metavar='FILE', help='재생할 사용률 CSV/Parquet')
+    fleet_options.add_argument('--speed', type=float, help='재생 배속')
+    fleet_options.add_argument('--replay-start', metavar='TIME',
+                               help='이 시각(epoch 초 또는 ISO 8601)부터 재생')
+    fleet_options.add_argument('--tick-seconds', type=float, default=5.0)
+    fleet_options.add_argument('--db', help='사용량과 상태 전이를 기록할 메트릭 데이터베이스')
+    fleet_options.add_argument('--state', metavar='FILE',
+                               help='서버 상태 이벤트 로그 (있으면 복원, 기본: FINOPS_STATE_LOG)')
+    fleet_options.add_argument('--json', action='store_true', help='결과를 JSON으로 출력')
+
+    gui = commands.add_parser('gui', parents=[fleet_options], help='대시보드 실행 (기본)')
+    gui.add_argument('--metrics-url', help='CPU를 수집할 메트릭 API (기본: FINOPS_METRICS_URL)')
+    gui.add_argument('--bulk-rate', type=float, help='일괄 시작/중지 시 초당 API 호출 수')
+    gui.add_argument('--perf-dump', metavar='FILE',
+                     help='성능 지표를 주기적으로 쓸 Prometheus 텍스트 파일 '
+                          '(기본: FINOPS_PERF_DUMP, 없으면 쓰지 않음)')
+    gui.set_defaults(handler=cmd_gui)
+
+    serve = commands.add_parser('serve', parents=[fleet_options],
+                                help='웹 대시보드 (여러 브라우저에 SSE로 변경분 전송)')
+    serve.add_argument('--metrics-url', help='CPU를 수집할 메트릭 API (기본: FINOPS_METRICS_URL)')
+    serve.add_argument('--host', default='127.0.0.1')
+    serve.add_argument('--port', type=int, default=8000)
+    serve.add_argument('--buffer', type=int, default=16,
+                       help='클라이언트당 밀린 메시지 한도 (넘으면 전체 상태로 다시 맞춤)')
+    serve.set_defaults(handler=cmd_serve)
+
+    simulate = commands.add_parser('simulate', parents=[fleet_options],
+                                   help='헤드리스 시뮬레이션')
+    simulate.add_argument('--duration', type=parse_duration, default=parse_duration('1h'),
+                          help='시뮬레이션 기간 (예: 90m, 12h, 30d)')
+    simulate.add_argument('--auto-optimize', action='store_true',
+                          help='자동 최적화 스케줄러를 켜고 시뮬레이션')
+    simulate.set_defaults(handler=cmd_simulate)
+
+    optimize = commands.add_parser('optimize', parents=[fleet_options],
+                                   help='저사용 서버 중지 계획 (및 적용)')
+    optimize.add_argument('--dry-run', action='store_true', help='계획만 출력하고 적용하지 않음')
+    optimize.add_argument('--warmup', type=parse_duration, default=parse_duration('5m'),
+                          help='계획 전 CPU 기록을 쌓을 기간')
+    optimize.add_argument('--threshold', type=float, default=10.0, help='저사용 CPU 기준 (%%, 구간 통계 미만)')
+    optimize.add_argument('--min-running', type=int, default=1)
+    optimize.add_argument('--min-capacity', type=float, default=0.0)
+    optimize.add_argument('--statistic', default='p95', choices=['p95', 'mean', 'max'])
+    optimize.add_argument('--limit', type=int, default=20, help='출력할 서버 이름 수')
+    optimize.set_defaults(handler=cmd_optimize)
+
+    rightsize = commands.add_parser('rightsize', parents=[fleet_options],
+                                    help='서버별 다운사이징 제안')
+    rightsize.add_argument('--warmup', type=parse_duration, default=parse_duration('5m'),
+                           help='제안 전 CPU 기록을 쌓을 기간')
+    rightsize.add_argument('--statistic', default='max', choices=['max', 'p95', 'mean'],
+                           help='최대 부하로 볼 구간 통계')
+    rightsize.add_argument('--target', type=float, default=80.0,
+                           help='새 유형에서 넘지 않을 CPU 사용률 (%%)')
+    rightsize.add_argument('--catalog', metavar='CSV',
+                           help='인스턴스 유형 카탈로그 (name,vcpu,memory_gib,hourly_price)')
+    rightsize.add_argument('--limit', type=int, default=20, help='출력할 서버 수')
+    rightsize.set_defaults(handler=cmd_rightsize)
+
+    report = commands.add_parser('report', help='메트릭 데이터베이스 요약')
+    report.add_argument('--db', help=f'메트릭 데이터베이스 (기본: {METRICS_DB_PATH})')
+    report.add_argument('--level', default='1h', choices=['1m', '1h', '1d'])
+    report.add_argument('--limit', type=int, default=24, help='출력할 최근 구간 수')
+    report.add_argument('--json', action='store_true', help='결과를 JSON으로 출력')
+    report.set_defaults(handler=cmd_report)
+
+    audit = commands.add_parser('audit', help='서버 중지 감사 기록')
+    audit.add_argument('--state', metavar='FILE', help='상태 이벤트 로그 (기본: FINOPS_STATE_LOG)')
+    audit.add_argument('--server', help='이 서버의 기록만 출력')
+    audit.add_argument('--limit', type=int, default=50, help='출력할 최근 중지 수')
+    audit.add_argument('--json', action='store_true', help='결과를 JSON으로 출력')
+    audit.set_defaults(handler=cmd_audit)
+    return parser
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else list(argv)
+    # 명령 없이 실행하면 기존처럼 대시보드를 띄움
+    if not argv or argv[0] not in COMMANDS + ('-h', '--help'):
+        argv = ['gui'] + argv
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if getattr(args, 'profiles', None):
+        # numpy를 불러오므로 --profiles를 줬을 때만 가져옴
+        from workload import parse_profiles
+        try:
+            args.profiles = parse_profiles(args.profiles)
+        except ValueError as error:
+            parser.error(str(error))
+    if getattr(args, 'replay_start', None):
+        from replay import parse_timestamp
+        try:
+            args.replay_start = parse_timestamp(args.replay_start)
+        except ValueError:
+            parser.error(f"--replay-start는 epoch 초 또는 ISO 8601 시각이어야 합니다: "
+                         f"{args.replay_start}")
+    return args.handler(args)
+
 
 if __name__ == "__main__":
-    root = tk.Tk()
-    
-    # 윈도우를 화면 중앙에 배치
-    window_width = 1000
-    window_height = 600
-    screen_width = root.winfo_screenwidth()
-    screen_height = root.winfo_screenheight()
-    x = (screen_width // 2) - (window_width // 2)
-    y = (screen_height // 2) - (window_height // 2)
-    root.geometry(f'{window_width}x{window_height}+{x}+{y}')
-    
-    # 스타일 초기화
-    
-    # 애플리케이션 실행
-    app = FinOpsDashboard(root)
-    root.mainloop()
+    sys.exit(main())
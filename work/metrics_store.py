@@ -0,0 +1,289 @@
+import queue
+import sqlite3
+import threading
+
+import numpy as np
+
+# 롤업 단계 이름 -> 버킷 크기 (초)
+ROLLUP_LEVELS = {
+    '1m': 60,
+    '1h': 60 * 60,
+    '1d': 24 * 60 * 60,
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS servers (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    cost_per_hour REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS samples (
+    ts REAL NOT NULL,
+    server INTEGER NOT NULL,
+    cpu REAL NOT NULL,
+    running INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS samples_ts ON samples (ts);
+CREATE TABLE IF NOT EXISTS transitions (
+    ts REAL NOT NULL,
+    server INTEGER NOT NULL,
+    running INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS transitions_ts ON transitions (ts);
+"""
+
+ROLLUP_SCHEMA = """
+CREATE TABLE IF NOT EXISTS rollup_{level} (
+    bucket INTEGER NOT NULL,
+    server INTEGER NOT NULL,
+    samples INTEGER NOT NULL,
+    running_samples INTEGER NOT NULL,
+    cpu_sum REAL NOT NULL,
+    cpu_max REAL NOT NULL,
+    PRIMARY KEY (bucket, server)
+) WITHOUT ROWID;
+"""
+
+ROLLUP_UPSERT = """
+INSERT INTO rollup_{level} (bucket, server, samples, running_samples, cpu_sum, cpu_max)
+VALUES (?, ?, ?, ?, ?, ?)
+ON CONFLICT (bucket, server) DO UPDATE SET
+    samples = samples + excluded.samples,
+    running_samples = running_samples + excluded.running_samples,
+    cpu_sum = cpu_sum + excluded.cpu_sum,
+    cpu_max = MAX(cpu_max, excluded.cpu_max)
+"""
+
+
+def _connect(path):
+    conn = sqlite3.connect(path, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+
+def rollup_rows(ts, server, cpu, running, bucket_seconds):
+    """샘플 배열을 (버킷, 서버)별로 미리 합쳐 롤업 테이블에 쓸 행을 만듭니다."""
+    bucket_ids = (ts // bucket_seconds).astype(np.int64)
+    first_bucket = int(bucket_ids.min())
+    width = int(server.max()) + 1
+    keys = (bucket_ids - first_bucket) * width + server
+    unique_keys, inverse = np.unique(keys, return_inverse=True)
+    inverse = inverse.ravel()
+    count = len(unique_keys)
+    buckets = (unique_keys // width + first_bucket) * bucket_seconds
+    samples = np.bincount(inverse, minlength=count)
+    running_samples = np.bincount(inverse, weights=running, minlength=count)
+    cpu_sum = np.bincount(inverse, weights=cpu, minlength=count)
+    cpu_max = np.full(count, -np.inf)
+    np.maximum.at(cpu_max, inverse, cpu)
+    return list(zip(buckets.tolist(), (unique_keys % width).tolist(), samples.tolist(),
+                    running_samples.astype(np.int64).tolist(), cpu_sum.tolist(),
+                    cpu_max.tolist()))
+
+
+class MetricsStore:
+    """틱별 사용량과 상태 전이를 SQLite에 기록하는 저장소입니다.
+
+    record_tick()은 배열을 복사해 큐에 넣기만 하고, 백그라운드 writer
+    스레드가 여러 틱을 모아 executemany로 한 트랜잭션에 씁니다.
+    1분/1시간/1일 롤업 테이블을 함께 갱신하므로 긴 기간의 차트는
+    원시 샘플 대신 미리 집계된 행을 조회합니다.
+
+    배치를 쓰다 실패하면(디스크 부족, 잠긴 DB 등) 그 배치의 샘플은 버리지만 서버 목록과
+    상태 전이는 남겨 두었다가 다음 배치와 함께 다시 씁니다. writer는 계속 다음 배치를
+    처리하며, 오류는 다음 flush() 또는 close()에서 다시 던집니다.
+    """
+
+    def __init__(self, path, max_batch_ticks=64, keep_raw=True):
+        self.path = path
+        self.max_batch_ticks = max_batch_ticks
+        self.keep_raw = keep_raw
+        self._queue = queue.Queue()
+        self._known_servers = 0
+        self._error = None  # writer 스레드에서 난 첫 오류, flush()/close()에서 던짐
+        self._error_lock = threading.Lock()
+        # 실패한 배치에서 아직 쓰지 못한 서버 목록과 상태 전이 (writer 스레드 전용)
+        self._unsent_servers = []
+        self._unsent_transitions = []
+
+        conn = _connect(path)
+        with conn:
+            conn.executescript(SCHEMA)
+            for level in ROLLUP_LEVELS:
+                conn.executescript(ROLLUP_SCHEMA.format(level=level))
+        # 기존 데이터베이스에 이어 쓸 때는 마지막으로 기록된 상태와 비교해 전이를 감지
+        self._last_running = self._recorded_running(conn)
+        conn.close()
+
+        self._reader = _connect(path)
+        self._reader_lock = threading.Lock()
+        self._writer = threading.Thread(target=self._write_loop, name='metrics-writer', daemon=True)
+        self._writer.start()
+
+    @staticmethod
+    def _recorded_running(conn):
+        """기록된 서버별 마지막 상태를 반환합니다. 전이가 없는 서버는 실행 중으로 봅니다."""
+        size = conn.execute("SELECT COALESCE(MAX(id) + 1, 0) FROM servers").fetchone()[0]
+        if not size:
+            return None
+        running = np.ones(size, dtype=bool)
+        for server, state in conn.execute(
+                "SELECT server, running FROM transitions WHERE rowid IN "
+                "(SELECT MAX(rowid) FROM transitions GROUP BY server)"):
+            if server < size:
+                running[server] = bool(state)
+        return running
+
+    def attach(self, engine):
+        """엔진의 틱마다 기록하도록 구독하고, 해제 함수를 반환합니다."""
+        return engine.subscribe(lambda e: self.record_tick(e.fleet, e.now))
+
+    def record_tick(self, fleet, now):
+        """현재 플릿 상태를 기록 큐에 넣습니다. 상태 전이도 여기서 감지합니다."""
+        with fleet.lock:
+            cpu = fleet.cpu_usage.copy()
+            running = fleet.running.copy()
+            new_servers = None
+            if len(fleet) > self._known_servers:
+                new_servers = (self._known_servers, fleet.names[self._known_servers:].tolist(),
+                               fleet.cost_per_hour[self._known_servers:].tolist())
+                self._known_servers = len(fleet)
+
+        # 처음 기록하거나 새로 생긴 서버는 실행 중이었던 것으로 보고 중지 상태만 전이로 남김
+        previous = np.ones(len(running), dtype=bool)
+        if self._last_running is not None:
+            known = min(len(previous), len(self._last_running))
+            previous[:known] = self._last_running[:known]
+        changed = np.flatnonzero(running != previous)
+        self._last_running = running
+        self._queue.put((float(now), cpu, running, changed, new_servers))
+
+    def flush(self):
+        """큐에 쌓인 기록이 모두 쓰일 때까지 기다립니다. 그동안 쓰기에 실패했으면 그 오류를 던집니다."""
+        self._queue.join()
+        self._raise_error()
+
+    def close(self):
+        """남은 기록을 쓰고 writer 스레드를 종료합니다. 쓰기에 실패했으면 그 오류를 던집니다."""
+        if self._writer.is_alive():
+            self._queue.put(None)
+            self._writer.join()
+        self._reader.close()
+        self._raise_error()
+
+    def _raise_error(self):
+        with self._error_lock:
+            error, self._error = self._error, None
+        if error is not None:
+            raise error
+
+    def _set_error(self, error):
+        with self._error_lock:
+            if self._error is None:
+                self._error = error
+
+    def _write_loop(self):
+        try:
+            conn = _connect(self.path)
+        except sqlite3.Error as error:
+            # 연결하지 못해도 큐는 계속 비워야 flush()/close()가 멈추지 않음
+            self._set_error(error)
+            conn = None
+        try:
+            while True:
+                batch = [self._queue.get()]
+                while len(batch) < self.max_batch_ticks and batch[-1] is not None:
+                    try:
+                        batch.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+                try:
+                    self._write_ticks(conn, [item for item in batch if item is not None])
+                    if batch[-1] is None and (self._unsent_servers or self._unsent_transitions):
+                        # 닫기 전에 남은 서버 목록과 상태 전이를 한 번 더 시도
+                        self._write_ticks(conn, [])
+                finally:
+                    for _ in batch:
+                        self._queue.task_done()
+                if batch[-1] is None:
+                    return
+        finally:
+            if conn is not None:
+                conn.close()
+
+    def _write_ticks(self, conn, ticks):
+        servers = self._unsent_servers + [
+            new_servers for _, _, _, _, new_servers in ticks if new_servers is not None]
+        transitions = self._unsent_transitions + [
+            (now, int(index), int(state[index]))
+            for now, _, state, changed, _ in ticks for index in changed]
+        try:
+            if conn is not None and (ticks or servers or transitions):
+                self._write_batch(conn, ticks, servers, transitions)
+            self._unsent_servers, self._unsent_transitions = [], []
+        except Exception as error:
+            # 롤백된 배치의 샘플은 버리고, 다른 행에서 참조하는 서버 목록과
+            # 다시 만들 수 없는 상태 전이는 다음 배치에서 다시 씀
+            self._set_error(error)
+            self._unsent_servers, self._unsent_transitions = servers, transitions
+
+    def _write_batch(self, conn, ticks, servers, transitions):
+        with conn:
+            for start, names, costs in servers:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO servers (id, name, cost_per_hour) VALUES (?, ?, ?)",
+                    zip(range(start, start + len(names)), names, costs))
+            conn.executemany("INSERT INTO transitions (ts, server, running) VALUES (?, ?, ?)",
+                             transitions)
+            if not ticks:
+                return
+            ts = np.concatenate([np.full(len(cpu), now) for now, cpu, _, _, _ in ticks])
+            server = np.concatenate([np.arange(len(cpu)) for _, cpu, _, _, _ in ticks])
+            cpu = np.concatenate([cpu for _, cpu, _, _, _ in ticks])
+            running = np.concatenate([running for _, _, running, _, _ in ticks]).astype(np.int64)
+            if self.keep_raw:
+                conn.executemany(
+                    "INSERT INTO samples (ts, server, cpu, running) VALUES (?, ?, ?, ?)",
+                    zip(ts.tolist(), server.tolist(), cpu.tolist(), running.tolist()))
+            for level, bucket_seconds in ROLLUP_LEVELS.items():
+                conn.executemany(ROLLUP_UPSERT.format(level=level),
+                                 rollup_rows(ts, server, cpu, running, bucket_seconds))
+
+    def prune_raw(self, before):
+        """before(epoch 초) 이전의 원시 샘플을 지웁니다. 롤업은 유지됩니다."""
+        self.flush()
+        with self._reader_lock, self._reader:
+            return self._reader.execute("DELETE FROM samples WHERE ts < ?", (before,)).rowcount
+
+    def query(self, sql, params=()):
+        with self._reader_lock:
+            return self._reader.execute(sql, params).fetchall()
+
+    def server_series(self, server, level='1m', start=0, end=None):
+        """서버 하나의 (버킷, 평균 CPU, 최대 CPU) 시계열을 롤업에서 조회합니다."""
+        if level not in ROLLUP_LEVELS:
+            raise ValueError(f"알 수 없는 롤업 단계입니다: {level}")
+        end = float('inf') if end is None else end
+        return self.query(
+            f"SELECT bucket, cpu_sum / samples, cpu_max FROM rollup_{level} "
+            "WHERE server = ? AND bucket >= ? AND bucket < ? ORDER BY bucket",
+            (server, start, end))
+
+    def cost_series(self, level='1h', start=0, end=None):
+        """플릿 전체의 (버킷, 평균 시간당 비용) 시계열을 롤업에서 조회합니다."""
+        if level not in ROLLUP_LEVELS:
+            raise ValueError(f"알 수 없는 롤업 단계입니다: {level}")
+        end = float('inf') if end is None else end
+        return self.query(
+            f"SELECT r.bucket, SUM(s.cost_per_hour * r.running_samples / r.samples) "
+            f"FROM rollup_{level} r JOIN servers s ON s.id = r.server "
+            "WHERE r.bucket >= ? AND r.bucket < ? GROUP BY r.bucket ORDER BY r.bucket",
+            (start, end))
+
+    def transitions(self, start=0, end=None):
+        """(시각, 서버 이름, 실행 여부) 상태 전이 목록을 조회합니다."""
+        end = float('inf') if end is None else end
+        return self.query(
+            "SELECT t.ts, s.name, t.running FROM transitions t JOIN servers s ON s.id = t.server "
+            "WHERE t.ts >= ? AND t.ts < ? ORDER BY t.ts", (start, end))
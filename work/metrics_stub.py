@@ -0,0 +1,131 @@
+"""AsyncHttpCollector 테스트용 로컬 클라우드 메트릭 API 스텁 서버입니다.
+
+POST /v1/instances/metrics:describe 에 {"instance_ids": [...]}를 보내면
+같은 순서의 {"cpu": [...]}를 돌려줍니다. keep-alive 연결을 지원합니다.
+
+    python metrics_stub.py --port 8081 --latency 0.05
+"""
+import argparse
+import asyncio
+import json
+import random
+import threading
+import zlib
+
+from collector import DESCRIBE_PATH, cancel_other_tasks
+
+
+class StubMetricsServer:
+    """인스턴스 id별로 그럴듯한 CPU 값을 돌려주는 asyncio HTTP 서버입니다."""
+
+    def __init__(self, host='127.0.0.1', port=0, latency=0.0, seed=0):
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.random = random.Random(seed)
+        self.requests = 0
+        self.connections = 0
+        self._server = None
+        self._loop = None
+        self._thread = None
+
+    def cpu_for(self, instance_id):
+        """인스턴스마다 고정된 기준값 주변에서 변동하는 CPU 값을 만듭니다."""
+        base = zlib.crc32(instance_id.encode('utf-8')) % 30 + 1
+        return round(max(0.0, min(100.0, base + self.random.uniform(-3, 3))), 2)
+
+    async def _handle(self, reader, writer):
+        self.connections += 1
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, path, _ = request_line.decode('latin-1').split(' ', 2)
+                length = 0
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    if name.strip().lower() == 'content-length':
+                        length = int(value)
+                body = await reader.readexactly(length)
+                self.requests += 1
+                if self.latency:
+                    await asyncio.sleep(self.latency)
+
+                if method == 'POST' and path == DESCRIBE_PATH:
+                    ids = json.loads(body)['instance_ids']
+                    status, payload = 200, {'cpu': [self.cpu_for(i) for i in ids]}
+                else:
+                    status, payload = 404, {'error': 'not found'}
+                data = json.dumps(payload).encode('utf-8')
+                writer.write((f"HTTP/1.1 {status} {'OK' if status == 200 else 'Not Found'}\r\n"
+                              "Content-Type: application/json\r\n"
+                              f"Content-Length: {len(data)}\r\n"
+                              "Connection: keep-alive\r\n\r\n").encode('latin-1') + data)
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        except asyncio.CancelledError:
+            # 서버 종료 시 처리 중이던 연결은 조용히 닫음
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self):
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self._server
+
+    @property
+    def url(self):
+        return f"http://{self.host}:{self.port}"
+
+    def start_in_thread(self):
+        """백그라운드 스레드에서 서버를 띄우고 URL을 반환합니다."""
+        self._loop = asyncio.new_event_loop()
+        ready = threading.Event()
+
+        def run():
+            asyncio.set_event_loop(self._loop)
+            self._loop.run_until_complete(self.serve())
+            ready.set()
+            self._loop.run_forever()
+
+        self._thread = threading.Thread(target=run, name='metrics-stub', daemon=True)
+        self._thread.start()
+        ready.wait()
+        return self.url
+
+    def stop(self):
+        async def shutdown():
+            self._server.close()
+            await cancel_other_tasks()
+        asyncio.run_coroutine_threadsafe(shutdown(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로컬 클라우드 메트릭 API 스텁 서버")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8081)
+    parser.add_argument('--latency', type=float, default=0.0, help='응답마다 넣을 지연 (초)')
+    args = parser.parse_args()
+
+    stub = StubMetricsServer(args.host, args.port, args.latency)
+
+    async def run():
+        server = await stub.serve()
+        print(f"메트릭 스텁 서버 실행 중: {stub.url}")
+        async with server:
+            await server.serve_forever()
+
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
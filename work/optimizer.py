@@ -0,0 +1,162 @@
+import numpy as np
+
+from fleet import HOURS_PER_MONTH
+
+# CpuHistory에서 저사용 판단에 쓸 수 있는 구간 통계
+USAGE_STATISTICS = {
+    'p95': lambda history, rows: history.p95(rows),
+    'mean': lambda history, rows: history.mean(rows),
+    'max': lambda history, rows: history.max(rows),
+}
+
+
+class OptimizationPolicy:
+    """비용 최적화 시 지켜야 할 조건입니다.
+
+    cpu_threshold: 이 값(%) 미만의 CPU 사용률을 저사용으로 판단
+        (기본 10%는 idle 서버만 걸림, classic 서버의 5분 p95는 25~30%)
+    min_running: 항상 실행 상태로 남겨둘 최소 서버 수
+    min_capacity: 실행 중인 서버 용량 합계의 하한
+    group_floors: 그룹별 최소 실행 서버 수 ({그룹: 개수})
+    usage_statistic: 히스토리가 있을 때 저사용 판단에 쓸 구간 통계 ('p95', 'mean', 'max')
+    min_samples: 히스토리 샘플이 이보다 적은 서버는 판단을 보류
+    """
+
+    def __init__(self, cpu_threshold=10.0, min_running=1, min_capacity=0.0, group_floors=None,
+                 usage_statistic='p95', min_samples=12):
+        if usage_statistic not in USAGE_STATISTICS:
+            raise ValueError(f"알 수 없는 통계입니다: {usage_statistic}")
+        self.cpu_threshold = cpu_threshold
+        self.min_running = min_running
+        self.min_capacity = min_capacity
+        self.group_floors = dict(group_floors or {})
+        self.usage_statistic = usage_statistic
+        self.min_samples = min_samples
+
+    def __repr__(self):
+        return (f"OptimizationPolicy(cpu_threshold={self.cpu_threshold}, "
+                f"min_running={self.min_running}, min_capacity={self.min_capacity}, "
+                f"group_floors={self.group_floors}, usage_statistic={self.usage_statistic!r}, "
+                f"min_samples={self.min_samples})")
+
+
+class OptimizationPlan:
+    """중지할 서버 목록과 예상 절감액입니다."""
+
+    def __init__(self, fleet, indices):
+        self.fleet = fleet
+        self.indices = indices
+        self.hourly_savings = float(fleet.cost_per_hour[indices].sum())
+        self.monthly_savings = self.hourly_savings * HOURS_PER_MONTH
+
+    def __len__(self):
+        return len(self.indices)
+
+    @property
+    def names(self):
+        return [str(name) for name in self.fleet.names[self.indices]]
+
+    def record(self, source='optimize', now=None):
+        """플릿에 이벤트 로그가 붙어 있으면 이 계획을 최적화 결정으로 기록합니다."""
+        if self.fleet.events is not None and len(self.indices):
+            self.fleet.events.record_decision(source, self.indices, self.monthly_savings, now)
+
+    def apply(self, now=None):
+        """계획을 기록하고 포함된 서버를 모두 중지한 뒤, 중지한 인덱스를 반환합니다."""
+        self.record(now=now)
+        return self.fleet.stop_many(self.indices, now=now)
+
+
+def _rank_within_groups(codes):
+    """정렬된 후보 배열에서 각 원소가 자기 그룹 안에서 몇 번째인지 계산합니다."""
+    order = np.argsort(codes, kind='stable')
+    sorted_codes = codes[order]
+    starts = np.flatnonzero(np.r_[True, sorted_codes[1:] != sorted_codes[:-1]])
+    run_lengths = np.diff(np.r_[starts, len(codes)])
+    ranks = np.empty(len(codes), dtype=np.int64)
+    ranks[order] = np.arange(len(codes)) - np.repeat(starts, run_lengths)
+    return ranks
+
+
+def underused_servers(fleet, policy, history=None):
+    """저사용으로 판단되는 실행 중 서버의 인덱스를 반환합니다.
+
+    history(CpuHistory)가 있으면 마지막 샘플 하나 대신 구간 통계를 사용해,
+    잠깐 조용했던 바쁜 서버를 중지하지 않습니다.
+    """
+    running = np.flatnonzero(fleet.running)
+    if history is None:
+        return running[fleet.cpu_usage[running] < policy.cpu_threshold]
+    enough = history.count[running] >= policy.min_samples
+    running = running[enough]
+    usage = USAGE_STATISTICS[policy.usage_statistic](history, running)
+    return running[usage < policy.cpu_threshold]
+
+
+def plan_stops(fleet, policy=None, history=None, candidates=None, pending=None):
+    """한 번의 정렬로 중지할 서버 집합을 고릅니다.
+
+    저사용 서버를 절감액(시간당 비용) 내림차순으로 정렬한 뒤,
+    그룹별 하한, 최소 실행 서버 수, 최소 용량을 넘지 않는 범위에서
+    앞에서부터 선택합니다. 남는 용량에 들어가지 않는 후보는 건너뛰고 더 작은
+    후보를 계속 봅니다. 전체 비용은 O(n log n)입니다.
+
+    candidates(실행 중 서버의 인덱스)를 주면 저사용 판정 없이 그 중에서만 고르며,
+    그룹 하한이나 최소 용량이 없으면 비용은 후보 수에만 비례합니다.
+    플릿에 이상 탐지기(fleet.anomalies)가 붙어 있으면 지금 급증/급감으로 표시된 서버는
+    고르지 않습니다.
+
+    pending에는 중지를 요청했지만 아직 반영되지 않은 서버(예: 일괄 작업 대기열)를 줍니다.
+    이 서버들은 이미 중지된 것으로 보고 한도를 계산하므로, 앞선 중지가 끝나기 전에
+    다시 계획해도 최소 실행 서버 수 등을 넘지 않습니다.
+    """
+    policy = policy or OptimizationPolicy()
+    running = fleet.running
+    running_count = fleet.running_count()
+    if candidates is None:
+        candidates = underused_servers(fleet, policy, history)
+    else:
+        candidates = np.asarray(candidates, dtype=np.int64)
+    if pending is not None and len(pending):
+        pending = np.unique(np.asarray(pending, dtype=np.int64))
+        pending = pending[running[pending]]
+        running = running.copy()
+        running[pending] = False
+        running_count -= len(pending)
+        candidates = candidates[running[candidates]]
+    if fleet.anomalies is not None and len(candidates):
+        # 평소와 다르게 조용한 서버는 곧 다시 바빠질 수 있으므로 중지하지 않음
+        candidates = candidates[~fleet.anomalies.flagged(candidates)]
+    # 절감액이 큰 순서, 같으면 원래 순서
+    candidates = candidates[np.argsort(-fleet.cost_per_hour[candidates], kind='stable')]
+
+    if policy.group_floors and len(candidates):
+        group_names, codes = fleet.group_names, fleet.group_codes
+        running_per_group = np.bincount(codes[running], minlength=len(group_names))
+        floors = np.array([policy.group_floors.get(str(g), 0) for g in group_names])
+        allowed = running_per_group - floors
+        candidate_codes = codes[candidates]
+        keep = _rank_within_groups(candidate_codes) < allowed[candidate_codes]
+        candidates = candidates[keep]
+
+    # 최소 실행 서버 수는 우선순위 앞쪽부터 채우는 한도, 최소 용량은 남는 용량에
+    # 들어가지 않는 후보만 건너뛰고 다음 후보를 계속 봄
+    stop_budget = max(0, running_count - policy.min_running)
+    if policy.min_capacity > 0:
+        capacity_headroom = float(fleet.capacity[running].sum()) - policy.min_capacity
+        keep = _fit_capacity(fleet.capacity[candidates], capacity_headroom, stop_budget)
+        candidates = candidates[keep]
+    selected = candidates[:stop_budget]
+    return OptimizationPlan(fleet, selected)
+
+
+def _fit_capacity(capacities, headroom, limit):
+    """우선순위 순서대로 남는 용량에 들어가는 후보를 최대 limit개 고른 위치를 반환합니다."""
+    keep = []
+    for position, capacity in enumerate(capacities.tolist()):
+        if len(keep) >= limit:
+            break
+        if capacity <= headroom:
+            keep.append(position)
+            headroom -= capacity
+    return np.array(keep, dtype=np.int64)
@@ -0,0 +1,119 @@
+import bisect
+import functools
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+# 지연 시간 히스토그램 버킷 상한 (초), Prometheus 기본 버킷과 비슷한 간격
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+                   0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class LatencyHistogram:
+    """고정 버킷에 관측값을 세는 지연 시간 히스토그램입니다."""
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # 마지막 칸은 +Inf
+        self.count = 0
+        self.total = 0.0
+        self.maximum = 0.0
+        self.last = 0.0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.total += value
+        self.maximum = max(self.maximum, value)
+        self.last = value
+
+    def quantile(self, q):
+        """버킷 상한으로 q 분위수를 추정합니다. 관측된 최댓값을 넘지 않습니다."""
+        if self.count == 0:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.maximum)
+        return self.maximum
+
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+
+class PerfRegistry:
+    """핫 패스의 지연 시간과 틱 지연(drift)을 모으는 저장소입니다.
+
+    여러 스레드에서 기록할 수 있으며, 화면 패널용 요약과
+    Prometheus 텍스트 형식 덤프를 제공합니다.
+    """
+
+    def __init__(self, prefix='finops'):
+        self.prefix = prefix
+        self.histograms = {}
+        self._lock = threading.Lock()
+
+    def observe(self, name, seconds):
+        with self._lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = LatencyHistogram()
+            histogram.observe(seconds)
+
+    @contextmanager
+    def timed(self, name):
+        """with 블록의 실행 시간을 name 히스토그램에 기록합니다."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start)
+
+    def timer(self, name):
+        """함수 실행 시간을 기록하는 데코레이터를 반환합니다."""
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.timed(name):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def record_drift(self, name, due, actual):
+        """예정 시각(due)보다 늦게 실행된 시간을 기록합니다. 두 값은 monotonic 초입니다."""
+        self.observe(name, max(0.0, actual - due))
+
+    def summary(self):
+        """{이름: (횟수, p50, p95, 최대, 마지막)} 요약을 초 단위로 반환합니다."""
+        with self._lock:
+            return {name: (h.count, h.quantile(0.5), h.quantile(0.95), h.maximum, h.last)
+                    for name, h in sorted(self.histograms.items())}
+
+    def to_prometheus(self):
+        """Prometheus 텍스트 노출 형식 문자열을 만듭니다."""
+        lines = []
+        with self._lock:
+            for name, histogram in sorted(self.histograms.items()):
+                metric = f"{self.prefix}_{name}_seconds"
+                lines.append(f"# HELP {metric} {name} latency in seconds")
+                lines.append(f"# TYPE {metric} histogram")
+                cumulative = 0
+                for bound, count in zip(histogram.buckets, histogram.counts):
+                    cumulative += count
+                    lines.append(f'{metric}_bucket{{le="{bound:g}"}} {cumulative}')
+                lines.append(f'{metric}_bucket{{le="+Inf"}} {histogram.count}')
+                lines.append(f"{metric}_sum {histogram.total:.9f}")
+                lines.append(f"{metric}_count {histogram.count}")
+                lines.append(f"# TYPE {metric}_max gauge")
+                lines.append(f"{metric}_max {histogram.maximum:.9f}")
+        return "\n".join(lines) + "\n"
+
+    def dump(self, path):
+        """Prometheus 텍스트 파일을 원자적으로 덮어씁니다 (node_exporter textfile 수집용)."""
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(self.to_prometheus())
+        os.replace(temp_path, path)
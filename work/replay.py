@@ -0,0 +1,264 @@
+"""기록된 사용률 내보내기 파일(CSV/Parquet)을 조금씩 읽어 플릿에 재생합니다.
+
+파일은 timestamp, server, cpu 열을 가진 긴(long) 형식이고 timestamp 순으로
+정렬돼 있어야 합니다. timestamp는 epoch 초 또는 ISO 8601 문자열입니다.
+파일 전체를 메모리에 올리지 않고 CSV는 mmap 위에서 청크 단위로,
+Parquet은 pyarrow의 배치 단위로 읽습니다.
+"""
+import mmap
+from datetime import datetime, timezone
+
+import numpy as np
+
+from collector import MetricsSource
+from fleet import Fleet
+
+DEFAULT_CHUNK_BYTES = 8 * 1024 * 1024
+DEFAULT_COLUMNS = ('timestamp', 'server', 'cpu')
+
+
+def parse_timestamp(text):
+    """epoch 초 또는 ISO 8601 문자열을 epoch 초로 변환합니다."""
+    try:
+        return float(text)
+    except ValueError:
+        return datetime.fromisoformat(text.strip().replace('Z', '+00:00')).timestamp()
+
+
+class CsvUsageReader:
+    """timestamp 순으로 정렬된 CSV를 mmap으로 청크 단위로 읽습니다."""
+
+    def __init__(self, path, chunk_bytes=DEFAULT_CHUNK_BYTES, columns=DEFAULT_COLUMNS):
+        self.path = path
+        self.chunk_bytes = chunk_bytes
+        self._file = open(path, 'rb')
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        header_end = self._mm.find(b'\n')
+        header = self._mm[:header_end if header_end >= 0 else len(self._mm)]
+        names = [name.strip() for name in header.decode('utf-8').split(',')]
+        try:
+            self._positions = [names.index(column) for column in columns]
+        except ValueError:
+            raise ValueError(f"CSV 헤더에 {columns} 열이 모두 있어야 합니다: {names}")
+        self._data_start = len(self._mm) if header_end < 0 else header_end + 1
+        self.offset = self._data_start
+
+    def close(self):
+        self._mm.close()
+        self._file.close()
+
+    def _next_line_start(self, position):
+        if position <= self._data_start or self._mm[position - 1:position] == b'\n':
+            return max(position, self._data_start)
+        newline = self._mm.find(b'\n', position)
+        return len(self._mm) if newline < 0 else newline + 1
+
+    def _line_end(self, start):
+        newline = self._mm.find(b'\n', start)
+        return len(self._mm) if newline < 0 else newline
+
+    def _timestamp_at(self, start):
+        line = self._mm[start:self._line_end(start)].decode('utf-8')
+        return parse_timestamp(line.split(',')[self._positions[0]])
+
+    def seek(self, timestamp):
+        """timestamp 이상인 첫 행으로 이동합니다. 파일 크기에 대해 O(log n)입니다."""
+        size = len(self._mm)
+        low, high = self._data_start, size
+        while low < high:
+            middle = (low + high) // 2
+            start = self._next_line_start(middle)
+            if start >= size:
+                high = middle
+            elif self._timestamp_at(start) < timestamp:
+                low = self._line_end(start) + 1
+            else:
+                high = middle
+        self.offset = self._next_line_start(low)
+
+    def chunks(self):
+        """현재 위치부터 (timestamps, servers, cpu) 배열 묶음을 차례로 내놓습니다."""
+        size = len(self._mm)
+        ts_col, server_col, cpu_col = self._positions
+        while self.offset < size:
+            end = min(self.offset + self.chunk_bytes, size)
+            if end < size:
+                last_newline = self._mm.rfind(b'\n', self.offset, end)
+                end = self._line_end(self.offset) + 1 if last_newline < 0 else last_newline + 1
+            lines = self._mm[self.offset:end].decode('utf-8').splitlines()
+            self.offset = end
+            rows = [line.split(',') for line in lines if line.strip()]
+            if not rows:
+                continue
+            yield (np.array([parse_timestamp(row[ts_col]) for row in rows]),
+                   [row[server_col].strip() for row in rows],
+                   np.array([float(row[cpu_col]) for row in rows]))
+
+
+class ParquetUsageReader:
+    """Parquet 파일을 pyarrow 배치 단위로 읽습니다. pyarrow가 필요합니다."""
+
+    def __init__(self, path, batch_rows=500000, columns=DEFAULT_COLUMNS):
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError("Parquet 재생에는 pyarrow가 필요합니다: pip install pyarrow")
+        self.path = path
+        self.batch_rows = batch_rows
+        self.columns = list(columns)
+        self._file = pq.ParquetFile(path)
+        self._first_row_group = 0
+        self._skip_before = None
+
+    def close(self):
+        pass
+
+    def seek(self, timestamp):
+        """timestamp가 들어 있을 수 있는 첫 row group부터 읽도록 합니다."""
+        metadata = self._file.metadata
+        ts_index = self._file.schema_arrow.get_field_index(self.columns[0])
+        self._first_row_group = metadata.num_row_groups
+        for group in range(metadata.num_row_groups):
+            statistics = metadata.row_group(group).column(ts_index).statistics
+            if statistics is None or not statistics.has_min_max or \
+                    _to_epoch(statistics.max) >= timestamp:
+                self._first_row_group = group
+                break
+        self._skip_before = timestamp
+
+    def chunks(self):
+        groups = range(self._first_row_group, self._file.metadata.num_row_groups)
+        for batch in self._file.iter_batches(batch_size=self.batch_rows, row_groups=groups,
+                                             columns=self.columns):
+            ts_column, server_column, cpu_column = (batch.column(i) for i in range(3))
+            if hasattr(ts_column.type, 'unit'):
+                # Arrow timestamp 열은 단위(s/ms/us/ns)의 정수로 저장됨
+                timestamps = ts_column.cast('int64').to_numpy() / _units_per_second(ts_column.type)
+            else:
+                timestamps = np.asarray(ts_column.to_numpy(zero_copy_only=False), dtype=np.float64)
+            servers = server_column.to_pylist()
+            cpu = np.asarray(cpu_column.to_numpy(zero_copy_only=False), dtype=np.float64)
+            if self._skip_before is not None:
+                keep = timestamps >= self._skip_before
+                if not keep.all():
+                    timestamps, cpu = timestamps[keep], cpu[keep]
+                    servers = [s for s, k in zip(servers, keep) if k]
+            yield timestamps, servers, cpu
+
+
+def _units_per_second(arrow_type):
+    return {'s': 1, 'ms': 10**3, 'us': 10**6, 'ns': 10**9}[arrow_type.unit]
+
+
+def _to_epoch(value):
+    if isinstance(value, datetime):
+        # Parquet 통계의 timestamp는 tz 정보 없는 UTC 값
+        return (value if value.tzinfo else value.replace(tzinfo=timezone.utc)).timestamp()
+    return float(value)
+
+
+def open_usage_file(path, **kwargs):
+    """확장자로 CSV/Parquet 리더를 고릅니다."""
+    if path.lower().endswith(('.parquet', '.pq')):
+        return ParquetUsageReader(path, **kwargs)
+    return CsvUsageReader(path, **kwargs)
+
+
+def iter_ticks(reader):
+    """청크 경계와 무관하게 같은 timestamp의 행을 한 틱으로 묶어 내놓습니다.
+
+    (timestamp, servers, cpu)를 차례로 yield하며, 한 번에 청크 하나 분량만 메모리에 둡니다.
+    """
+    pending = None
+    for timestamps, servers, cpu in reader.chunks():
+        if not len(timestamps):
+            continue
+        boundaries = np.flatnonzero(np.diff(timestamps)) + 1
+        starts = np.r_[0, boundaries]
+        ends = np.r_[boundaries, len(timestamps)]
+        for start, end in zip(starts, ends):
+            group = (timestamps[start], servers[start:end], cpu[start:end])
+            if pending is not None:
+                if pending[0] == group[0]:
+                    group = (group[0], pending[1] + group[1], np.r_[pending[2], group[2]])
+                else:
+                    yield pending
+            pending = group
+    if pending is not None:
+        yield pending
+
+
+class ReplaySource(MetricsSource):
+    """기록 파일을 엔진 틱에 맞춰 재생하는 메트릭 소스입니다.
+
+    엔진 틱 한 번마다 기록 시간이 tick_seconds * speed만큼 진행되고,
+    그 사이의 기록 틱을 모두 반영합니다 (서버별 마지막 값이 남음).
+    """
+
+    def __init__(self, reader, speed=1.0, tick_seconds=5.0, start=None):
+        self.reader = reader
+        self.speed = speed
+        self.tick_seconds = tick_seconds
+        self.clock = None
+        self.exhausted = False
+        self.unknown_servers = 0
+        self._index = None
+        self._index_fleet = None
+        if start is not None:
+            self.seek(start)
+        self._ticks = iter_ticks(reader)
+        self._next = None
+
+    def seek(self, timestamp):
+        """재생 위치를 timestamp로 옮깁니다."""
+        self.reader.seek(timestamp)
+        self._ticks = iter_ticks(self.reader)
+        self._next = None
+        self.clock = None
+        self.exhausted = False
+
+    def _server_index(self, fleet):
+        if self._index_fleet is not fleet:
+            self._index = {str(name): i for i, name in enumerate(fleet.names)}
+            self._index_fleet = fleet
+        return self._index
+
+    def _peek(self):
+        if self._next is None and not self.exhausted:
+            self._next = next(self._ticks, None)
+            self.exhausted = self._next is None
+        return self._next
+
+    def update(self, fleet, now):
+        first = self._peek()
+        if first is None:
+            return
+        if self.clock is None:
+            self.clock = first[0]
+        else:
+            self.clock += self.tick_seconds * self.speed
+
+        index = self._server_index(fleet)
+        while self._peek() is not None and self._next[0] <= self.clock:
+            _, servers, cpu = self._next
+            self._next = None
+            positions = np.array([index.get(name, -1) for name in servers], dtype=np.int64)
+            known = positions >= 0
+            self.unknown_servers += int(len(positions) - np.count_nonzero(known))
+            fleet.apply_samples(positions[known], cpu[known], now=now)
+
+    def close(self):
+        self.reader.close()
+
+
+def fleet_for_replay(path, cost_per_hour=10.0, **kwargs):
+    """기록 파일의 첫 틱에 나오는 서버들로 플릿을 만듭니다."""
+    reader = open_usage_file(path, **kwargs)
+    try:
+        first = next(iter_ticks(reader), None)
+    finally:
+        reader.close()
+    if first is None:
+        raise ValueError(f"{path}에 사용률 기록이 없습니다.")
+    _, servers, cpu = first
+    return Fleet(servers, cpu, np.full(len(servers), cost_per_hour))
@@ -0,0 +1,159 @@
+"""관측한 최대 부하에 맞춰 더 작은 인스턴스 유형으로 바꾸는 다운사이징 추천입니다.
+
+카탈로그는 (이름, vCPU, 메모리 GiB, 시간당 가격) 목록이며, 만들 때 한 번
+"vCPU가 v 이상이고 메모리가 m 이상인 유형 중 가장 싼 것"을 vCPU 단계 × 메모리 단계
+표로 미리 계산해 둡니다. 서버마다 필요한 용량은 두 단계 배열에 대한
+이진 탐색(np.searchsorted) 두 번과 표 조회 한 번으로 찾으므로, 플릿 전체 추천이
+카탈로그를 훑지 않는 벡터 연산 한 번입니다.
+"""
+import csv
+
+import numpy as np
+
+from fleet import HOURS_PER_MONTH
+from optimizer import USAGE_STATISTICS
+
+# 기본 카탈로그: 범용(gp), 컴퓨팅(co, vCPU당 2GiB), 메모리(mo, vCPU당 8GiB) 계열
+DEFAULT_CATALOG = tuple(
+    (f"{family}.{vcpu}x", vcpu, vcpu * memory_per_vcpu, round(vcpu * price_per_vcpu, 4))
+    for family, memory_per_vcpu, price_per_vcpu in (('co', 2, 0.0425), ('gp', 4, 0.048),
+                                                    ('mo', 8, 0.063))
+    for vcpu in (2, 4, 8, 16, 32, 48, 64, 96, 128, 192)
+)
+
+CATALOG_FIELDS = ('name', 'vcpu', 'memory_gib', 'hourly_price')
+
+
+class InstanceCatalog:
+    """인스턴스 유형 목록과 용량별 최저가 색인입니다. 유형은 가격 오름차순으로 보관합니다."""
+
+    def __init__(self, entries=DEFAULT_CATALOG):
+        entries = sorted(entries, key=lambda entry: (float(entry[3]), str(entry[0])))
+        if not entries:
+            raise ValueError("카탈로그가 비어 있습니다.")
+        self.names = np.array([str(entry[0]) for entry in entries])
+        self.vcpu = np.array([entry[1] for entry in entries], dtype=np.float64)
+        self.memory = np.array([entry[2] for entry in entries], dtype=np.float64)
+        self.price = np.array([entry[3] for entry in entries], dtype=np.float64)
+        if (self.vcpu <= 0).any() or (self.memory <= 0).any() or (self.price <= 0).any():
+            raise ValueError("vCPU, 메모리, 가격은 모두 양수여야 합니다.")
+
+        self.vcpu_levels = np.unique(self.vcpu)
+        self.memory_levels = np.unique(self.memory)
+        # cheapest[i, j]: vCPU >= vcpu_levels[i], 메모리 >= memory_levels[j]인 최저가 유형 (없으면 -1)
+        cheapest = np.full((len(self.vcpu_levels), len(self.memory_levels)), -1, dtype=np.int64)
+        vcpu_rank = np.searchsorted(self.vcpu_levels, self.vcpu)
+        memory_rank = np.searchsorted(self.memory_levels, self.memory)
+        # 비싼 유형부터 채워서 더 싼 유형이 덮어쓰도록 함
+        for index in range(len(entries) - 1, -1, -1):
+            cheapest[:vcpu_rank[index] + 1, :memory_rank[index] + 1] = index
+        self._cheapest = cheapest
+
+    @classmethod
+    def from_csv(cls, path):
+        """name, vcpu, memory_gib, hourly_price 열이 있는 CSV에서 카탈로그를 읽습니다."""
+        with open(path, newline='', encoding='utf-8') as csv_file:
+            reader = csv.DictReader(csv_file)
+            missing = set(CATALOG_FIELDS) - set(reader.fieldnames or ())
+            if missing:
+                raise ValueError(f"카탈로그에 없는 열: {', '.join(sorted(missing))}")
+            return cls([(row['name'], float(row['vcpu']), float(row['memory_gib']),
+                         float(row['hourly_price'])) for row in reader])
+
+    def __len__(self):
+        return len(self.names)
+
+    def cheapest_fitting(self, vcpu, memory):
+        """vCPU와 메모리 요구량을 모두 만족하는 최저가 유형의 인덱스를 반환합니다.
+
+        맞는 유형이 없으면 -1입니다.
+        """
+        vcpu_rank = np.searchsorted(self.vcpu_levels, vcpu, side='left')
+        memory_rank = np.searchsorted(self.memory_levels, memory, side='left')
+        fits = (vcpu_rank < len(self.vcpu_levels)) & (memory_rank < len(self.memory_levels))
+        found = self._cheapest[np.minimum(vcpu_rank, len(self.vcpu_levels) - 1),
+                               np.minimum(memory_rank, len(self.memory_levels) - 1)]
+        return np.where(fits, found, -1)
+
+    def type_for_price(self, hourly_price):
+        """시간당 비용으로 현재 유형을 추정합니다. 그 비용 이하인 가장 비싼 유형입니다.
+
+        가장 싼 유형보다 싸면 가장 싼 유형으로 봅니다.
+        """
+        return np.maximum(np.searchsorted(self.price, hourly_price, side='right') - 1, 0)
+
+
+class RightsizingPlan:
+    """서버별 다운사이징 제안과 예상 절감액입니다.
+
+    indices, current, suggested, peak, saving은 같은 길이의 배열이며, 절감액이 큰 순서입니다.
+    """
+
+    def __init__(self, fleet, catalog, indices, current, suggested, peak, saving):
+        self.fleet = fleet
+        self.catalog = catalog
+        self.indices = indices
+        self.current = current
+        self.suggested = suggested
+        self.peak = peak
+        self.saving = saving  # 서버별 시간당 절감액
+        self.hourly_savings = float(self.saving.sum())
+        self.monthly_savings = self.hourly_savings * HOURS_PER_MONTH
+
+    def __len__(self):
+        return len(self.indices)
+
+    @property
+    def names(self):
+        return [str(name) for name in self.fleet.names[self.indices]]
+
+    def rows(self, limit=None):
+        """(서버 이름, 현재 유형, 제안 유형, 최대 CPU, 월 절감액) 목록을 반환합니다."""
+        count = len(self) if limit is None else min(limit, len(self))
+        catalog = self.catalog
+        return [(str(self.fleet.names[self.indices[i]]), str(catalog.names[self.current[i]]),
+                 str(catalog.names[self.suggested[i]]), float(self.peak[i]),
+                 float(self.saving[i]) * HOURS_PER_MONTH)
+                for i in range(count)]
+
+
+def recommend_rightsizing(fleet, history, catalog=None, statistic='max', target_utilization=80.0,
+                          min_samples=12, current_types=None, exclude=None, scale_memory=False):
+    """실행 중인 서버 전체에 대해 한 번에 다운사이징 제안을 만듭니다.
+
+    서버의 현재 유형은 current_types(카탈로그 인덱스 배열)로 주거나, 없으면
+    시간당 비용으로 추정합니다. 구간 통계(statistic)로 본 최대 CPU가 새 유형에서
+    target_utilization(%)을 넘지 않도록 필요한 vCPU를 구합니다. 메모리 사용률은
+    수집하지 않으므로 현재 메모리를 그대로 필요량으로 보며, scale_memory를 켜면
+    CPU와 같은 비율로 줄인 값을 씁니다(메모리를 많이 쓰는 서버에는 맞지 않음).
+    예상 비용은 현재 비용을 두 유형의 정가 비율로 줄인 값이며, 더 싼 유형이 있을 때만
+    제안합니다. exclude에 있는 서버(예: 중지 예정)는 뺍니다.
+    """
+    if statistic not in USAGE_STATISTICS:
+        raise ValueError(f"알 수 없는 통계입니다: {statistic}")
+    if not 0 < target_utilization <= 100:
+        raise ValueError("target_utilization은 0 초과 100 이하여야 합니다.")
+    catalog = catalog or InstanceCatalog()
+    rows = np.flatnonzero(fleet.running)
+    if exclude is not None and len(exclude):
+        rows = rows[~np.isin(rows, exclude)]
+    rows = rows[history.count[rows] >= min_samples]
+    peak = USAGE_STATISTICS[statistic](history, rows)
+
+    if current_types is None:
+        current = catalog.type_for_price(fleet.cost_per_hour[rows])
+    else:
+        current = np.asarray(current_types, dtype=np.int64)[rows]
+    scale = peak / target_utilization
+    memory = catalog.memory[current]
+    if scale_memory:
+        memory = memory * scale
+    suggested = catalog.cheapest_fitting(catalog.vcpu[current] * scale, memory)
+
+    # 할인 등으로 실제 비용이 정가와 다를 수 있으므로 정가 비율만큼 줄어든다고 봄
+    ratio = catalog.price[np.maximum(suggested, 0)] / catalog.price[current]
+    saving = fleet.cost_per_hour[rows] * (1.0 - ratio)
+    keep = (suggested >= 0) & (suggested != current) & (saving > 0)
+    order = np.argsort(-saving[keep], kind='stable')
+    return RightsizingPlan(fleet, catalog, rows[keep][order], current[keep][order],
+                           suggested[keep][order], peak[keep][order], saving[keep][order])
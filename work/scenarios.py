@@ -0,0 +1,224 @@
+"""최적화 정책 파라미터 조합별로 같은 플릿 기록을 재생해 비교합니다.
+
+같은 CPU 수요 기록(trace)을 정책 그리드의 각 조합으로 재생하고,
+프로세스 풀에 나눠 실행한 뒤 절감액과 용량 위험을 순위표로 보여줍니다.
+
+    python scenarios.py --size 2000 --ticks 1440 --workers 4
+    python scenarios.py --db metrics.db
+"""
+import argparse
+import itertools
+import os
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from engine import SimulationEngine
+from fleet import HOURS_PER_MONTH, Fleet
+from history import CpuHistory
+from optimizer import USAGE_STATISTICS, OptimizationPolicy, plan_stops
+from workload import PROFILES, parse_profiles
+
+DEFAULT_GRID = {
+    'cpu_threshold': [5.0, 10.0, 15.0, 20.0],
+    'min_running': [1],
+    'min_capacity': [0.0],
+    'usage_statistic': ['p95', 'mean'],
+}
+
+
+class FleetTrace:
+    """재생할 플릿 기록입니다. demand는 (틱 수, 서버 수) CPU 수요 배열입니다.
+
+    수요는 서버 실행 여부와 무관한 값이라, 중지된 서버의 몫은
+    남은 서버가 나눠 받는 것으로 보고 용량 위험을 계산합니다.
+    """
+
+    def __init__(self, demand, cost_per_hour, capacity=None, groups=None, tick_seconds=5.0):
+        self.demand = np.asarray(demand, dtype=np.float32)
+        self.cost_per_hour = np.asarray(cost_per_hour, dtype=np.float64)
+        size = self.demand.shape[1]
+        self.capacity = np.ones(size) if capacity is None else np.asarray(capacity, dtype=np.float64)
+        self.groups = np.full(size, 'default') if groups is None else np.asarray(groups, dtype=str)
+        self.tick_seconds = tick_seconds
+
+    @property
+    def ticks(self):
+        return self.demand.shape[0]
+
+    @property
+    def size(self):
+        return self.demand.shape[1]
+
+
+def simulate_trace(size, ticks, seed=0, tick_seconds=5.0, profiles=None):
+    """헤드리스 엔진으로 모든 서버가 켜진 상태의 수요 기록을 만듭니다.
+
+    profiles는 Fleet.random과 같은 {워크로드 프로파일: 비율}입니다.
+    """
+    fleet = Fleet.random(size, seed=seed, profiles=profiles)
+    engine = SimulationEngine(fleet, tick_seconds=tick_seconds, start_time=0)
+    demand = np.empty((ticks, size), dtype=np.float32)
+    for t in range(ticks):
+        engine.tick()
+        demand[t] = fleet.cpu_usage
+    return FleetTrace(demand, fleet.cost_per_hour, fleet.capacity, fleet.groups, tick_seconds)
+
+
+def load_trace(db_path, tick_seconds=5.0):
+    """MetricsStore가 기록한 원시 샘플로부터 수요 기록을 만듭니다.
+
+    기록 중 중지돼 있던 서버의 수요는 알 수 없으므로 직전 실행 값으로 채웁니다.
+    """
+    conn = sqlite3.connect(db_path)
+    try:
+        costs = np.array([row[0] for row in conn.execute(
+            "SELECT cost_per_hour FROM servers ORDER BY id")], dtype=np.float64)
+        rows = np.array(conn.execute(
+            "SELECT ts, server, cpu, running FROM samples ORDER BY ts, server").fetchall(),
+            dtype=np.float64).reshape(-1, 4)
+    finally:
+        conn.close()
+    if not len(rows):
+        raise ValueError(f"{db_path}에 원시 샘플이 없습니다.")
+    times, tick_index = np.unique(rows[:, 0], return_inverse=True)
+    demand = np.full((len(times), len(costs)), np.nan, dtype=np.float32)
+    live = rows[:, 3] > 0
+    demand[tick_index.ravel()[live], rows[live, 1].astype(np.int64)] = rows[live, 2]
+    # 앞 방향으로 채우고, 처음부터 비어 있던 값은 0으로 둠
+    for t in range(1, len(times)):
+        gaps = np.isnan(demand[t])
+        demand[t, gaps] = demand[t - 1, gaps]
+    np.nan_to_num(demand, copy=False)
+    return FleetTrace(demand, costs, tick_seconds=tick_seconds)
+
+
+def policy_grid(**choices):
+    """파라미터별 후보 목록의 모든 조합을 OptimizationPolicy 인자 dict로 만듭니다."""
+    names = sorted(choices)
+    return [dict(zip(names, values)) for values in itertools.product(*(choices[n] for n in names))]
+
+
+def replay(trace, params, optimize_every=12, overload_threshold=0.8, window=60):
+    """정책 하나로 기록을 재생하고 절감액과 용량 위험 지표를 반환합니다."""
+    policy = OptimizationPolicy(**params)
+    names = [f"Server-{i+1}" for i in range(trace.size)]
+    fleet = Fleet(names, trace.demand[0], trace.cost_per_hour,
+                  capacity=trace.capacity, groups=trace.groups)
+    history = CpuHistory(trace.size, window)
+    total_capacity = float(trace.capacity.sum())
+
+    cost_sum = 0.0
+    peak_utilization = 0.0
+    overloaded_ticks = 0
+    for t in range(trace.ticks):
+        demand = trace.demand[t]
+        fleet.cpu_usage[:] = np.where(fleet.running, demand, 0)
+        history.record(np.flatnonzero(fleet.running), demand[fleet.running])
+
+        # 전체 수요를 실행 중인 용량으로 감당할 때의 사용률
+        running_capacity = float(trace.capacity[fleet.running].sum())
+        needed = float(np.dot(demand, trace.capacity)) / 100.0
+        utilization = needed / running_capacity if running_capacity else float('inf')
+        peak_utilization = max(peak_utilization, utilization)
+        overloaded_ticks += utilization > overload_threshold
+        cost_sum += fleet.hourly_cost()
+
+        if (t + 1) % optimize_every == 0:
+            plan_stops(fleet, policy, history).apply()
+
+    baseline_hourly = float(trace.cost_per_hour.sum())
+    average_hourly = cost_sum / trace.ticks
+    return {
+        'params': params,
+        'monthly_savings': (baseline_hourly - average_hourly) * HOURS_PER_MONTH,
+        'stopped': int(len(fleet) - fleet.running_count()),
+        'final_capacity_ratio': float(trace.capacity[fleet.running].sum()) / total_capacity,
+        'peak_utilization': peak_utilization,
+        'overload_fraction': overloaded_ticks / trace.ticks,
+    }
+
+
+_worker_trace = None
+
+
+def _init_worker(trace):
+    global _worker_trace
+    _worker_trace = trace
+
+
+def _replay_in_worker(args):
+    params, options = args
+    return replay(_worker_trace, params, **options)
+
+
+def sweep(trace, grid, workers=None, **options):
+    """그리드의 모든 정책을 프로세스 풀에서 재생합니다.
+
+    기록은 워커마다 한 번만 전달되고, 각 작업에는 정책 인자만 넘깁니다.
+    """
+    jobs = [(params, options) for params in grid]
+    if workers == 1:
+        _init_worker(trace)
+        return [_replay_in_worker(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(trace,)) as pool:
+        return list(pool.map(_replay_in_worker, jobs))
+
+
+def rank(results, max_overload=0.0):
+    """용량 위험이 max_overload 이하인 결과를 절감액 순으로 앞에, 나머지는 위험 순으로 뒤에 둡니다."""
+    safe = [r for r in results if r['overload_fraction'] <= max_overload]
+    risky = [r for r in results if r['overload_fraction'] > max_overload]
+    safe.sort(key=lambda r: -r['monthly_savings'])
+    risky.sort(key=lambda r: (r['overload_fraction'], -r['monthly_savings']))
+    return safe + risky
+
+
+def format_table(ranked, max_overload=0.0):
+    lines = [f"{'순위':>4} {'월 절감액($)':>14} {'중지':>6} {'최종 용량':>9} {'최대 사용률':>10} "
+             f"{'과부하 비율':>10}  정책"]
+    for position, r in enumerate(ranked, 1):
+        marker = '' if r['overload_fraction'] <= max_overload else ' (위험)'
+        params = ', '.join(f"{k}={v}" for k, v in sorted(r['params'].items()))
+        lines.append(f"{position:>4} {r['monthly_savings']:>14,.2f} {r['stopped']:>6} "
+                     f"{r['final_capacity_ratio']:>9.1%} {r['peak_utilization']:>10.1%} "
+                     f"{r['overload_fraction']:>10.1%}  {params}{marker}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="최적화 정책 what-if 스윕")
+    parser.add_argument('--db', help='재생할 MetricsStore 데이터베이스 (없으면 시뮬레이션)')
+    parser.add_argument('--size', type=int, default=1000, help='시뮬레이션 서버 수')
+    parser.add_argument('--ticks', type=int, default=720, help='시뮬레이션 틱 수 (5초 단위)')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--profiles', nargs='+', metavar='NAME=RATIO',
+                        help=f"시뮬레이션 워크로드 비율 (예: diurnal=0.6 bursty=0.2), 프로파일: {', '.join(PROFILES)}")
+    parser.add_argument('--thresholds', type=float, nargs='+', default=DEFAULT_GRID['cpu_threshold'])
+    parser.add_argument('--min-running', type=int, nargs='+', default=DEFAULT_GRID['min_running'])
+    parser.add_argument('--min-capacity', type=float, nargs='+', default=DEFAULT_GRID['min_capacity'])
+    parser.add_argument('--statistics', nargs='+', default=DEFAULT_GRID['usage_statistic'],
+                        choices=list(USAGE_STATISTICS))
+    parser.add_argument('--optimize-every', type=int, default=12, help='최적화 주기 (틱)')
+    parser.add_argument('--overload', type=float, default=0.8, help='과부하로 볼 사용률')
+    parser.add_argument('--max-overload', type=float, default=0.0, help='허용할 과부하 틱 비율')
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    args = parser.parse_args(argv)
+
+    try:
+        profiles = parse_profiles(args.profiles)
+    except ValueError as error:
+        parser.error(str(error))
+    trace = (load_trace(args.db) if args.db
+             else simulate_trace(args.size, args.ticks, args.seed, profiles=profiles))
+    grid = policy_grid(cpu_threshold=args.thresholds, min_running=args.min_running,
+                       min_capacity=args.min_capacity, usage_statistic=args.statistics)
+    results = sweep(trace, grid, workers=args.workers, optimize_every=args.optimize_every,
+                    overload_threshold=args.overload)
+    print(format_table(rank(results, args.max_overload), args.max_overload))
+
+
+if __name__ == "__main__":
+    main()
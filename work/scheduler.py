@@ -0,0 +1,191 @@
+import heapq
+import itertools
+from collections import deque
+
+import numpy as np
+
+from fleet import HOURS_PER_MONTH
+from optimizer import OptimizationPolicy, plan_stops
+
+
+class AutoOptimizer:
+    """플릿을 계속 지켜보며 저사용 서버를 중지하고, 부하가 높아지면 다시 시작하는 스케줄러입니다.
+
+    fleet.track_changes()의 DirtySet으로 마지막 패스 이후 CPU가 크게 바뀌었거나
+    시작/중지된 서버만 평가합니다. 유휴 상태가 된 서버는 dwell초 뒤 다시 확인하도록
+    힙에 예약하므로, 한 번의 패스 비용은 변경 수와 만기된 예약 수에 비례합니다.
+
+    서버가 중지와 시작을 오가지 않도록 다음 조건을 지킵니다.
+      - CPU가 policy.cpu_threshold 미만이면 유휴 상태가 되고, cpu_threshold + band를
+        넘어야 유휴 상태에서 벗어남 (그 사이 값에서는 이전 상태 유지)
+      - 유휴 상태가 dwell초 동안 이어져야 중지
+      - 시작/중지된 서버는 (사용자가 바꾼 경우 포함) cooldown초 동안 다시 건드리지 않음
+      - start_above를 주면 실행 중 서버의 평균 CPU가 그 값을 넘을 때 이 스케줄러가
+        중지한 서버를 오래된 것부터 max_starts개씩 다시 시작하고, 평균이
+        start_above - band 아래로 내려올 때까지는 중지하지 않음
+
+    apply(action, indices, now)는 실제 시작/중지를 수행하며, 기본값은 플릿에 바로
+    반영합니다. 일괄 작업 실행기로 넘기는 경우처럼 비동기여도 되며, 이때는
+    pending()이 중지를 요청했지만 아직 반영되지 않은 서버를 돌려줘야 정책 한도
+    (min_running 등)를 계산할 때 그 서버들을 이미 중지된 것으로 셉니다.
+    apply는 fleet.lock을 잡은 채로 호출됩니다.
+    플릿의 DirtySet은 하나의 스케줄러만 소비해야 합니다.
+    """
+
+    def __init__(self, fleet, policy=None, band=5.0, dwell=300.0, cooldown=900.0,
+                 start_above=None, max_starts=1, change_threshold=1.0, apply=None,
+                 pending=None):
+        if band < change_threshold:
+            raise ValueError("band는 change_threshold보다 작을 수 없습니다.")
+        self.fleet = fleet
+        self.policy = policy or OptimizationPolicy()
+        self.band = band
+        self.dwell = dwell
+        self.cooldown = cooldown
+        self.start_above = start_above
+        self.max_starts = max_starts
+        self.apply = apply if apply is not None else self.apply_to_fleet
+        self.pending = pending
+        self.enabled = True
+        self.passes = 0
+        self.stopped_count = 0
+        self.started_count = 0
+
+        size = len(fleet)
+        with fleet.lock:
+            self.dirty = fleet.track_changes(change_threshold)
+            self.dirty.mark(np.arange(size))
+            self._was_running = fleet.running.copy()
+        self.idle_since = np.full(size, np.nan)
+        self.changed_at = np.full(size, -np.inf)
+        # 평가 시점의 CPU (중지된 서버는 0)와 그 합계로 평균 부하를 증분 계산
+        self._load = np.zeros(size)
+        self._load_total = 0.0
+        self._due = []           # (만기 시각, 순번, 서버 배열, 유휴 시작 시각 배열)
+        self._sequence = itertools.count()
+        self._stopped = deque()  # 이 스케줄러가 중지한 서버 (오래된 순)
+
+    def attach(self, engine):
+        """엔진의 틱마다 한 번씩 패스를 실행하도록 구독합니다."""
+        return engine.subscribe(lambda e: self.run_pass(e.now) if self.enabled else None)
+
+    def mean_load(self):
+        """마지막으로 평가한 값 기준, 실행 중 서버의 평균 CPU입니다."""
+        running = self.fleet.running_count()
+        return self._load_total / running if running else 0.0
+
+    def run_pass(self, now):
+        """바뀐 서버를 평가하고, (중지를 요청한 서버, 시작을 요청한 서버)를 반환합니다."""
+        fleet = self.fleet
+        with fleet.lock:
+            self._evaluate(self.dirty.drain(fleet.cpu_usage), now)
+            load = self.mean_load()
+            empty = np.empty(0, dtype=np.int64)
+            if self.start_above is None:
+                starts, stops = empty, self._take_stops(now)
+            elif load > self.start_above:
+                starts, stops = self._take_starts(now), empty
+            elif load > self.start_above - self.band:
+                # 시작과 중지 사이의 구간에서는 아무것도 하지 않음
+                starts, stops = empty, empty
+            else:
+                starts, stops = empty, self._take_stops(now)
+            self.changed_at[stops] = now
+            self.changed_at[starts] = now
+            self.idle_since[stops] = np.nan
+            self._stopped.extend(stops.tolist())
+            if fleet.events is not None:
+                # 중지는 절감액, 다시 시작은 그만큼의 추가 비용(음수)으로 기록
+                for action, indices, sign in (('stop', stops, 1), ('start', starts, -1)):
+                    if len(indices):
+                        monthly = float(fleet.cost_per_hour[indices].sum()) * HOURS_PER_MONTH
+                        fleet.events.record_decision('auto', indices, sign * monthly, now,
+                                                     action=action)
+            # 다른 경로의 계획이 이 요청을 대기 중으로 볼 수 있도록 잠금 안에서 넘김
+            if len(stops):
+                self.apply('stop', stops, now)
+            if len(starts):
+                self.apply('start', starts, now)
+        self.passes += 1
+        self.stopped_count += len(stops)
+        self.started_count += len(starts)
+        return stops, starts
+
+    def apply_to_fleet(self, action, indices, now):
+        with self.fleet.lock:
+            if action == 'stop':
+                self.fleet.stop_many(indices, now=now)
+            else:
+                for index in indices:
+                    self.fleet.start(index, now=now)
+
+    def _evaluate(self, rows, now):
+        if not len(rows):
+            return
+        fleet = self.fleet
+        running = fleet.running[rows]
+        cpu = fleet.cpu_usage[rows]
+
+        # 누가 바꿨든 상태가 바뀐 서버는 그때부터 쿨다운
+        flipped = rows[running != self._was_running[rows]]
+        self.changed_at[flipped] = np.maximum(self.changed_at[flipped], now)
+        self._was_running[rows] = running
+
+        load = np.where(running, cpu, 0.0)
+        self._load_total += float(load.sum() - self._load[rows].sum())
+        self._load[rows] = load
+
+        threshold = self.policy.cpu_threshold
+        busy = ~running | (cpu > threshold + self.band)
+        self.idle_since[rows[busy]] = np.nan
+        entering = rows[running & (cpu < threshold) & np.isnan(self.idle_since[rows])]
+        if len(entering):
+            self.idle_since[entering] = now
+            self._schedule(now + self.dwell, entering, np.full(len(entering), now))
+
+    def _schedule(self, due, rows, since):
+        heapq.heappush(self._due, (due, next(self._sequence), rows, since))
+
+    def _take_stops(self, now):
+        """유휴 상태가 dwell초 이어진 서버 중 정책이 허용하는 만큼 고릅니다."""
+        rows, since = [], []
+        while self._due and self._due[0][0] <= now:
+            _, _, batch, batch_since = heapq.heappop(self._due)
+            rows.append(batch)
+            since.append(batch_since)
+        if not rows:
+            return np.empty(0, dtype=np.int64)
+        rows, since = np.concatenate(rows), np.concatenate(since)
+
+        # 그 사이 바빠졌거나 다시 유휴가 된 서버의 옛 예약은 버림
+        current = (self.idle_since[rows] == since) & self.fleet.running[rows]
+        rows, since = rows[current], since[current]
+
+        ready_at = self.changed_at[rows] + self.cooldown
+        cooling = ready_at > now
+        if cooling.any():
+            self._schedule(ready_at[cooling].max(), rows[cooling], since[cooling])
+            rows, since = rows[~cooling], since[~cooling]
+
+        pending = self.pending() if self.pending is not None else None
+        selected = plan_stops(self.fleet, self.policy, candidates=rows, pending=pending).indices
+        # 정책 한도 때문에 남은 서버는 dwell초 뒤 다시 시도
+        rejected = ~np.isin(rows, selected)
+        if rejected.any():
+            self._schedule(now + self.dwell, rows[rejected], since[rejected])
+        return selected
+
+    def _take_starts(self, now):
+        """이 스케줄러가 중지한 서버를 오래된 것부터 max_starts개까지 고릅니다."""
+        starts = []
+        while self._stopped and len(starts) < self.max_starts:
+            index = self._stopped[0]
+            if self.changed_at[index] + self.cooldown > now:
+                # 중지한 순서대로 쌓이므로 뒤쪽도 아직 쿨다운 중
+                break
+            if self.fleet.running[index]:
+                # 중지가 실패했거나 다른 경로로 이미 시작된 서버
+                self._stopped.popleft()
+            else:
+                starts.append(self._stopped.popleft())
+        return np.array(starts, dtype=np.int64)
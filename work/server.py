@@ -0,0 +1,66 @@
+import random
+import time
+from datetime import datetime
+
+TIME_FORMAT = "%H:%M:%S"
+
+
+def format_timestamp(timestamp):
+    """epoch 초를 화면 표시용 시각 문자열로 변환합니다."""
+    return datetime.fromtimestamp(timestamp).strftime(TIME_FORMAT)
+
+
+class Server:
+    """서버 한 대의 상태입니다.
+
+    인스턴스 dict 없이 슬롯에 보관하고, 마지막 갱신 시각은 epoch 초(updated_at)로만
+    저장합니다. "HH:MM:SS" 문자열은 행을 그릴 때 last_updated를 읽는 순간에 만듭니다.
+    """
+
+    __slots__ = ('name', 'cpu_usage', 'cost_per_hour', 'rng', 'running', 'updated_at')
+
+    def __init__(self, name, cpu_usage, cost_per_hour, rng=None):
+        self.name = name
+        self.cpu_usage = cpu_usage
+        self.cost_per_hour = cost_per_hour
+        # 재현 가능한 실행을 위해 시드를 준 random.Random을 넘길 수 있음
+        self.rng = rng if rng is not None else random
+        self.running = True
+        self.updated_at = time.time()
+
+    @property
+    def last_updated(self):
+        """마지막 갱신 시각을 표시용 문자열로 반환합니다."""
+        return format_timestamp(self.updated_at)
+
+    def update_usage(self):
+        """서버 사용량을 업데이트합니다."""
+        # 서버가 실행 중일 때만 업데이트
+        if self.running:
+            # 현재 CPU 사용률을 기반으로 약간의 변동을 줌
+            if self.cpu_usage < 5:  # 저부하 서버는 1-10% 사이에서 변동
+                self.cpu_usage = self.rng.uniform(1, 10)
+            else:  # 일반 서버는 5-30% 사이에서 변동
+                self.cpu_usage = self.rng.uniform(5, 30)
+            self.updated_at = time.time()
+
+    def stop_server(self):
+        """서버를 중지합니다."""
+        if self.running:  # 실행 중인 서버만 중지
+            self.running = False
+            self.cpu_usage = 0
+            self.updated_at = time.time()
+            return True
+        return False
+
+    def start_server(self):
+        """서버를 시작합니다."""
+        if not self.running:  # 중지된 서버만 시작
+            self.running = True
+            self.cpu_usage = self.rng.uniform(1, 10)  # 시작 시 저부하 상태로 시작
+            self.updated_at = time.time()
+            return True
+        return False
+
+    def __repr__(self):
+        return f"Server({self.name!r}, cpu={self.cpu_usage:.1f}, running={self.running})"
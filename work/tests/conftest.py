@@ -0,0 +1,5 @@
+import os
+import sys
+
+# 모듈들이 work/ 바로 아래에 있으므로 테스트에서 `import fleet`처럼 가져올 수 있게 함
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
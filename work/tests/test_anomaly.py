@@ -0,0 +1,108 @@
+import numpy as np
+import pytest
+
+from anomaly import DIP, NORMAL, SPIKE, AnomalyDetector
+from bulk import BulkActionExecutor, BulkJob, InstanceActions
+from fleet import Fleet
+from optimizer import OptimizationPolicy, plan_stops
+
+
+def warmed_up(values, warmup=5, ticks=10):
+    """values 수준에서 조금씩 흔들리는 샘플로 ticks번 학습한 탐지기를 만듭니다."""
+    detector = AnomalyDetector(len(values), warmup=warmup)
+    rows = np.arange(len(values))
+    for tick in range(ticks):
+        detector.record(rows, np.asarray(values, dtype=np.float64) + (tick % 2) * 0.5)
+    return detector
+
+
+def test_spike_and_dip_are_flagged_then_cleared():
+    detector = warmed_up([20.0, 20.0, 20.0])
+    detector.record([0, 1, 2], [90.0, 1.0, 20.0])
+    assert detector.flags.tolist() == [SPIKE, DIP, NORMAL]
+    assert detector.flagged().tolist() == [True, True, False]
+    assert detector.flagged_count() == 2
+    assert (detector.spikes, detector.dips) == (1, 1)
+    assert [detector.label(i) for i in range(3)] == ["급증", "급감", ""]
+
+    # 다음 샘플이 정상이면 표시가 풀림
+    detector.record([0, 1, 2], [20.0, 20.0, 20.0])
+    assert detector.flagged_count() == 0
+
+
+def test_busy_server_going_idle_is_a_dip_even_with_high_variance():
+    detector = AnomalyDetector(1, warmup=3)
+    for value in (20.0, 60.0, 20.0, 60.0, 20.0, 60.0):
+        detector.record([0], [value])
+    assert detector.mean[0] >= detector.busy_mean
+    detector.record([0], [1.0])
+    assert detector.flags[0] == DIP
+
+
+def test_nothing_is_flagged_during_warmup():
+    detector = AnomalyDetector(2, warmup=5)
+    for _ in range(4):
+        detector.record([0, 1], [20.0, 20.0])
+    detector.record([0, 1], [95.0, 0.5])
+    assert detector.flagged_count() == 0
+    # 웜업을 채운 뒤에는 같은 샘플이 표시됨
+    detector = warmed_up([20.0, 20.0], warmup=5, ticks=5)
+    detector.record([0, 1], [95.0, 0.5])
+    assert detector.flags.tolist() == [SPIKE, DIP]
+
+
+def test_restarted_servers_learn_again():
+    fleet = Fleet(['a', 'b'], [20.0, 20.0], [1.0, 1.0])
+    detector = AnomalyDetector(len(fleet), warmup=3)
+    for _ in range(5):
+        detector.record_fleet(fleet)
+    fleet.stop(0)
+    detector.record_fleet(fleet)
+    fleet.start(0)
+    fleet.cpu_usage[0] = 90.0
+    detector.record_fleet(fleet)
+    # 다시 시작한 서버는 새로 배우므로 첫 샘플을 이상으로 보지 않음
+    assert detector.count[0] == 1 and detector.flags[0] == NORMAL
+    with pytest.raises(ValueError):
+        AnomalyDetector(1, alpha=0)
+
+
+def test_plan_stops_skips_flagged_servers():
+    fleet = Fleet(['s0', 's1', 's2'], [2.0, 3.0, 50.0], [5.0, 4.0, 3.0])
+    policy = OptimizationPolicy(min_running=0)
+    assert plan_stops(fleet, policy).names == ['s0', 's1']
+    fleet.anomalies = AnomalyDetector(len(fleet))
+    fleet.anomalies.flags[0] = DIP
+    assert plan_stops(fleet, policy).names == ['s1']
+    assert plan_stops(fleet, policy, candidates=[0, 1]).names == ['s1']
+
+
+class RecordingActions(InstanceActions):
+    def __init__(self):
+        self.calls = []
+
+    def start(self, name):
+        self.calls.append(('start', name))
+
+    def stop(self, name):
+        self.calls.append(('stop', name))
+
+
+def test_run_action_skips_stopping_flagged_servers():
+    fleet = Fleet(['s0', 's1'], [2.0, 3.0], [1.0, 1.0])
+    fleet.stop(1)
+    fleet.anomalies = AnomalyDetector(len(fleet))
+    fleet.anomalies.flags[:] = SPIKE
+    actions = RecordingActions()
+    executor = BulkActionExecutor(actions, rate_per_second=1000.0)
+    try:
+        job = BulkJob('stop', 1)
+        executor._run_action(job, fleet, 'stop', 0)
+        assert job.progress.skipped == 1 and fleet.running[0]
+        # 시작은 이상 표시와 무관하게 실행
+        job = BulkJob('start', 1)
+        executor._run_action(job, fleet, 'start', 1)
+        assert job.progress.succeeded == 1 and fleet.running[1]
+        assert actions.calls == [('start', 's1')]
+    finally:
+        executor.shutdown()
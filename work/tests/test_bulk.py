@@ -0,0 +1,162 @@
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from anomaly import SPIKE, AnomalyDetector
+from bulk import BulkActionExecutor, InstanceActions, TokenBucket, TransientActionError
+from fleet import Fleet
+
+
+class FakeActions(InstanceActions):
+    """서버별로 정해진 횟수만큼 일시적 오류를 낸 뒤 성공하는 가짜 API입니다."""
+
+    def __init__(self, transient=None, broken=(), gate=None):
+        self.transient = dict(transient or {})
+        self.broken = set(broken)
+        self.gate = gate  # 설정되기 전까지 호출을 붙잡아 둠
+        self.calls = []
+        self.called = threading.Event()
+        self._lock = threading.Lock()
+
+    def _call(self, action, name):
+        with self._lock:
+            self.calls.append((action, name, time.monotonic()))
+        self.called.set()
+        if self.gate is not None:
+            self.gate.wait(5)
+        if name in self.broken:
+            raise RuntimeError(f"{name}: 권한 없음")
+        with self._lock:
+            if self.transient.get(name, 0) > 0:
+                self.transient[name] -= 1
+                raise TransientActionError(f"{name}: 스로틀링")
+
+    def start(self, name):
+        self._call('start', name)
+
+    def stop(self, name):
+        self._call('stop', name)
+
+
+def small_fleet(size=6):
+    return Fleet([f"s{i}" for i in range(size)], np.full(size, 3.0), np.ones(size))
+
+
+@pytest.fixture
+def make_executor():
+    executors = []
+
+    def make(actions, **options):
+        options.setdefault('rate_per_second', 1000.0)
+        options.setdefault('backoff', 0.001)
+        executor = BulkActionExecutor(actions, **options)
+        executors.append(executor)
+        return executor
+    yield make
+    for executor in executors:
+        executor.shutdown()
+
+
+def test_stops_and_starts_update_fleet(make_executor):
+    fleet = small_fleet()
+    fleet.stop(5)
+    executor = make_executor(FakeActions())
+    done = []
+    job = executor.submit(fleet, 'stop', [0, 1, 5], on_done=done.append)
+    assert job.wait(5)
+    progress = job.progress
+    # s5는 이미 중지되어 있으므로 API를 부르지 않음
+    assert (progress.succeeded, progress.skipped, progress.failed) == (2, 1, 0)
+    assert done and done[0].finished
+    assert fleet.running.tolist() == [False, False, True, True, True, False]
+    assert sorted(name for _, name, _ in executor.actions.calls) == ['s0', 's1']
+
+    assert executor.submit(fleet, 'start', [1]).wait(5)
+    assert fleet.running[1]
+    with pytest.raises(ValueError):
+        executor.submit(fleet, 'reboot', [0])
+
+
+def test_transient_errors_are_retried_with_backoff(make_executor):
+    fleet = small_fleet()
+    actions = FakeActions(transient={'s0': 2, 's1': 5}, broken={'s2'})
+    executor = make_executor(actions, max_retries=3)
+    job = executor.submit(fleet, 'stop', [0, 1, 2])
+    assert job.wait(5)
+    progress = job.progress
+
+    assert (progress.succeeded, progress.failed) == (1, 2)
+    # s0은 두 번 재시도 후 성공, s1은 재시도 3번을 다 쓰고 실패, s2는 재시도하지 않음
+    assert progress.retries == 2 + 3
+    assert [name for _, name, _ in actions.calls].count('s1') == 4
+    assert [name for _, name, _ in actions.calls].count('s2') == 1
+    assert sorted(name for name, _ in progress.errors) == ['s1', 's2']
+    assert fleet.running.tolist()[:3] == [False, True, True]
+
+
+def test_token_bucket_limits_call_rate(make_executor):
+    fleet = small_fleet()
+    actions = FakeActions()
+    executor = make_executor(actions, rate_per_second=50.0, burst=1)
+    assert executor.submit(fleet, 'stop', range(6)).wait(5)
+
+    times = sorted(at for _, _, at in actions.calls)
+    # 버킷에 토큰 1개로 시작하므로 나머지 5번은 초당 50개 속도로 나옴
+    assert times[-1] - times[0] >= 5 / 50.0 * 0.9
+
+
+def test_token_bucket_acquire_stops_when_cancelled():
+    bucket = TokenBucket(rate=0.01, burst=1)
+    assert bucket.acquire()
+    cancelled = threading.Event()
+    cancelled.set()
+    assert bucket.acquire(cancelled) is False
+
+
+def test_cancel_interrupts_backoff(make_executor):
+    fleet = small_fleet()
+    actions = FakeActions(transient={'s0': 100})
+    executor = make_executor(actions, backoff=30.0, max_backoff=30.0)
+    job = executor.submit(fleet, 'stop', [0])
+    assert actions.called.wait(5)
+    time.sleep(0.05)  # 첫 실패 후 백오프 대기에 들어갈 때까지
+
+    started = time.monotonic()
+    job.cancel()
+    assert job.wait(5)
+    assert time.monotonic() - started < 5
+    progress = job.progress
+    assert progress.cancelled and progress.skipped == 1 and progress.retries == 1
+    assert fleet.running[0]
+    assert executor.pending(fleet) == []
+
+
+def test_pending_tracks_unfinished_servers(make_executor):
+    fleet = small_fleet()
+    gate = threading.Event()
+    executor = make_executor(FakeActions(gate=gate))
+    job = executor.submit(fleet, 'stop', [3, 1])
+
+    assert executor.pending(fleet, 'stop') == [1, 3]
+    assert executor.pending(fleet, 'start') == []
+    assert executor.pending(small_fleet(), 'stop') == []
+    gate.set()
+    assert job.wait(5)
+    assert executor.pending(fleet, 'stop') == []
+    assert not fleet.running[[1, 3]].any()
+
+
+def test_flagged_servers_are_not_stopped(make_executor):
+    fleet = small_fleet()
+    fleet.anomalies = AnomalyDetector(len(fleet))
+    fleet.anomalies.flags[1] = SPIKE
+    actions = FakeActions()
+    executor = make_executor(actions)
+
+    job = executor.submit(fleet, 'stop', [0, 1])
+    assert job.wait(5)
+    assert (job.progress.succeeded, job.progress.skipped) == (1, 1)
+    assert fleet.running.tolist()[:2] == [False, True]
+    assert [name for _, name, _ in actions.calls] == ['s0']
@@ -0,0 +1,123 @@
+import socket
+import zlib
+
+import numpy as np
+import pytest
+
+from collector import AsyncHttpCollector
+from engine import SimulationEngine
+from fleet import Fleet
+from metrics_stub import StubMetricsServer
+
+
+@pytest.fixture
+def stub():
+    server = StubMetricsServer()
+    server.start_in_thread()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def make_collector():
+    collectors = []
+
+    def make(url, **options):
+        collector = AsyncHttpCollector(url, **options)
+        collectors.append(collector)
+        return collector
+    yield make
+    for collector in collectors:
+        collector.close()
+
+
+def fleet_of(size):
+    return Fleet([f"i-{i:04d}" for i in range(size)], np.full(size, 50.0), np.ones(size))
+
+
+def expected_base(fleet, indices):
+    """스텁이 인스턴스마다 쓰는 기준값 (실제 값은 ±3 안에서 흔들림)."""
+    return np.array([zlib.crc32(name.encode('utf-8')) % 30 + 1
+                     for name in fleet.names[indices].tolist()], dtype=np.float64)
+
+
+def test_collects_running_servers_in_batches(stub, make_collector):
+    fleet = fleet_of(450)
+    fleet.stop_many([3, 7])
+    collector = make_collector(stub.url, batch_size=200)
+
+    indices, values = collector.collect_now(fleet)
+
+    np.testing.assert_array_equal(indices, np.flatnonzero(fleet.running))
+    assert np.abs(values - expected_base(fleet, indices)).max() <= 3.0
+    # 실행 중인 448대를 200대씩 3번에 나눠 요청
+    assert collector.stats['requests'] == stub.requests == 3
+    assert collector.stats['errors'] == collector.stats['timeouts'] == 0
+
+
+def test_connection_pool_is_reused_across_cycles(stub, make_collector):
+    fleet = fleet_of(100)
+    collector = make_collector(stub.url, batch_size=10, max_concurrency=2)
+    for _ in range(3):
+        indices, _ = collector.collect_now(fleet)
+        assert len(indices) == 100
+
+    assert stub.requests == 30
+    # 동시 요청 2개만큼의 keep-alive 연결을 계속 다시 씀
+    assert stub.connections <= 2
+    assert collector.pool._opened <= 2
+
+
+def test_slow_batches_time_out_and_keep_previous_values(make_collector):
+    slow = StubMetricsServer(latency=0.5)
+    slow.start_in_thread()
+    try:
+        fleet = fleet_of(20)
+        collector = make_collector(slow.url, batch_size=10, timeout=0.05)
+        assert collector.collect_now(fleet) is None
+        assert collector.stats['timeouts'] == 2
+        assert collector.pool._opened == 0  # 시간 초과된 연결은 다시 쓰지 않음
+
+        collector.update(fleet, now=0.0)
+        collector._in_flight.result(timeout=5)
+        collector.update(fleet, now=1.0)
+        assert (fleet.cpu_usage == 50.0).all()
+    finally:
+        slow.stop()
+
+
+def test_http_and_connection_errors_are_counted(stub, make_collector):
+    fleet = fleet_of(30)
+    not_found = make_collector(stub.url + '/missing', batch_size=10)
+    assert not_found.collect_now(fleet) is None
+    assert not_found.stats['errors'] == 3
+
+    with socket.socket() as probe:
+        probe.bind(('127.0.0.1', 0))
+        port = probe.getsockname()[1]
+    refused = make_collector(f"http://127.0.0.1:{port}", batch_size=10, timeout=1.0)
+    assert refused.collect_now(fleet) is None
+    assert refused.stats['errors'] == 3
+
+
+def test_rejects_non_http_urls():
+    with pytest.raises(ValueError):
+        AsyncHttpCollector('https://metrics.example.com')
+
+
+def test_engine_publishes_collected_values_to_subscribers(stub, make_collector):
+    fleet = fleet_of(50)
+    collector = make_collector(stub.url, batch_size=20)
+    engine = SimulationEngine(fleet, start_time=0.0, source=collector)
+    seen = []
+    engine.subscribe(lambda e: seen.append(e.fleet.cpu_usage.copy()))
+
+    # 첫 틱은 수집을 시작만 하고, 다음 틱에서 완료된 결과를 반영
+    engine.tick()
+    assert (seen[-1] == 50.0).all()
+    collector._in_flight.result(timeout=5)
+    engine.tick()
+
+    everyone = np.arange(len(fleet))
+    assert np.abs(seen[-1] - expected_base(fleet, everyone)).max() <= 3.0
+    np.testing.assert_array_equal(fleet.last_updated, engine.now)
@@ -0,0 +1,41 @@
+import numpy as np
+
+from dirty_set import DirtySet
+from fleet import Fleet
+
+
+def test_first_drain_returns_every_server_once():
+    dirty = DirtySet(4)
+    dirty.mark(np.arange(4))
+    dirty.mark([1, 2])
+    assert len(dirty) == 4
+    assert sorted(dirty.drain(np.zeros(4)).tolist()) == [0, 1, 2, 3]
+    assert len(dirty) == 0
+    assert len(dirty.drain(np.zeros(4))) == 0
+
+
+def test_observe_uses_threshold_against_last_drained_value():
+    dirty = DirtySet(3, threshold=1.0)
+    dirty.mark(np.arange(3))
+    dirty.drain(np.array([10.0, 10.0, 10.0]))
+
+    dirty.observe([0, 1, 2], [10.5, 11.0, 8.0])
+    assert sorted(dirty.drain(np.array([10.5, 11.0, 8.0])).tolist()) == [1, 2]
+    # 작은 변화가 쌓여 기준값에서 threshold 이상 벗어나면 들어감
+    dirty.observe([0], [10.9])
+    assert len(dirty) == 0
+    dirty.observe([0], [11.2])
+    assert dirty.drain(np.array([11.2, 11.0, 8.0])).tolist() == [0]
+
+
+def test_fleet_marks_started_and_stopped_servers():
+    fleet = Fleet([f"s{i}" for i in range(5)], [20.0] * 5, [1.0] * 5)
+    dirty = fleet.track_changes(threshold=5.0)
+    dirty.drain(fleet.cpu_usage)
+
+    fleet.stop(1)
+    fleet.stop_many([3, 4])
+    fleet.apply_samples([0, 2], [21.0, 40.0])
+    assert sorted(dirty.drain(fleet.cpu_usage).tolist()) == [1, 2, 3, 4]
+    fleet.start_all()
+    assert sorted(dirty.drain(fleet.cpu_usage).tolist()) == [1, 3, 4]
@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+
+from downsample import downsample, lttb, minmax
+
+
+def noisy_series(n, spike_at=None, seed=0):
+    rng = np.random.default_rng(seed)
+    x = np.arange(n, dtype=np.float64) * 5.0 + 1.7e9
+    y = 20 + rng.normal(0, 1, n)
+    if spike_at is not None:
+        y[spike_at] = 99.0
+    return x, y
+
+
+@pytest.mark.parametrize('n, threshold', [(10, 5), (1000, 100), (12345, 300)])
+def test_lttb_returns_threshold_points_with_endpoints(n, threshold):
+    x, y = noisy_series(n)
+    picked = lttb(x, y, threshold)
+    assert len(picked) == threshold
+    assert picked[0] == 0 and picked[-1] == n - 1
+    assert (np.diff(picked) > 0).all()
+
+
+def test_lttb_keeps_everything_when_threshold_is_not_smaller():
+    x, y = noisy_series(50)
+    np.testing.assert_array_equal(lttb(x, y, 50), np.arange(50))
+    np.testing.assert_array_equal(lttb(x, y, 2), np.arange(50))
+
+
+@pytest.mark.parametrize('spike_at', [1, 4321, 9998])
+def test_single_spike_survives(spike_at):
+    x, y = noisy_series(10000, spike_at=spike_at)
+    assert spike_at in lttb(x, y, 200)
+    assert spike_at in minmax(y, 100)
+    assert spike_at in downsample(x, y, 200)
+    assert spike_at in downsample(x, y, 200, method='minmax')
+
+
+@pytest.mark.parametrize('n, buckets', [(1000, 10), (1001, 10), (99999, 250)])
+def test_minmax_point_count_and_endpoints(n, buckets):
+    _, y = noisy_series(n)
+    picked = minmax(y, buckets)
+    # 구간마다 최솟값과 최댓값, 그리고 양 끝점
+    assert len(picked) <= 2 * buckets + 2
+    assert len(picked) >= buckets
+    assert picked[0] == 0 and picked[-1] == n - 1
+    assert (np.diff(picked) > 0).all()
+    assert y[picked].min() == y.min() and y[picked].max() == y.max()
+
+
+def test_downsample_with_prepass_returns_requested_points():
+    x, y = noisy_series(200000)
+    picked = downsample(x, y, 500)
+    assert len(picked) == 500
+    assert picked[0] == 0 and picked[-1] == len(y) - 1
+    with pytest.raises(ValueError):
+        downsample(x, y, 500, method='average')
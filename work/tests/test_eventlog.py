@@ -0,0 +1,91 @@
+import numpy as np
+import pytest
+
+from eventlog import EventLog, StateMismatchError
+from fleet import Fleet
+
+
+def new_fleet():
+    return Fleet.random(20, seed=7)
+
+
+def open_log(tmp_path, factory=new_fleet, spec=None):
+    return EventLog.open(str(tmp_path / 'fleet_events.log'), factory, spec=spec)
+
+
+def test_reopen_restores_fleet_from_snapshot_and_tail(tmp_path):
+    log, fleet = open_log(tmp_path)
+    fleet.stop(3, now=100.0)
+    fleet.stop_many([5, 6, 7], now=101.0)
+    log.snapshot(fleet)
+    # 스냅샷 뒤의 꼬리도 재생되어야 함
+    fleet.start(6, now=102.0)
+    fleet.stop(11, now=103.0)
+    log.close()
+
+    restored_log, restored = open_log(tmp_path)
+    try:
+        assert restored_log.restored_tail == 2
+        np.testing.assert_array_equal(restored.names, fleet.names)
+        np.testing.assert_array_equal(restored.running, fleet.running)
+        np.testing.assert_allclose(restored.cpu_usage, fleet.cpu_usage)
+        np.testing.assert_allclose(restored.cost_per_hour, fleet.cost_per_hour)
+        assert restored.running_count() == fleet.running_count()
+        assert restored.hourly_cost() == pytest.approx(fleet.hourly_cost())
+        assert restored_log.stats == log.stats
+    finally:
+        restored_log.close()
+
+
+def test_reopen_with_different_fleet_is_refused(tmp_path):
+    log, _ = open_log(tmp_path, spec='a')
+    log.close()
+    with pytest.raises(StateMismatchError):
+        open_log(tmp_path, lambda: Fleet.random(5, seed=7))
+    with pytest.raises(StateMismatchError):
+        open_log(tmp_path, spec='b')
+
+
+def test_reopen_with_same_spec_does_not_build_a_new_fleet(tmp_path):
+    log, fleet = open_log(tmp_path, spec='a')
+    fleet.stop(2, now=100.0)
+    log.close()
+
+    def unused():
+        raise AssertionError("spec이 같으면 플릿을 새로 만들지 않아야 함")
+
+    restored_log, restored = open_log(tmp_path, unused, spec='a')
+    try:
+        np.testing.assert_array_equal(restored.running, fleet.running)
+    finally:
+        restored_log.close()
+
+
+def test_audit_attributes_stops_only_to_stop_decisions(tmp_path):
+    log, fleet = open_log(tmp_path)
+    try:
+        log.record_decision('optimize', [1, 2], 10.0, now=10.0)
+        fleet.stop_many([1, 2], now=11.0)
+        # 다시 시작하는 결정은 그 뒤의 직접 중지의 근거가 아님
+        log.record_decision('manual', [1, 2], -10.0, now=20.0, action='start')
+        fleet.start_all(now=21.0)
+        fleet.stop(1, now=30.0)
+        log.record_decision('auto', [2], 5.0, now=40.0)
+        fleet.stop(2, now=41.0)
+        fleet.stop(4, now=50.0)
+
+        entries = log.audit()
+        assert [(ts, server, source, decided_at)
+                for ts, server, _, source, decided_at in entries] == [
+            (11.0, 1, 'optimize', 10.0),
+            (11.0, 2, 'optimize', 10.0),
+            (30.0, 1, None, None),
+            (41.0, 2, 'auto', 40.0),
+            (50.0, 4, None, None),
+        ]
+        assert entries[0][2] == pytest.approx(fleet.cost_per_hour[1])
+        assert [entry[1] for entry in log.audit(server=2)] == [2, 2]
+        assert len(log.audit(limit=2)) == 2
+        assert log.stats['decisions'] == 3
+    finally:
+        log.close()
@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+from fleet import Fleet
+
+
+def random_groups_fleet(size, rng):
+    return Fleet([f"s{i}" for i in range(size)], rng.uniform(0, 100, size),
+                 rng.uniform(0.1, 20, size), groups=rng.choice(['a', 'b', 'c'], size), rng=rng)
+
+
+def assert_matches_recompute(fleet):
+    incremental = (fleet.running_count(), fleet.hourly_cost(), fleet.group_hourly_cost.copy())
+    fleet.recompute_aggregates()
+    assert incremental[0] == fleet.running_count()
+    assert incremental[1] == pytest.approx(fleet.hourly_cost(), rel=1e-12, abs=1e-9)
+    np.testing.assert_allclose(incremental[2], fleet.group_hourly_cost, rtol=1e-12, atol=1e-9)
+
+
+def test_incremental_aggregates_match_full_recompute():
+    rng = np.random.default_rng(11)
+    fleet = random_groups_fleet(200, rng)
+    for step in range(300):
+        choice = step % 4
+        if choice == 0:
+            fleet.stop(int(rng.integers(200)))
+        elif choice == 1:
+            fleet.start(int(rng.integers(200)))
+        elif choice == 2:
+            # 이미 중지된 서버와 중복 인덱스도 섞어서 넘김
+            fleet.stop_many(rng.integers(0, 200, 15))
+        elif step % 40 == 3:
+            fleet.start_all()
+        if step % 25 == 0:
+            assert_matches_recompute(fleet)
+    assert_matches_recompute(fleet)
+    assert 0 < fleet.running_count() < len(fleet)
+
+
+def test_repeated_stop_and_start_do_not_double_count():
+    fleet = Fleet(['a', 'b'], [10.0, 20.0], [2.0, 3.0])
+    assert fleet.stop(0) and not fleet.stop(0)
+    assert fleet.stop_many([0, 1, 1]).tolist() == [1]
+    assert fleet.running_count() == 0 and fleet.hourly_cost() == 0.0
+    assert fleet.start(1) and not fleet.start(1)
+    assert fleet.start_all().tolist() == [0]
+    assert fleet.running_count() == 2
+    assert fleet.hourly_cost() == pytest.approx(5.0)
+    assert fleet.group_costs() == {'default': pytest.approx(5.0)}
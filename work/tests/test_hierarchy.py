@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+
+from fleet import Fleet
+from hierarchy import GroupHierarchy, synthetic_tags
+
+
+def assert_matches_recompute(hierarchy, fleet, tags):
+    """증분 집계가 같은 태그로 처음부터 계산한 집계와 같은지 모든 깊이에서 확인합니다."""
+    fresh = GroupHierarchy(fleet, tags)
+    for depth in range(hierarchy.depth_count):
+        for got, expected in zip(hierarchy.summary(depth), fresh.summary(depth)):
+            np.testing.assert_allclose(got, expected, rtol=1e-9, atol=1e-6)
+
+
+def test_incremental_aggregates_match_recompute():
+    fleet = Fleet.random(600, seed=11)
+    tags = synthetic_tags(len(fleet), rng=np.random.default_rng(11))
+    hierarchy = fleet.attach_hierarchy(tags)
+    rng = np.random.default_rng(5)
+    assert_matches_recompute(hierarchy, fleet, tags)
+
+    fleet.update_usage(now=60.0)
+    assert_matches_recompute(hierarchy, fleet, tags)
+    fleet.stop(3, now=61.0)
+    fleet.stop_many(rng.choice(len(fleet), 100, replace=False), now=62.0)
+    assert_matches_recompute(hierarchy, fleet, tags)
+    fleet.start(3, now=63.0)
+    fleet.update_usage(rng.choice(len(fleet), 50), now=64.0)
+    assert_matches_recompute(hierarchy, fleet, tags)
+    # 같은 서버가 여러 번 오고 중지된 서버도 섞인 외부 샘플
+    indices = rng.integers(0, len(fleet), 300)
+    fleet.apply_samples(indices, rng.uniform(0, 120, len(indices)), now=65.0)
+    assert_matches_recompute(hierarchy, fleet, tags)
+    fleet.start_all(now=66.0)
+    fleet.update_usage(now=67.0)
+    assert_matches_recompute(hierarchy, fleet, tags)
+
+
+def test_structure_and_summary_totals():
+    fleet = Fleet(['a', 'b', 'c', 'd'], [10.0, 20.0, 30.0, 40.0], [1.0, 2.0, 3.0, 4.0])
+    tags = {'region': ['r1', 'r1', 'r2', 'r2'], 'team': ['x', 'y', 'x', 'x']}
+    hierarchy = fleet.attach_hierarchy(tags)
+    assert [hierarchy.label(0, node) for node in range(hierarchy.node_count(0))] == ['r1', 'r2']
+    assert [hierarchy.label(1, leaf) for leaf in hierarchy.children(0, 0)] == ['x', 'y']
+    assert sorted(hierarchy.members(hierarchy.children(0, 1)[0]).tolist()) == [2, 3]
+
+    fleet.stop(3)
+    servers, running, cost, cpu_mean = hierarchy.summary(0)
+    assert servers.tolist() == [2, 2] and running.tolist() == [2, 1]
+    assert cost.tolist() == [3.0, 3.0]
+    assert cpu_mean.tolist() == pytest.approx([15.0, 30.0])
+    with pytest.raises(ValueError):
+        GroupHierarchy(fleet, {'region': ['r1']})
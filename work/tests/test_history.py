@@ -0,0 +1,95 @@
+import numpy as np
+import pytest
+
+from history import CpuHistory
+
+
+def fill(history, samples):
+    """samples[t, server]를 틱마다 기록합니다."""
+    rows = np.arange(samples.shape[1])
+    for values in samples:
+        history.record(rows, values)
+
+
+def test_ring_keeps_only_last_window_samples():
+    history = CpuHistory(2, window=4)
+    samples = np.array([[1, 10], [2, 20], [3, 30], [4, 40], [5, 50], [6, 60]], dtype=np.float32)
+    fill(history, samples)
+
+    assert history.count.tolist() == [4, 4]
+    np.testing.assert_array_equal(history.recent(0), [3, 4, 5, 6])
+    np.testing.assert_array_equal(history.recent(1), [30, 40, 50, 60])
+    np.testing.assert_allclose(history.mean(), [4.5, 45.0])
+    np.testing.assert_array_equal(history.p95(), [6.0, 60.0])
+
+
+def test_partial_window_and_empty_rows():
+    history = CpuHistory(3, window=5)
+    history.record([0, 1], [7.0, 9.0])
+    history.record([0], [11.0])
+
+    np.testing.assert_allclose(history.mean([0, 1]), [9.0, 9.0])
+    np.testing.assert_allclose(history.max([0, 1]), [11.0, 9.0])
+    assert np.isnan(history.mean([2])).all()
+    assert np.isnan(history.max([2])).all()
+    assert np.isnan(history.p95([2])).all()
+
+
+def test_max_is_recomputed_after_max_sample_is_evicted():
+    history = CpuHistory(1, window=3)
+    for value in (50.0, 10.0, 20.0):
+        history.record([0], [value])
+    assert history.max()[0] == 50.0
+
+    history.record([0], [5.0])  # 50 밀려남
+    assert history.max()[0] == 20.0
+    history.record([0], [15.0])  # 10 밀려남, 최댓값 그대로
+    assert history.max()[0] == 20.0
+    history.record([0], [1.0])  # 20 밀려남
+    assert history.max()[0] == 15.0
+
+
+def test_max_matches_buffer_over_random_stream():
+    rng = np.random.default_rng(3)
+    history = CpuHistory(50, window=7)
+    for _ in range(40):
+        rows = np.flatnonzero(rng.random(50) < 0.7)
+        history.record(rows, rng.uniform(0, 100, len(rows)))
+        expected = [history.recent(row).max() if history.count[row] else np.nan
+                    for row in range(50)]
+        np.testing.assert_array_equal(history.max(), expected)
+
+
+@pytest.mark.parametrize('window', [5, 20, 60])
+def test_p95_matches_numpy(window):
+    rng = np.random.default_rng(window)
+    samples = rng.uniform(0, 100, (window * 2 + 3, 200)).astype(np.float32)
+    history = CpuHistory(200, window=window)
+    fill(history, samples)
+
+    recent = np.stack([history.recent(row) for row in range(200)])
+    expected = np.percentile(recent.astype(np.float64), 95, axis=1, method='inverted_cdf')
+    np.testing.assert_array_equal(history.p95(), expected)
+    np.testing.assert_array_equal(history.p95([3, 7]), expected[[3, 7]])
+
+
+def test_p95_of_partial_window():
+    history = CpuHistory(2, window=60)
+    for value in range(1, 21):
+        history.record([0], [float(value)])
+    # 20개 중 nearest-rank 95%는 19번째 값
+    assert history.p95()[0] == 19.0
+    assert np.isnan(history.p95()[1])
+
+
+def test_p95_does_not_round_up_to_threshold():
+    history = CpuHistory(1, window=20)
+    for _ in range(20):
+        history.record([0], [9.96])
+    assert history.p95()[0] < 10.0
+
+
+def test_memory_per_server_is_bounded():
+    small = CpuHistory(10, window=60).nbytes_per_server()
+    large = CpuHistory(1000, window=60).nbytes_per_server()
+    assert small == large
@@ -0,0 +1,105 @@
+import sqlite3
+
+import pytest
+
+from fleet import Fleet
+from metrics_store import MetricsStore
+
+
+def small_fleet():
+    return Fleet(['a', 'b', 'c'], [10.0, 20.0, 30.0], [1.0, 2.0, 3.0])
+
+
+def test_ticks_are_written_and_rolled_up(tmp_path):
+    store = MetricsStore(str(tmp_path / 'metrics.db'))
+    fleet = small_fleet()
+    try:
+        store.record_tick(fleet, 0.0)
+        fleet.stop(1)
+        store.record_tick(fleet, 5.0)
+        store.flush()
+        assert store.query("SELECT COUNT(*) FROM samples")[0][0] == 6
+        assert store.query("SELECT server, running FROM transitions") == [(1, 0)]
+        assert store.server_series(2) == [(0, 30.0, 30.0)]
+    finally:
+        store.close()
+
+
+def test_write_error_reaches_flush_and_close_without_hanging(tmp_path, monkeypatch):
+    store = MetricsStore(str(tmp_path / 'metrics.db'))
+    fleet = small_fleet()
+    write_batch = store._write_batch
+    failures = []
+
+    def failing_once(conn, *args):
+        if not failures:
+            failures.append(args)
+            raise sqlite3.OperationalError("database or disk is full")
+        write_batch(conn, *args)
+
+    monkeypatch.setattr(store, '_write_batch', failing_once)
+    fleet.stop(1)
+    store.record_tick(fleet, 0.0)
+    with pytest.raises(sqlite3.OperationalError):
+        store.flush()
+
+    # 실패한 배치 뒤에도 writer는 계속 기록하고, 그 배치의 서버 목록과 상태 전이를 다시 씀
+    store.record_tick(fleet, 5.0)
+    store.flush()
+    assert store.query("SELECT DISTINCT ts FROM samples") == [(5.0,)]
+    assert store.transitions() == [(0.0, 'b', 0)]
+    assert store.cost_series('1m') == [(0, pytest.approx(4.0))]
+
+    failures.clear()
+    fleet.start(1)
+    store.record_tick(fleet, 10.0)
+    with pytest.raises(sqlite3.OperationalError):
+        store.close()
+    store.close()
+
+
+def test_unsent_rows_are_written_on_close(tmp_path, monkeypatch):
+    path = str(tmp_path / 'metrics.db')
+    store = MetricsStore(path)
+    fleet = small_fleet()
+    write_batch = store._write_batch
+    calls = []
+
+    def failing_once(conn, *args):
+        calls.append(args)
+        if len(calls) == 1:
+            raise sqlite3.OperationalError("database is locked")
+        write_batch(conn, *args)
+
+    monkeypatch.setattr(store, '_write_batch', failing_once)
+    fleet.stop(2)
+    store.record_tick(fleet, 0.0)
+    with pytest.raises(sqlite3.OperationalError):
+        store.close()
+
+    reopened = MetricsStore(path)
+    try:
+        assert reopened.transitions() == [(0.0, 'c', 0)]
+    finally:
+        reopened.close()
+
+
+def test_reopening_does_not_repeat_stop_transitions(tmp_path):
+    path = str(tmp_path / 'metrics.db')
+    fleet = small_fleet()
+    fleet.stop(0)
+    for now in (0.0, 100.0):
+        # optimize/simulate --db처럼 실행마다 저장소를 새로 엶
+        store = MetricsStore(path)
+        store.record_tick(fleet, now)
+        store.close()
+
+    fleet.start(0)
+    fleet.stop(2)
+    store = MetricsStore(path)
+    try:
+        store.record_tick(fleet, 200.0)
+        store.flush()
+        assert store.transitions() == [(0.0, 'a', 0), (200.0, 'a', 1), (200.0, 'c', 0)]
+    finally:
+        store.close()
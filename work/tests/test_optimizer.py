@@ -0,0 +1,96 @@
+import numpy as np
+import pytest
+
+from fleet import HOURS_PER_MONTH, Fleet
+from history import CpuHistory
+from optimizer import OptimizationPolicy, plan_stops
+
+
+def fixed_fleet():
+    """비용이 모두 다르고 CPU가 고정된 서버 6대. s1, s4만 바쁨."""
+    return Fleet(
+        names=['s0', 's1', 's2', 's3', 's4', 's5'],
+        cpu_usage=[2.0, 50.0, 5.0, 1.0, 40.0, 8.0],
+        cost_per_hour=[3.0, 9.0, 7.0, 5.0, 8.0, 1.0],
+        capacity=[1.0, 1.0, 2.0, 4.0, 1.0, 1.0],
+        groups=['web', 'web', 'web', 'db', 'db', 'db'])
+
+
+def test_selects_underused_servers_by_savings():
+    fleet = fixed_fleet()
+    plan = plan_stops(fleet, OptimizationPolicy(min_running=0))
+    assert plan.names == ['s2', 's3', 's0', 's5']
+    assert plan.hourly_savings == pytest.approx(16.0)
+    assert plan.monthly_savings == pytest.approx(16.0 * HOURS_PER_MONTH)
+
+
+def test_min_running_keeps_cheapest_candidates():
+    fleet = fixed_fleet()
+    plan = plan_stops(fleet, OptimizationPolicy(min_running=4))
+    assert plan.names == ['s2', 's3']
+    fleet.stop(2)
+    assert plan_stops(fleet, OptimizationPolicy(min_running=4)).names == ['s3']
+    assert len(plan_stops(fleet, OptimizationPolicy(min_running=10))) == 0
+
+
+def test_min_capacity_limits_cumulative_capacity():
+    fleet = fixed_fleet()  # 전체 용량 10
+    plan = plan_stops(fleet, OptimizationPolicy(min_running=0, min_capacity=3.0))
+    # s2(2) + s3(4) = 6까지는 남는 용량 7 안, s0을 더하면 7로 허용, s5는 넘음
+    assert plan.names == ['s2', 's3', 's0']
+    assert fleet.capacity[fleet.running].sum() - fleet.capacity[plan.indices].sum() >= 3.0
+
+
+def test_group_floors_limit_stops_per_group():
+    fleet = fixed_fleet()
+    policy = OptimizationPolicy(min_running=0, group_floors={'web': 2, 'db': 1})
+    plan = plan_stops(fleet, policy)
+    # web은 3대 중 2대를 남겨야 하므로 가장 비싼 s2만, db는 s3, s5 모두 가능
+    assert plan.names == ['s2', 's3', 's5']
+    remaining = fleet.running.copy()
+    remaining[plan.indices] = False
+    assert np.count_nonzero(remaining[fleet.groups == 'web']) >= 2
+    assert np.count_nonzero(remaining[fleet.groups == 'db']) >= 1
+
+
+def test_all_constraints_together():
+    fleet = fixed_fleet()
+    policy = OptimizationPolicy(min_running=3, min_capacity=5.0, group_floors={'db': 2})
+    # db 하한으로 db에서는 s3만 후보, 남는 용량(10 - 5)에 s2(2) 다음 s3(4)는
+    # 들어가지 않아 건너뛰고 s0(1)을 고름, 최소 실행 3대로 여기서 멈춤
+    assert plan_stops(fleet, policy).names == ['s2', 's0']
+
+
+def test_min_capacity_skips_large_candidates():
+    fleet = fixed_fleet()
+    policy = OptimizationPolicy(min_running=0, min_capacity=7.0)
+    # 남는 용량 3: s2(2) 뒤 s3(4)는 건너뛰고 s0(1)까지, 나머지는 넘음
+    assert plan_stops(fleet, policy).names == ['s2', 's0']
+
+
+def test_candidates_and_pending():
+    fleet = fixed_fleet()
+    policy = OptimizationPolicy(min_running=3)
+    assert plan_stops(fleet, policy, candidates=[5, 0, 1]).names == ['s1', 's0', 's5']
+    # 대기 중인 중지 2대는 이미 중지된 것으로 보고 한도에서 뺌
+    assert plan_stops(fleet, policy, pending=[2, 3]).names == ['s0']
+
+
+def test_history_statistic_replaces_last_sample():
+    fleet = fixed_fleet()
+    history = CpuHistory(len(fleet), window=20)
+    rows = np.arange(len(fleet))
+    for tick in range(20):
+        values = fleet.cpu_usage.copy()
+        # s2는 마지막 샘플만 조용하고 평소에는 바쁨
+        values[2] = 5.0 if tick == 19 else 60.0
+        history.record(rows, values)
+    policy = OptimizationPolicy(min_running=0, min_samples=12)
+    assert plan_stops(fleet, policy, history).names == ['s3', 's0', 's5']
+    # 샘플이 부족하면 판단을 보류
+    assert len(plan_stops(fleet, policy, CpuHistory(len(fleet)))) == 0
+
+
+def test_unknown_statistic_is_rejected():
+    with pytest.raises(ValueError):
+        OptimizationPolicy(usage_statistic='median')
@@ -0,0 +1,123 @@
+import numpy as np
+import pytest
+
+from replay import CsvUsageReader, iter_ticks
+
+CHUNK_BYTES = [1, 7, 40, 333, 1 << 20]
+SEEK_TIMES = [-5.0, 0.0, 12.0, 12.5, 60.0, 1000.0]
+
+
+def make_trace():
+    """timestamp 순으로 정렬된 (timestamp, server, cpu) 행. 틱마다 서버 수가 다릅니다."""
+    rng = np.random.default_rng(5)
+    rows = []
+    for tick in range(40):
+        count = int(rng.integers(1, 6))
+        for server in rng.choice(8, count, replace=False):
+            rows.append((tick * 5.0, f"srv-{server}", round(float(rng.uniform(0, 100)), 3)))
+    return rows
+
+
+def write_csv(path, rows, trailing_newline=True):
+    text = "timestamp,server,cpu\n" + "\n".join(f"{ts},{server},{cpu}" for ts, server, cpu in rows)
+    path.write_text(text + ("\n" if trailing_newline else ""))
+    return str(path)
+
+
+def read_all(reader):
+    rows = []
+    for timestamps, servers, cpu in reader.chunks():
+        rows.extend(zip(timestamps.tolist(), servers, cpu.tolist()))
+    return rows
+
+
+def grouped(rows):
+    ticks = {}
+    for ts, server, cpu in rows:
+        ticks.setdefault(ts, []).append((server, cpu))
+    return list(ticks.items())
+
+
+def assert_ticks(reader, rows):
+    ticks = [(ts, list(zip(servers, cpu.tolist()))) for ts, servers, cpu in iter_ticks(reader)]
+    assert ticks == grouped(rows)
+
+
+@pytest.mark.parametrize('chunk_bytes', CHUNK_BYTES)
+@pytest.mark.parametrize('trailing_newline', [True, False])
+def test_csv_chunks_match_full_read(tmp_path, chunk_bytes, trailing_newline):
+    rows = make_trace()
+    path = write_csv(tmp_path / 'usage.csv', rows, trailing_newline)
+    reader = CsvUsageReader(path, chunk_bytes=chunk_bytes)
+    try:
+        assert read_all(reader) == rows
+        reader.offset = reader._data_start
+        assert_ticks(reader, rows)
+    finally:
+        reader.close()
+
+
+@pytest.mark.parametrize('chunk_bytes', CHUNK_BYTES)
+@pytest.mark.parametrize('timestamp', SEEK_TIMES)
+def test_csv_seek_matches_filtered_full_read(tmp_path, chunk_bytes, timestamp):
+    rows = make_trace()
+    path = write_csv(tmp_path / 'usage.csv', rows)
+    reader = CsvUsageReader(path, chunk_bytes=chunk_bytes)
+    try:
+        reader.seek(timestamp)
+        assert read_all(reader) == [row for row in rows if row[0] >= timestamp]
+    finally:
+        reader.close()
+
+
+def test_csv_accepts_iso_timestamps_and_reordered_columns(tmp_path):
+    path = tmp_path / 'usage.csv'
+    path.write_text("cpu,server,timestamp\n"
+                    "1.5,a,2024-01-01T00:00:00Z\n"
+                    "2.5,b,2024-01-01T00:00:00Z\n"
+                    "3.5,a,2024-01-01T00:00:05+00:00\n")
+    reader = CsvUsageReader(str(path), chunk_bytes=8)
+    try:
+        reader.seek(1704067201.0)
+        assert read_all(reader) == [(1704067205.0, 'a', 3.5)]
+    finally:
+        reader.close()
+
+
+@pytest.mark.parametrize('row_group_size', [3, 16, 1000])
+@pytest.mark.parametrize('batch_rows', [1, 5, 64, 500000])
+@pytest.mark.parametrize('timestamp', [None] + SEEK_TIMES)
+def test_parquet_batches_and_seek_match_full_read(tmp_path, row_group_size, batch_rows,
+                                                  timestamp):
+    pa = pytest.importorskip('pyarrow')
+    pq = pytest.importorskip('pyarrow.parquet')
+    from replay import ParquetUsageReader
+
+    rows = make_trace()
+    path = str(tmp_path / 'usage.parquet')
+    timestamps, servers, cpu = zip(*rows)
+    pq.write_table(pa.table({'timestamp': timestamps, 'server': servers, 'cpu': cpu}), path,
+                   row_group_size=row_group_size)
+    reader = ParquetUsageReader(path, batch_rows=batch_rows)
+    expected = rows
+    if timestamp is not None:
+        reader.seek(timestamp)
+        expected = [row for row in rows if row[0] >= timestamp]
+    assert read_all(reader) == expected
+    assert_ticks(reader, expected)
+
+
+def test_parquet_timestamp_column_seek(tmp_path):
+    pa = pytest.importorskip('pyarrow')
+    pq = pytest.importorskip('pyarrow.parquet')
+    from replay import ParquetUsageReader
+
+    rows = make_trace()
+    path = str(tmp_path / 'usage.parquet')
+    timestamps, servers, cpu = zip(*rows)
+    stamps = pa.array([int(ts * 1000) for ts in timestamps], type=pa.timestamp('ms'))
+    pq.write_table(pa.table({'timestamp': stamps, 'server': servers, 'cpu': cpu}), path,
+                   row_group_size=7)
+    reader = ParquetUsageReader(path, batch_rows=4)
+    reader.seek(62.5)
+    assert read_all(reader) == [row for row in rows if row[0] >= 62.5]
@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+
+from fleet import Fleet
+from history import CpuHistory
+from rightsizing import InstanceCatalog, recommend_rightsizing
+
+CATALOG = (
+    ('small', 2, 4, 0.1),
+    ('medium', 4, 8, 0.2),
+    ('large', 8, 32, 0.4),
+    ('highmem', 2, 64, 0.3),
+)
+
+
+def test_cheapest_fitting_needs_both_vcpu_and_memory():
+    catalog = InstanceCatalog(CATALOG)
+    found = catalog.cheapest_fitting(np.array([1.0, 3.0, 2.0, 1.0, 9.0]),
+                                     np.array([4.0, 4.0, 16.0, 40.0, 1.0]))
+    assert catalog.names[found[:4]].tolist() == ['small', 'medium', 'highmem', 'highmem']
+    # 어느 유형에도 맞지 않으면 -1
+    assert found[4] == -1
+
+
+def test_type_for_price_picks_most_expensive_not_above_cost():
+    catalog = InstanceCatalog(CATALOG)
+    found = catalog.type_for_price(np.array([0.05, 0.1, 0.25, 0.3, 5.0]))
+    assert catalog.names[found].tolist() == ['small', 'small', 'medium', 'highmem', 'large']
+
+
+def test_catalog_rejects_empty_or_non_positive_entries():
+    with pytest.raises(ValueError):
+        InstanceCatalog([])
+    with pytest.raises(ValueError):
+        InstanceCatalog([('free', 2, 4, 0.0)])
+
+
+def idle_fleet(peaks, types, catalog):
+    """types 유형의 정가로 도는 서버들이 peaks(%)를 최대 부하로 기록한 상태를 만듭니다."""
+    fleet = Fleet([f"s{i}" for i in range(len(peaks))], peaks, catalog.price[types])
+    history = CpuHistory(len(fleet), window=4)
+    for _ in range(4):
+        history.record_fleet(fleet)
+    return fleet, history
+
+
+def test_recommendation_keeps_current_memory_by_default():
+    catalog = InstanceCatalog(CATALOG)
+    large = int(np.flatnonzero(catalog.names == 'large')[0])
+    highmem = int(np.flatnonzero(catalog.names == 'highmem')[0])
+    fleet, history = idle_fleet([10.0, 10.0], [large, highmem], catalog)
+
+    plan = recommend_rightsizing(fleet, history, catalog, min_samples=4)
+    # large(8 vCPU, 32GiB)에 필요한 1 vCPU와 32GiB를 모두 만족하는 더 싼 유형은 highmem,
+    # highmem은 64GiB를 지켜야 하므로 그대로 둠
+    assert plan.names == ['s0']
+    assert catalog.names[plan.suggested].tolist() == ['highmem']
+    assert plan.hourly_savings == pytest.approx(0.1)
+
+    scaled = recommend_rightsizing(fleet, history, catalog, min_samples=4, scale_memory=True)
+    # 메모리도 CPU 비율(1/8)로 줄이면 highmem의 64GiB가 8GiB로 줄어 medium이 됨
+    assert catalog.names[scaled.suggested].tolist() == ['small', 'medium']
+
+
+def test_recommendation_skips_busy_excluded_and_short_history():
+    catalog = InstanceCatalog(CATALOG)
+    large = int(np.flatnonzero(catalog.names == 'large')[0])
+    fleet, history = idle_fleet([90.0, 10.0, 10.0], [large] * 3, catalog)
+
+    plan = recommend_rightsizing(fleet, history, catalog, min_samples=4, exclude=[2])
+    assert plan.names == ['s1']
+    assert len(recommend_rightsizing(fleet, history, catalog, min_samples=5)) == 0
+    with pytest.raises(ValueError):
+        recommend_rightsizing(fleet, history, catalog, statistic='median')
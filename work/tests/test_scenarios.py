@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+from fleet import HOURS_PER_MONTH
+from scenarios import FleetTrace, main, policy_grid, rank, replay, simulate_trace, sweep
+
+
+def flat_trace(ticks=24):
+    """s0, s1은 계속 한가하고 s2, s3은 바쁜 4대짜리 기록입니다."""
+    demand = np.tile([2.0, 3.0, 50.0, 60.0], (ticks, 1))
+    return FleetTrace(demand, [1.0, 2.0, 3.0, 4.0])
+
+
+def test_policy_grid_is_the_full_product():
+    grid = policy_grid(cpu_threshold=[5.0, 10.0], min_running=[1], usage_statistic=['p95', 'mean'])
+    assert len(grid) == 4
+    assert grid[0] == {'cpu_threshold': 5.0, 'min_running': 1, 'usage_statistic': 'p95'}
+    assert {(p['cpu_threshold'], p['usage_statistic']) for p in grid} == {
+        (5.0, 'p95'), (5.0, 'mean'), (10.0, 'p95'), (10.0, 'mean')}
+
+
+def test_replay_stops_idle_servers_and_reports_savings():
+    result = replay(flat_trace(), {'cpu_threshold': 10.0, 'min_running': 1},
+                    optimize_every=12, window=12)
+    assert result['stopped'] == 2
+    # 앞 12틱은 시간당 $10, 뒤 12틱은 s0, s1을 뺀 $7
+    assert result['monthly_savings'] == pytest.approx(1.5 * HOURS_PER_MONTH)
+    assert result['final_capacity_ratio'] == pytest.approx(0.5)
+    # 전체 수요 1.15대분을 남은 용량 2대로 감당
+    assert result['peak_utilization'] == pytest.approx(1.15 / 2)
+    assert result['overload_fraction'] == 0.0
+
+    risky = replay(flat_trace(), {'cpu_threshold': 10.0, 'min_running': 1},
+                   optimize_every=12, window=12, overload_threshold=0.5)
+    assert risky['overload_fraction'] == pytest.approx(0.5)
+
+
+def test_sweep_in_process_matches_replay():
+    trace = simulate_trace(30, 48, seed=1)
+    grid = policy_grid(cpu_threshold=[5.0, 20.0], usage_statistic=['p95', 'mean'])
+    results = sweep(trace, grid, workers=1, optimize_every=12)
+    assert [r['params'] for r in results] == grid
+    assert results[1] == replay(trace, grid[1], optimize_every=12)
+
+
+def test_rank_puts_safe_results_first_by_savings():
+    results = [
+        {'params': 'a', 'monthly_savings': 10.0, 'overload_fraction': 0.0},
+        {'params': 'b', 'monthly_savings': 50.0, 'overload_fraction': 0.2},
+        {'params': 'c', 'monthly_savings': 30.0, 'overload_fraction': 0.0},
+        {'params': 'd', 'monthly_savings': 90.0, 'overload_fraction': 0.1},
+    ]
+    assert [r['params'] for r in rank(results)] == ['c', 'a', 'd', 'b']
+    assert [r['params'] for r in rank(results, max_overload=0.1)] == ['d', 'c', 'a', 'b']
+
+
+def test_invalid_statistic_is_rejected_by_the_parser(capsys):
+    with pytest.raises(SystemExit) as error:
+        main(['--statistics', 'median', '--workers', '1'])
+    assert error.value.code == 2
+    assert 'median' in capsys.readouterr().err
@@ -0,0 +1,105 @@
+import numpy as np
+
+from fleet import Fleet
+from optimizer import OptimizationPolicy
+from scheduler import AutoOptimizer
+
+
+def busy_fleet(size=4):
+    return Fleet([f"s{i}" for i in range(size)], [50.0] * size, np.arange(1.0, size + 1))
+
+
+def scheduler_for(fleet, **options):
+    options.setdefault('policy', OptimizationPolicy(cpu_threshold=10.0, min_running=1))
+    options.setdefault('dwell', 300.0)
+    options.setdefault('cooldown', 900.0)
+    options.setdefault('band', 5.0)
+    scheduler = AutoOptimizer(fleet, **options)
+    scheduler.run_pass(-1000.0)  # 처음 전체 평가
+    return scheduler
+
+
+def test_server_is_stopped_only_after_dwell():
+    fleet = busy_fleet()
+    scheduler = scheduler_for(fleet)
+    fleet.apply_samples([0], [5.0])
+
+    assert len(scheduler.run_pass(0.0)[0]) == 0
+    assert len(scheduler.run_pass(299.0)[0]) == 0
+    assert scheduler.run_pass(300.0)[0].tolist() == [0]
+    assert not fleet.running[0]
+    assert scheduler.stopped_count == 1
+
+
+def test_value_inside_band_keeps_idle_state():
+    fleet = busy_fleet()
+    scheduler = scheduler_for(fleet)
+    fleet.apply_samples([0, 1], [5.0, 5.0])
+    scheduler.run_pass(0.0)
+    # 임계값(10)과 임계값+band(15) 사이는 유휴 유지, band 위로 올라가면 해제
+    fleet.apply_samples([0, 1], [12.0, 16.0])
+    scheduler.run_pass(100.0)
+    assert scheduler.run_pass(300.0)[0].tolist() == [0]
+
+    # 유휴가 아닌 서버는 band 안의 값으로 유휴가 되지 않음
+    fleet.apply_samples([1], [12.0])
+    scheduler.run_pass(400.0)
+    assert len(scheduler.run_pass(1000.0)[0]) == 0
+    assert fleet.running[1]
+
+
+def test_recently_changed_server_waits_for_cooldown():
+    fleet = busy_fleet()
+    fleet.stop(2, now=-10.0)
+    scheduler = scheduler_for(fleet)
+    fleet.start(2, now=0.0)
+    fleet.apply_samples([2], [5.0])
+
+    scheduler.run_pass(0.0)
+    assert len(scheduler.run_pass(300.0)[0]) == 0
+    assert len(scheduler.run_pass(899.0)[0]) == 0
+    assert scheduler.run_pass(900.0)[0].tolist() == [2]
+
+
+def test_restarts_when_load_rises_and_holds_inside_band():
+    fleet = busy_fleet()
+    scheduler = scheduler_for(fleet, start_above=40.0, cooldown=0.0)
+    fleet.apply_samples([0], [5.0])
+    fleet.apply_samples([1, 2, 3], [30.0, 30.0, 30.0])
+    scheduler.run_pass(0.0)
+    assert scheduler.run_pass(300.0)[0].tolist() == [0]
+
+    # 평균 38은 start_above(40)와 start_above - band(35) 사이라 아무것도 하지 않음
+    fleet.apply_samples([1, 2, 3], [38.0, 38.0, 38.0])
+    stops, starts = scheduler.run_pass(310.0)
+    assert len(stops) == 0 and len(starts) == 0
+    fleet.apply_samples([1, 2, 3], [45.0, 45.0, 45.0])
+    stops, starts = scheduler.run_pass(320.0)
+    assert len(stops) == 0 and starts.tolist() == [0]
+    assert fleet.running[0]
+
+
+def test_pending_stops_count_against_min_running():
+    fleet = busy_fleet()
+    requested = []
+    # 비동기 실행기처럼 요청만 받고 아직 플릿에 반영하지 않음
+    scheduler = scheduler_for(
+        fleet, policy=OptimizationPolicy(cpu_threshold=10.0, min_running=2),
+        apply=lambda action, indices, now: requested.extend(indices.tolist()),
+        pending=lambda: requested)
+    fleet.apply_samples([0, 1, 2, 3], [5.0, 5.0, 5.0, 5.0])
+    scheduler.run_pass(0.0)
+    assert sorted(scheduler.run_pass(300.0)[0].tolist()) == [2, 3]
+    assert len(scheduler.run_pass(600.0)[0]) == 0
+    assert len(scheduler.run_pass(900.0)[0]) == 0
+    assert fleet.running.all()
+
+
+def test_pass_cost_follows_changes():
+    fleet = busy_fleet(100)
+    scheduler = scheduler_for(fleet)
+    assert len(fleet.dirty) == 0
+    fleet.apply_samples([7], [5.0])
+    assert len(fleet.dirty) == 1
+    scheduler.run_pass(0.0)
+    assert len(fleet.dirty) == 0
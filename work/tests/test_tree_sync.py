@@ -0,0 +1,53 @@
+from fleet import Fleet
+from tree_sync import TreeviewSync
+
+
+class FakeTree:
+    """TreeviewSync가 쓰는 ttk.Treeview 메서드만 흉내 냅니다."""
+
+    def __init__(self):
+        self.rows = {}
+        self.selected = ()
+        self.updates = 0
+
+    def get_children(self):
+        return tuple(self.rows)
+
+    def delete(self, *items):
+        for item in items:
+            del self.rows[item]
+
+    def insert(self, parent, index, values=()):
+        item_id = f"I{len(self.rows) + 1:03X}"
+        self.rows[item_id] = values
+        return item_id
+
+    def item(self, item_id, values=()):
+        self.rows[item_id] = values
+        self.updates += 1
+
+    def selection(self):
+        return self.selected
+
+
+def test_refresh_skips_rows_whose_only_change_is_last_updated():
+    fleet = Fleet(['a', 'b', 'c'], [10.0, 20.0, 30.0], [1.0, 2.0, 3.0])
+    tree = FakeTree()
+    sync = TreeviewSync(tree, fleet)
+    assert sync.refresh() == 3
+
+    fleet.apply_samples([0, 1, 2], [10.0, 20.02, 31.0], now=1000.0)
+    assert sync.refresh() == 1
+    assert tree.rows[sync.item_ids[2]][1] == "31.0%"
+
+
+def test_selection_maps_item_back_to_server():
+    fleet = Fleet(['a', 'b', 'c'], [10.0, 20.0, 30.0], [1.0, 2.0, 3.0])
+    tree = FakeTree()
+    sync = TreeviewSync(tree, fleet)
+    sync.refresh()
+    assert sync.selection() is None
+    tree.selected = (sync.item_ids[2],)
+    assert sync.selection() == ('server', 2)
+    tree.selected = ('unknown',)
+    assert sync.selection() is None
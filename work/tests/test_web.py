@@ -0,0 +1,93 @@
+import asyncio
+import json
+
+import numpy as np
+
+from collector import MetricsSource
+from engine import SimulationEngine
+from fleet import Fleet
+from web import Client, FleetStream, WebDashboard
+
+
+class FixedSource(MetricsSource):
+    """정해 둔 값을 틱마다 다시 보내는 소스입니다. 값이 같아도 갱신 시각은 바뀝니다."""
+
+    def __init__(self, values):
+        self.values = np.asarray(values, dtype=np.float64)
+
+    def update(self, fleet, now):
+        fleet.apply_samples(np.arange(len(self.values)), self.values, now=now)
+
+
+def fixed_engine(values):
+    fleet = Fleet([f"s{i}" for i in range(len(values))], values, np.ones(len(values)))
+    source = FixedSource(values)
+    return SimulationEngine(fleet, tick_seconds=60, start_time=0.0, source=source), source
+
+
+def decode(message):
+    """SSE 메시지 바이트를 (event, data)로 풉니다."""
+    fields = dict(line.split(': ', 1) for line in message.decode('utf-8').strip().split('\n'))
+    return fields['event'], json.loads(fields['data'])
+
+
+def test_snapshot_has_every_row_and_delta_only_changed_ones():
+    engine, source = fixed_engine([10.0, 20.0, 30.0, 40.0])
+    stream = FleetStream(engine)
+    snapshot = stream.snapshot()
+    assert snapshot['index'] == [0, 1, 2, 3]
+    assert snapshot['names'] == ['s0', 's1', 's2', 's3']
+    assert snapshot['summary']['running'] == 4
+
+    # 값은 그대로이고 갱신 시각만 바뀐 틱은 빈 delta
+    engine.tick()
+    delta = stream.delta()
+    assert delta['index'] == [] and delta['tick'] == 1
+    assert 'names' not in delta
+
+    source.values[1] = 20.04  # 표시 단위(0.1%) 안의 변화는 보내지 않음
+    source.values[2] = 35.0
+    engine.fleet.stop(3)
+    engine.tick()
+    delta = stream.delta()
+    assert delta['index'] == [2, 3]
+    assert delta['cpu'] == [35.0, 0.0]
+    assert delta['running'] == [1, 0]
+    assert delta['updated'] == [120, int(engine.fleet.last_updated[3])]
+    assert delta['summary']['running'] == 3
+
+
+def test_broadcast_shares_one_delta_and_resyncs_slow_clients():
+    engine, source = fixed_engine([10.0, 20.0])
+    dashboard = WebDashboard(engine, buffer=2)
+
+    async def scenario():
+        fast, slow = Client(None, 2), Client(None, 2)
+        dashboard.clients.update((fast, slow))
+        for tick in range(3):
+            source.values[0] = 11.0 + tick
+            message = await asyncio.get_running_loop().run_in_executor(None, dashboard._tick)
+            dashboard.broadcast(message)
+            # 빠른 클라이언트는 매번 비우고, 느린 클라이언트는 쌓아 둠
+            assert fast.queue.get_nowait() is message
+        return slow
+
+    slow = asyncio.run(scenario())
+    # 세 번째 delta에서 큐(2개)가 넘쳐 밀린 delta를 버리고 snapshot 하나로 바꿈
+    assert slow.resyncs == 1
+    assert slow.queue.qsize() == 1
+    event, data = decode(slow.queue.get_nowait())
+    assert event == 'snapshot'
+    assert data['tick'] == 3 and data['cpu'] == [13.0, 20.0]
+    # 같은 틱의 snapshot은 한 번만 직렬화
+    assert dashboard.snapshot_message() is dashboard.snapshot_message()
+
+
+def test_delta_messages_are_sse_events_with_tick_ids():
+    engine, source = fixed_engine([10.0])
+    dashboard = WebDashboard(engine)
+    source.values[0] = 50.0
+    message = dashboard._tick()
+    assert message.startswith(b'id: 1\nevent: delta\n')
+    event, data = decode(message)
+    assert event == 'delta' and data['index'] == [0] and data['cpu'] == [50.0]
@@ -0,0 +1,73 @@
+import pytest
+
+from engine import SimulationEngine
+from fleet import Fleet
+from workload import BURSTY, CLASSIC, DIURNAL, IDLE, PROFILES, parse_profiles
+
+
+def test_parse_profiles():
+    assert parse_profiles(None) is None
+    assert parse_profiles([]) is None
+    assert parse_profiles(['diurnal=0.6', ' bursty=0.4']) == {'diurnal': 0.6, 'bursty': 0.4}
+    assert parse_profiles(['idle=0', 'classic=2']) == {'idle': 0.0, 'classic': 2.0}
+
+
+@pytest.mark.parametrize('items', [
+    ['diurnal'],
+    ['busy=1'],
+    ['idle=x'],
+    ['idle=-1'],
+    ['idle=inf'],
+    ['idle=nan'],
+    ['idle=0'],
+    ['idle=1', 'idle=2'],
+])
+def test_parse_profiles_rejects_invalid_items(items):
+    with pytest.raises(ValueError):
+        parse_profiles(items)
+
+
+PROFILE_MIX = {'classic': 1, 'idle': 1, 'diurnal': 1, 'bursty': 1}
+
+
+def run_engine(seed, ticks=20):
+    """같은 시작 시각에서 ticks번 진행하며 틱마다 cpu_usage 바이트를 모읍니다."""
+    fleet = Fleet.random(200, seed=seed, profiles=PROFILE_MIX)
+    engine = SimulationEngine(fleet, tick_seconds=600, start_time=0.0)
+    history = []
+    for _ in range(ticks):
+        engine.tick()
+        history.append(fleet.cpu_usage.tobytes())
+    return fleet, history
+
+
+def test_same_seed_gives_byte_identical_history():
+    _, first = run_engine(seed=42)
+    _, second = run_engine(seed=42)
+    assert first == second
+    _, other = run_engine(seed=43)
+    assert all(a != b for a, b in zip(first, other))
+
+
+def test_profile_values_stay_in_range():
+    fleet = Fleet.random(400, seed=3, profiles=PROFILE_MIX)
+    engine = SimulationEngine(fleet, tick_seconds=900, start_time=0.0)
+    workload = fleet.workload
+    codes = workload.codes
+    assert set(codes.tolist()) == set(range(len(PROFILES)))
+    bursts = 0
+    for _ in range(96):  # 하루치
+        engine.tick()
+        usage = fleet.cpu_usage
+        assert ((usage >= 0) & (usage <= 100)).all()
+        assert ((usage[codes == CLASSIC] >= 1) & (usage[codes == CLASSIC] <= 30)).all()
+        assert ((usage[codes == IDLE] >= 0.25) & (usage[codes == IDLE] <= 4.5)).all()
+        diurnal = codes == DIURNAL
+        low = workload.baseline[diurnal] - 3
+        high = workload.baseline[diurnal] + workload.amplitude[diurnal] + 3
+        assert ((usage[diurnal] >= low - 1e-4) & (usage[diurnal] <= high + 1e-4)).all()
+        bursty = usage[codes == BURSTY]
+        busy = bursty >= 60
+        assert (bursty[~busy] <= 10).all() and (bursty[busy] <= 95).all()
+        bursts += int(busy.sum())
+    assert bursts > 0
@@ -0,0 +1,169 @@
+import numpy as np
+
+from fleet import format_timestamp
+
+# 이 수를 넘는 플릿은 가상 스크롤 목록(VirtualRows)으로 표시
+VIRTUAL_LIST_THRESHOLD = 1000
+
+
+def format_row(fleet, index):
+    """Treeview에 표시할 한 행의 값을 만듭니다."""
+    status = "실행 중" if fleet.running[index] else "중지됨"
+    if fleet.anomalies is not None:
+        label = fleet.anomalies.label(index)
+        if label:
+            status = f"{status} ({label})"
+    return (
+        str(fleet.names[index]),
+        f"{fleet.cpu_usage[index]:.1f}%",
+        f"${fleet.cost_per_hour[index]:.2f}",
+        status,
+        format_timestamp(fleet.last_updated[index]),
+    )
+
+
+def display_state(fleet):
+    """표시 문자열을 결정하는 값들을 표시 단위로 반올림한 배열들을 반환합니다.
+
+    두 시점의 결과를 원소별로 비교하면 화면에 보이는 값이 바뀐 서버를 알 수 있습니다.
+    last_updated는 틱마다 실행 중인 모든 서버에서 바뀌므로 비교하지 않으며,
+    마지막 업데이트 열은 다른 표시 값이 바뀐 행을 다시 그릴 때 함께 갱신됩니다.
+    """
+    return (
+        np.round(fleet.cpu_usage * 10).astype(np.int64),
+        np.round(fleet.cost_per_hour * 100).astype(np.int64),
+        fleet.running.copy(),
+        (fleet.anomalies.flags.copy() if fleet.anomalies is not None
+         else np.zeros(len(fleet), dtype=np.uint8)),
+    )
+
+
+def changed_rows(before, after):
+    """display_state() 두 개를 비교해 값이 달라진 서버 인덱스를 반환합니다."""
+    changed = np.zeros(len(after[0]), dtype=bool)
+    for old, new in zip(before, after):
+        changed |= old != new
+    return np.flatnonzero(changed)
+
+
+class TreeviewSync:
+    """Fleet 상태를 Treeview에 변경분만 반영합니다.
+
+    마지막으로 그린 값(표시 단위로 반올림)을 배열로 보관해 두고,
+    화면에 보이는 값이 달라진 행에만 tree.item()을 호출합니다.
+    행을 지우고 다시 넣지 않으므로 선택 항목과 스크롤 위치가 유지됩니다.
+    """
+
+    def __init__(self, tree, fleet):
+        self.tree = tree
+        self.fleet = fleet
+        self.item_ids = {}  # 서버 인덱스 -> Treeview item id
+        self._item_index = {}  # Treeview item id -> 서버 인덱스
+        self._shown = None
+
+    def rebuild(self):
+        """모든 행을 새로 만듭니다."""
+        children = self.tree.get_children()
+        if children:
+            self.tree.delete(*children)
+        self.item_ids = {
+            index: self.tree.insert('', 'end', values=format_row(self.fleet, index))
+            for index in range(len(self.fleet))
+        }
+        self._item_index = {item_id: index for index, item_id in self.item_ids.items()}
+        self._shown = display_state(self.fleet)
+        return len(self.fleet)
+
+    def changed_indices(self):
+        """마지막 반영 이후 표시 값이 달라진 서버 인덱스를 반환합니다."""
+        current = display_state(self.fleet)
+        return changed_rows(self._shown, current), current
+
+    def selection(self):
+        """선택된 행을 ('server', 인덱스)로 반환합니다. 선택이 없으면 None입니다."""
+        selected = self.tree.selection()
+        if not selected or selected[0] not in self._item_index:
+            return None
+        return ('server', self._item_index[selected[0]])
+
+    def refresh(self):
+        """변경된 행만 갱신하고, 갱신한 행 수를 반환합니다."""
+        if self._shown is None or len(self._shown[0]) != len(self.fleet):
+            return self.rebuild()
+        changed, current = self.changed_indices()
+        for index in changed:
+            self.tree.item(self.item_ids[index], values=format_row(self.fleet, index))
+        self._shown = current
+        return len(changed)
+
+
+# 정렬 기준 컬럼 -> Fleet 배열 이름
+SORT_KEYS = {
+    'cpu': 'cpu_usage',
+    'cost': 'cost_per_hour',
+}
+
+
+class VirtualRows:
+    """Fleet 위의 스크롤 창(window)을 계산하는 모델입니다.
+
+    정렬은 Fleet 배열에 대한 인덱스 순열(order)로만 표현하고,
+    화면에 보이는 visible개 행만 문자열로 만듭니다.
+    """
+
+    def __init__(self, fleet, visible=20):
+        self.fleet = fleet
+        self.visible = visible
+        self.offset = 0
+        self.sort_key = None
+        self.descending = False
+        self.order = None  # None이면 Fleet 순서 그대로
+
+    def total(self):
+        return len(self.fleet)
+
+    def max_offset(self):
+        return max(0, self.total() - self.visible)
+
+    def scroll_to(self, offset):
+        """첫 번째로 보이는 행의 위치를 옮깁니다."""
+        self.offset = int(min(max(offset, 0), self.max_offset()))
+        return self.offset
+
+    def scroll_by(self, rows):
+        return self.scroll_to(self.offset + rows)
+
+    def sort_by(self, key, descending=None):
+        """CPU 또는 비용 기준으로 정렬합니다. key가 None이면 원래 순서로 돌아갑니다."""
+        if key is not None and key not in SORT_KEYS:
+            raise ValueError(f"정렬할 수 없는 컬럼입니다: {key}")
+        if descending is None:
+            # 같은 컬럼을 다시 누르면 정렬 방향을 뒤집음
+            descending = not self.descending if key == self.sort_key else True
+        self.sort_key = key
+        self.descending = descending
+        self.resort()
+
+    def resort(self):
+        """현재 정렬 기준으로 순열을 다시 계산합니다."""
+        if self.sort_key is None:
+            self.order = None
+            return
+        values = getattr(self.fleet, SORT_KEYS[self.sort_key])
+        order = np.argsort(values, kind='stable')
+        self.order = order[::-1] if self.descending else order
+
+    def window(self):
+        """현재 화면에 보이는 서버 인덱스 배열을 반환합니다."""
+        self.scroll_to(self.offset)
+        end = min(self.offset + self.visible, self.total())
+        if self.order is None:
+            return np.arange(self.offset, end)
+        return self.order[self.offset:end]
+
+    def fractions(self):
+        """스크롤바에 넘길 (first, last) 비율을 반환합니다."""
+        total = self.total()
+        if total == 0:
+            return 0.0, 1.0
+        return self.offset / total, min(self.offset + self.visible, total) / total
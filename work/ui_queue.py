@@ -0,0 +1,71 @@
+import queue
+
+FRAME_MS = 16  # 약 60fps
+
+
+class UIUpdateQueue:
+    """워커 스레드가 보낸 UI 변경을 Tk 스레드에서 한꺼번에 처리하는 큐입니다.
+
+    post()와 request_redraw()는 어느 스레드에서나 호출할 수 있고,
+    실제 위젯 조작은 Tk 스레드의 drain()에서만 일어납니다. drain()은
+    프레임마다 최대 한 번 실행되며, 같은 key로 들어온 변경은 마지막
+    것만 적용하고 여러 번의 다시 그리기 요청은 한 번으로 합칩니다.
+    """
+
+    _REDRAW = object()
+
+    def __init__(self, root, redraw, frame_ms=FRAME_MS):
+        self.root = root
+        self.redraw = redraw
+        self.frame_ms = frame_ms
+        self._events = queue.SimpleQueue()
+        self._after_id = None
+
+    def post(self, callback, key=None):
+        """Tk 스레드에서 실행할 callback을 등록합니다."""
+        self._events.put((key, callback))
+
+    def request_redraw(self):
+        """다음 프레임에 화면을 한 번 다시 그리도록 요청합니다."""
+        self._events.put((self._REDRAW, None))
+
+    def start(self):
+        """프레임 주기로 큐를 비우는 루프를 시작합니다. Tk 스레드에서 호출해야 합니다."""
+        if self._after_id is None:
+            self._after_id = self.root.after(self.frame_ms, self._poll)
+
+    def stop(self):
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+
+    def _poll(self):
+        self.drain()
+        self._after_id = self.root.after(self.frame_ms, self._poll)
+
+    def drain(self):
+        """쌓인 변경을 합쳐서 적용하고, 실행한 callback 수를 반환합니다."""
+        pending = {}  # key -> callback (삽입 순서 유지)
+        redraw = False
+        serial = 0
+        while True:
+            try:
+                key, callback = self._events.get_nowait()
+            except queue.Empty:
+                break
+            if key is self._REDRAW:
+                redraw = True
+                continue
+            if key is None:
+                # key가 없는 변경은 합치지 않고 모두 실행
+                key = ('unique', serial)
+                serial += 1
+            else:
+                pending.pop(key, None)
+            pending[key] = callback
+
+        if redraw:
+            self.redraw()
+        for callback in pending.values():
+            callback()
+        return len(pending) + int(redraw)
@@ -0,0 +1,105 @@
+import tkinter as tk
+from tkinter import ttk
+
+from tree_sync import VirtualRows, format_row
+
+
+class VirtualServerList(ttk.Frame):
+    """보이는 행만 Treeview 항목으로 유지하는 가상 스크롤 서버 목록입니다.
+
+    Treeview에는 항상 visible개의 항목만 존재하고, 스크롤하면
+    같은 항목의 값만 바꿔 다른 서버를 보여줍니다.
+    """
+
+    COLUMNS = ('name', 'cpu', 'cost', 'status', 'last_updated')
+
+    def __init__(self, parent, fleet, visible=20, **kwargs):
+        super().__init__(parent, **kwargs)
+        self.rows = VirtualRows(fleet, visible)
+        self._shown = {}  # 항목 id -> 표시 중인 값
+
+        self.tree = ttk.Treeview(self, columns=self.COLUMNS, show='headings',
+                                 height=visible, selectmode='browse')
+        self.tree.heading('name', text='서버명', command=lambda: self.sort_by(None))
+        self.tree.heading('cpu', text='CPU 사용률 (%)', command=lambda: self.sort_by('cpu'))
+        self.tree.heading('cost', text='시간당 비용 ($)', command=lambda: self.sort_by('cost'))
+        self.tree.heading('status', text='상태')
+        self.tree.heading('last_updated', text='마지막 업데이트')
+
+        self.tree.column('name', width=100)
+        self.tree.column('cpu', width=100, anchor=tk.CENTER)
+        self.tree.column('cost', width=100, anchor=tk.CENTER)
+        self.tree.column('status', width=100, anchor=tk.CENTER)
+        self.tree.column('last_updated', width=150, anchor=tk.CENTER)
+
+        self.scrollbar = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self._on_scrollbar)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        # 고정 개수의 항목을 미리 만들어 재사용
+        self.item_ids = [self.tree.insert('', 'end', values=()) for _ in range(visible)]
+
+        for sequence in ('<MouseWheel>', '<Button-4>', '<Button-5>'):
+            self.tree.bind(sequence, self._on_wheel)
+        self.tree.bind('<Prior>', lambda e: self._scroll(-visible))
+        self.tree.bind('<Next>', lambda e: self._scroll(visible))
+
+        self.refresh()
+
+    def sort_by(self, key):
+        """컬럼 헤더 클릭 시 정렬 기준을 바꾸고 처음으로 스크롤합니다."""
+        with self.rows.fleet.lock:
+            self.rows.sort_by(key)
+        self.rows.scroll_to(0)
+        self.render()
+
+    def selection(self):
+        """선택된 행을 ('server', 인덱스)로 반환합니다. 선택이 없으면 None입니다."""
+        selected = self.tree.selection()
+        if not selected or selected[0] not in self.item_ids:
+            return None
+        window = self.rows.window()
+        slot = self.item_ids.index(selected[0])
+        return ('server', int(window[slot])) if slot < len(window) else None
+
+    def refresh(self):
+        """틱마다 호출합니다. CPU 정렬은 값이 바뀌므로 순열을 다시 계산합니다."""
+        if self.rows.sort_key == 'cpu':
+            with self.rows.fleet.lock:
+                self.rows.resort()
+        self.render()
+
+    def render(self):
+        """보이는 창의 행만 그리고, 값이 바뀐 항목만 갱신합니다."""
+        fleet = self.rows.fleet
+        with fleet.lock:
+            window = self.rows.window()
+            rows = [format_row(fleet, index) for index in window]
+        for slot, item_id in enumerate(self.item_ids):
+            values = rows[slot] if slot < len(rows) else ()
+            if self._shown.get(item_id) != values:
+                self.tree.item(item_id, values=values)
+                self._shown[item_id] = values
+        self.scrollbar.set(*self.rows.fractions())
+
+    def _scroll(self, rows):
+        self.rows.scroll_by(rows)
+        self.render()
+        return 'break'
+
+    def _on_scrollbar(self, action, *args):
+        if action == 'moveto':
+            self.rows.scroll_to(round(float(args[0]) * self.rows.total()))
+        elif action == 'scroll':
+            amount, unit = int(args[0]), args[1]
+            self.rows.scroll_by(amount * (self.rows.visible if unit == 'pages' else 1))
+        self.render()
+
+    def _on_wheel(self, event):
+        if getattr(event, 'num', None) == 4:
+            step = -3
+        elif getattr(event, 'num', None) == 5:
+            step = 3
+        else:
+            step = -3 if event.delta > 0 else 3
+        return self._scroll(step)
@@ -0,0 +1,328 @@
+"""엔진 하나의 상태를 여러 브라우저에 Server-Sent Events로 보내는 헤드리스 웹 대시보드입니다.
+
+    GET /        대시보드 페이지
+    GET /events  SSE 스트림: 처음에 snapshot 이벤트 하나, 이후 틱마다 delta 이벤트
+    GET /state   현재 전체 상태 (JSON)
+
+틱마다 화면 값(CPU, 비용, 상태, 이상 표시)이 바뀐 서버만 골라 delta 메시지를 한 번만
+직렬화하고, 같은 바이트를 모든 클라이언트의 큐에 넣습니다. 따라서 시청자가 늘어도
+늘어나는 비용은 소켓 쓰기뿐입니다. 갱신 시각만 바뀐 서버는 delta에 넣지 않습니다.
+클라이언트마다 큐 길이가 제한되어 있어, 느린 클라이언트의 큐가 가득 차면 밀린 delta를
+버리고 현재 전체 상태(snapshot) 하나로 바꿔 넣어 다시 맞춥니다.
+"""
+import asyncio
+import json
+import time
+
+import numpy as np
+
+from tree_sync import changed_rows, display_state
+
+DEFAULT_BUFFER = 16      # 클라이언트당 대기시킬 수 있는 메시지 수
+HEARTBEAT_SECONDS = 15.0  # 보낼 메시지가 없을 때 연결 유지용 주석을 보내는 간격
+WRITE_TIMEOUT = 30.0     # 한 메시지를 이 시간 안에 보내지 못하면 연결을 끊음
+MAX_HEADER_BYTES = 8192
+
+
+def fleet_summary(fleet):
+    """비용 패널에 보이는 값입니다."""
+    return {
+        'servers': len(fleet),
+        'running': fleet.running_count(),
+        'hourly_cost': round(fleet.hourly_cost(), 2),
+        'monthly_cost': round(fleet.monthly_cost(), 2),
+        'anomalies': fleet.anomalies.flagged_count() if fleet.anomalies is not None else 0,
+    }
+
+
+def fleet_columns(fleet, rows):
+    """rows 서버의 표시 값을 열별 목록으로 반환합니다. 서버 목록과 같은 반올림을 씁니다."""
+    flags = (fleet.anomalies.flags[rows] if fleet.anomalies is not None
+             else np.zeros(len(rows), dtype=np.uint8))
+    return {
+        'index': rows.tolist(),
+        'cpu': np.round(fleet.cpu_usage[rows], 1).tolist(),
+        'cost': np.round(fleet.cost_per_hour[rows], 2).tolist(),
+        'running': fleet.running[rows].astype(np.uint8).tolist(),
+        'anomaly': flags.tolist(),
+        'updated': fleet.last_updated[rows].astype(np.int64).tolist(),
+    }
+
+
+def encode_event(event, data, event_id=None):
+    """SSE 메시지 하나를 바이트로 만듭니다."""
+    head = f"id: {event_id}\n" if event_id is not None else ""
+    body = json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+    return f"{head}event: {event}\ndata: {body}\n\n".encode('utf-8')
+
+
+class FleetStream:
+    """틱마다 화면 값이 바뀐 서버만 담은 delta와, 새 클라이언트용 전체 snapshot을 만듭니다.
+
+    fleet.lock을 잡은 상태에서 호출해야 합니다.
+    """
+
+    def __init__(self, engine):
+        self.engine = engine
+        self._shown = display_state(engine.fleet)
+
+    def snapshot(self):
+        fleet = self.engine.fleet
+        rows = np.arange(len(fleet))
+        return dict(fleet_columns(fleet, rows), tick=self.engine.tick_count,
+                    now=self.engine.now, names=[str(name) for name in fleet.names],
+                    summary=fleet_summary(fleet))
+
+    def delta(self):
+        fleet = self.engine.fleet
+        current = display_state(fleet)
+        rows = changed_rows(self._shown, current)
+        self._shown = current
+        return dict(fleet_columns(fleet, rows), tick=self.engine.tick_count,
+                    now=self.engine.now, summary=fleet_summary(fleet))
+
+
+class Client:
+    """연결된 브라우저 하나입니다. 보낼 메시지를 제한된 큐에 담아 둡니다."""
+
+    def __init__(self, writer, buffer):
+        self.writer = writer
+        self.queue = asyncio.Queue(maxsize=buffer)
+        self.task = asyncio.current_task()
+        self.resyncs = 0  # 큐가 넘쳐 snapshot으로 다시 맞춘 횟수
+
+    def _clear(self):
+        while not self.queue.empty():
+            self.queue.get_nowait()
+
+    def offer(self, message, snapshot):
+        """message를 넣습니다. 큐가 가득 차 있으면 밀린 것을 버리고 snapshot()으로 대신합니다."""
+        if self.queue.full():
+            self._clear()
+            self.queue.put_nowait(snapshot())
+            self.resyncs += 1
+        else:
+            self.queue.put_nowait(message)
+
+    def close(self):
+        """남은 메시지를 버리고 스트림을 끝내도록 알립니다."""
+        self._clear()
+        self.queue.put_nowait(None)
+
+
+class WebDashboard:
+    """엔진을 틱 주기마다 진행시키며 연결된 모든 클라이언트에 변경분을 보냅니다.
+
+    엔진 틱과 delta 계산은 이벤트 루프를 막지 않도록 실행기 스레드에서 하고,
+    직렬화한 메시지는 틱마다 한 번만 만듭니다.
+    """
+
+    def __init__(self, engine, host='127.0.0.1', port=8000, buffer=DEFAULT_BUFFER):
+        self.engine = engine
+        self.host = host
+        self.port = port
+        self.buffer = buffer
+        self.clients = set()
+        self.stream = FleetStream(engine)
+        self.sent = 0  # 클라이언트에 보낸 메시지 수 (모든 클라이언트 합계)
+        self._snapshot = None  # (틱, 직렬화한 snapshot), 틱마다 한 번만 만듦
+        self._state_lock = None
+        self._server = None
+
+    async def serve(self):
+        """서버를 열고 틱을 진행합니다. 취소될 때까지 돌아갑니다."""
+        self._state_lock = asyncio.Lock()
+        self._server = await asyncio.start_server(self._handle, self.host, self.port,
+                                                  limit=MAX_HEADER_BYTES)
+        self.port = self._server.sockets[0].getsockname()[1]
+        try:
+            await self._run_ticks()
+        finally:
+            self._server.close()
+            clients = list(self.clients)
+            for client in clients:
+                client.close()
+            await asyncio.gather(*(client.task for client in clients), return_exceptions=True)
+            await self._server.wait_closed()
+
+    async def _run_ticks(self):
+        loop = asyncio.get_running_loop()
+        due = time.monotonic()
+        while True:
+            due += self.engine.tick_seconds
+            await asyncio.sleep(max(0.0, due - time.monotonic()))
+            # 틱이 밀렸으면 따라잡지 않고 지금부터 다시 셈
+            due = max(due, time.monotonic() - self.engine.tick_seconds)
+            async with self._state_lock:
+                message = await loop.run_in_executor(None, self._tick)
+                self.broadcast(message)
+
+    def _tick(self):
+        engine = self.engine
+        engine.tick()
+        with engine.fleet.lock:
+            return encode_event('delta', self.stream.delta(), engine.tick_count)
+
+    def snapshot_message(self):
+        """현재 상태의 snapshot 메시지를 반환합니다. 같은 틱 안에서는 다시 만들지 않습니다."""
+        tick = self.engine.tick_count
+        if self._snapshot is None or self._snapshot[0] != tick:
+            with self.engine.fleet.lock:
+                message = encode_event('snapshot', self.stream.snapshot(), tick)
+            self._snapshot = (tick, message)
+        return self._snapshot[1]
+
+    def broadcast(self, message):
+        """모든 클라이언트의 큐에 같은 메시지를 넣습니다."""
+        for client in self.clients:
+            client.offer(message, self.snapshot_message)
+
+    async def _handle(self, reader, writer):
+        try:
+            request = await reader.readuntil(b'\r\n\r\n')
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+            writer.close()
+            return
+        method, _, rest = request.decode('latin-1').partition(' ')
+        path = rest.split(' ', 1)[0].split('?', 1)[0]
+        if method != 'GET':
+            await self._respond(writer, 405, 'text/plain', b'Method Not Allowed')
+        elif path == '/':
+            await self._respond(writer, 200, 'text/html; charset=utf-8', PAGE.encode('utf-8'))
+        elif path == '/state':
+            async with self._state_lock:
+                with self.engine.fleet.lock:
+                    data = self.stream.snapshot()
+            body = json.dumps(data, ensure_ascii=False).encode('utf-8')
+            await self._respond(writer, 200, 'application/json', body)
+        elif path == '/events':
+            await self._stream(writer)
+        else:
+            await self._respond(writer, 404, 'text/plain', b'Not Found')
+
+    async def _respond(self, writer, status, content_type, body):
+        reason = {200: 'OK', 404: 'Not Found', 405: 'Method Not Allowed'}[status]
+        writer.write(f"HTTP/1.1 {status} {reason}\r\nContent-Type: {content_type}\r\n"
+                     f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode('latin-1'))
+        writer.write(body)
+        try:
+            await asyncio.wait_for(writer.drain(), WRITE_TIMEOUT)
+        except (asyncio.TimeoutError, ConnectionError):
+            pass
+        writer.close()
+
+    async def _stream(self, writer):
+        writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\n"
+                     b"Cache-Control: no-cache\r\nConnection: keep-alive\r\n\r\nretry: 3000\n\n")
+        client = Client(writer, self.buffer)
+        # snapshot과 등록 사이에 틱이 끼어들지 않도록 틱과 같은 잠금을 잡음
+        async with self._state_lock:
+            client.queue.put_nowait(self.snapshot_message())
+            self.clients.add(client)
+        try:
+            while True:
+                try:
+                    message = await asyncio.wait_for(client.queue.get(), HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    message = b": keepalive\n\n"
+                if message is None:
+                    break
+                writer.write(message)
+                await asyncio.wait_for(writer.drain(), WRITE_TIMEOUT)
+                self.sent += 1
+        except (asyncio.TimeoutError, ConnectionError):
+            pass
+        finally:
+            self.clients.discard(client)
+            writer.close()
+
+
+def run(engine, host='127.0.0.1', port=8000, buffer=DEFAULT_BUFFER):
+    """Ctrl+C로 멈출 때까지 웹 대시보드를 실행합니다."""
+    dashboard = WebDashboard(engine, host, port, buffer)
+    try:
+        asyncio.run(dashboard.serve())
+    except KeyboardInterrupt:
+        pass
+    return dashboard
+
+
+PAGE = """<!DOCTYPE html>
+<html lang="ko">
+<head>
+<meta charset="utf-8">
+<title>FinOps Cloud Cost Optimizer</title>
+<style>
+  body { background: #2c3e50; color: #ecf0f1; font-family: sans-serif; margin: 20px; }
+  .panel { background: #34495e; padding: 12px 16px; margin-bottom: 12px; }
+  .cost { font-size: 28px; font-weight: bold; color: #2ecc71; }
+  table { border-collapse: collapse; width: 100%; background: #fff; color: #2c3e50; }
+  th, td { padding: 4px 8px; text-align: center; border-bottom: 1px solid #ddd; }
+  td:first-child { text-align: left; }
+  .stopped { color: #95a5a6; }
+  .anomaly { color: #e74c3c; font-weight: bold; }
+  #status { font-size: 12px; color: #bdc3c7; }
+</style>
+</head>
+<body>
+<div class="panel">
+  <div>월간 예상 비용</div>
+  <div class="cost" id="monthly">-</div>
+  <div id="summary"></div>
+  <div id="status">연결 중...</div>
+</div>
+<table>
+  <thead><tr><th>서버 이름</th><th>CPU 사용률</th><th>시간당 비용</th><th>상태</th><th>마지막 업데이트</th></tr></thead>
+  <tbody id="rows"></tbody>
+</table>
+<div id="more"></div>
+<script>
+const MAX_ROWS = 500;  // 브라우저에는 앞쪽 서버만 그림
+const LABELS = {1: ' (급증)', 2: ' (급감)'};
+let names = [], cells = [];
+const money = v => '$' + v.toLocaleString(undefined, {minimumFractionDigits: 2, maximumFractionDigits: 2});
+const clock = t => new Date(t * 1000).toTimeString().slice(0, 8);
+
+function showSummary(s, tick) {
+  document.getElementById('monthly').textContent = money(s.monthly_cost);
+  document.getElementById('summary').textContent =
+    `실행 중 ${s.running}/${s.servers}대, 시간당 ${money(s.hourly_cost)}, 이상 상태 ${s.anomalies}대`;
+  document.getElementById('status').textContent = `틱 ${tick}`;
+}
+
+function apply(d) {
+  for (let k = 0; k < d.index.length; k++) {
+    const row = cells[d.index[k]];
+    if (!row) continue;
+    row[1].textContent = d.cpu[k].toFixed(1) + '%';
+    row[2].textContent = '$' + d.cost[k].toFixed(2);
+    row[3].textContent = (d.running[k] ? '실행 중' : '중지됨') + (LABELS[d.anomaly[k]] || '');
+    row[3].className = d.anomaly[k] ? 'anomaly' : (d.running[k] ? '' : 'stopped');
+    row[4].textContent = clock(d.updated[k]);
+  }
+  showSummary(d.summary, d.tick);
+}
+
+const source = new EventSource('/events');
+source.addEventListener('snapshot', e => {
+  const d = JSON.parse(e.data);
+  names = d.names;
+  const body = document.getElementById('rows');
+  body.textContent = '';
+  cells = [];
+  for (let i = 0; i < Math.min(names.length, MAX_ROWS); i++) {
+    const tr = body.insertRow();
+    const row = [0, 1, 2, 3, 4].map(() => tr.insertCell());
+    row[0].textContent = names[i];
+    cells.push(row);
+  }
+  document.getElementById('more').textContent =
+    names.length > MAX_ROWS ? `... 외 ${names.length - MAX_ROWS}대` : '';
+  apply(d);
+});
+source.addEventListener('delta', e => apply(JSON.parse(e.data)));
+source.onerror = () => { document.getElementById('status').textContent = '다시 연결 중...'; };
+</script>
+</body>
+</html>
+"""
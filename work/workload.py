@@ -0,0 +1,167 @@
+"""서버별 워크로드 프로파일에 따라 CPU 사용률을 만드는 시뮬레이션 모델입니다.
+
+한 틱의 샘플은 플릿의 Generator에서 한 번의 배치 호출로 뽑습니다.
+같은 시드의 Generator로 같은 순서의 연산을 하면 같은 기록이 바이트 단위로 재현됩니다.
+
+프로파일:
+    classic  기존 두 구간 (5% 미만이면 1-10%, 아니면 5-30%)
+    idle     0.5-3% 근처의 거의 쉬는 서버
+    diurnal  하루 주기 (UTC 기준 peak_hour에 최고)로 오르내리는 서버
+    bursty   평소 2-8%, burst_probability 확률로 60-95%까지 튀는 서버
+"""
+import numpy as np
+
+PROFILES = ('classic', 'idle', 'diurnal', 'bursty')
+CLASSIC, IDLE, DIURNAL, BURSTY = range(len(PROFILES))
+SECONDS_PER_DAY = 24 * 60 * 60
+
+
+def profile_codes(profiles):
+    """프로파일 이름(또는 코드) 목록을 int8 코드 배열로 변환합니다."""
+    codes = [PROFILES.index(p) if isinstance(p, str) else int(p) for p in profiles]
+    codes = np.asarray(codes, dtype=np.int8)
+    if len(codes) and (codes.min() < 0 or codes.max() >= len(PROFILES)):
+        raise ValueError(f"알 수 없는 워크로드 프로파일입니다. 사용 가능: {PROFILES}")
+    return codes
+
+
+def parse_profiles(items):
+    """['diurnal=0.6', 'bursty=0.4'] -> {'diurnal': 0.6, 'bursty': 0.4}
+
+    항목이 없으면 None을 반환합니다. NAME=RATIO 형식이 아니거나, 모르는 프로파일이거나,
+    같은 프로파일이 두 번 나오거나, 비율이 음수이거나 합이 0이면 ValueError를 던집니다.
+    """
+    if not items:
+        return None
+    profiles = {}
+    for item in items:
+        name, separator, ratio = item.partition('=')
+        name = name.strip()
+        if not separator:
+            raise ValueError(f"프로파일은 NAME=RATIO 형식이어야 합니다: {item}")
+        if name not in PROFILES:
+            raise ValueError(f"알 수 없는 워크로드 프로파일입니다: {name} "
+                             f"(사용 가능: {', '.join(PROFILES)})")
+        if name in profiles:
+            raise ValueError(f"프로파일이 두 번 지정되었습니다: {name}")
+        try:
+            value = float(ratio)
+        except ValueError:
+            raise ValueError(f"프로파일 비율이 숫자가 아닙니다: {item}") from None
+        if not 0 <= value < float('inf'):
+            raise ValueError(f"프로파일 비율은 0 이상의 유한한 수여야 합니다: {item}")
+        profiles[name] = value
+    if sum(profiles.values()) <= 0:
+        raise ValueError("프로파일 비율의 합이 0보다 커야 합니다.")
+    return profiles
+
+
+class WorkloadModel:
+    """서버별 프로파일 코드와 파라미터를 열 배열로 보관합니다.
+
+    파라미터는 생성 시 rng에서 한 번 뽑으며, 이후 sample()은 상태를 갖지 않습니다.
+    """
+
+    # state_arrays()/from_state_arrays()로 저장하고 복원하는 배열
+    STATE_FIELDS = ('codes', 'baseline', 'amplitude', 'peak_hour', 'burst_probability')
+
+    def __init__(self, profiles, rng=None):
+        rng = rng if rng is not None else np.random.default_rng()
+        self.codes = profile_codes(profiles)
+        size = len(self.codes)
+        self._find_single_profile()
+        # 파라미터를 한 번에 뽑아 프로파일 구성과 무관하게 난수 소비량을 고정
+        u = rng.random((4, size), dtype=np.float32)
+        self.baseline = np.select(
+            [self.codes == IDLE, self.codes == DIURNAL, self.codes == BURSTY],
+            [0.5 + 2.5 * u[0], 5 + 15 * u[0], 2 + 6 * u[0]], 0).astype(np.float32)
+        self.amplitude = np.where(self.codes == DIURNAL, 10 + 30 * u[1], 0).astype(np.float32)
+        self.peak_hour = (10 + 6 * u[2]).astype(np.float32)
+        self.burst_probability = np.where(self.codes == BURSTY, 0.02 + 0.08 * u[3],
+                                          0).astype(np.float32)
+
+    def _find_single_profile(self):
+        # 모든 서버가 같은 프로파일이면 sample()에서 프로파일별 분류를 건너뜀
+        codes = self.codes
+        self.single_profile = (int(codes[0]) if len(codes) and (codes == codes[0]).all()
+                               else None)
+
+    def state_arrays(self):
+        """스냅샷에 저장할 {이름: 배열}을 반환합니다."""
+        return {name: getattr(self, name) for name in self.STATE_FIELDS}
+
+    @classmethod
+    def from_state_arrays(cls, arrays):
+        """state_arrays()로 저장한 배열에서 같은 파라미터의 모델을 만듭니다."""
+        model = cls.__new__(cls)
+        for name in cls.STATE_FIELDS:
+            setattr(model, name, np.asarray(arrays[name]))
+        model._find_single_profile()
+        return model
+
+    @classmethod
+    def classic(cls, size, rng=None):
+        """모든 서버가 기존 두 구간 분포를 따르는 모델입니다."""
+        return cls(np.full(size, CLASSIC, dtype=np.int8), rng)
+
+    @classmethod
+    def mixed(cls, size, mix, rng=None):
+        """{프로파일: 비율} 비율대로 서버에 프로파일을 무작위 배정합니다."""
+        rng = rng if rng is not None else np.random.default_rng()
+        names = list(mix)
+        weights = np.asarray([mix[name] for name in names], dtype=np.float64)
+        codes = profile_codes(names)[rng.choice(len(names), size, p=weights / weights.sum())]
+        return cls(codes, rng)
+
+    def __len__(self):
+        return len(self.codes)
+
+    def sample(self, rng, rows, cpu_usage, now):
+        """rows 서버의 새 CPU 사용률을 반환합니다.
+
+        난수는 rows 수에 bursty 서버 수의 두 배를 더한 만큼 한 번의 배치 호출로 뽑고,
+        각 프로파일의 계산은 해당 서버에만 합니다.
+        """
+        if self.single_profile is not None:
+            members = [slice(None) if code == self.single_profile else None
+                       for code in range(len(PROFILES))]
+        else:
+            codes = self.codes[rows]
+            members = [np.flatnonzero(codes == code) for code in range(len(PROFILES))]
+            members = [take if len(take) else None for take in members]
+        bursty = members[BURSTY]
+        burst_count = 0 if bursty is None else len(rows[bursty])
+        draws = rng.random(len(rows) + 2 * burst_count)
+        noise = draws[:len(rows)]
+        trigger, level = draws[len(rows):].reshape(2, burst_count)
+        values = np.empty(len(rows))
+
+        take = members[CLASSIC]
+        if take is not None:
+            classic = noise[take] * 25
+            classic += 5
+            low = np.flatnonzero(cpu_usage[rows[take]] < 5)
+            classic[low] = 1 + 9 * noise[take][low]
+            values[take] = classic
+        take = members[IDLE]
+        if take is not None:
+            values[take] = self.baseline[rows[take]] * (0.5 + noise[take])
+        take = members[DIURNAL]
+        if take is not None:
+            servers = rows[take]
+            hours = (now % SECONDS_PER_DAY) / 3600.0
+            phase = 2 * np.pi * (hours - self.peak_hour[servers]) / 24.0
+            values[take] = (self.baseline[servers]
+                            + self.amplitude[servers] * 0.5 * (1 + np.cos(phase))
+                            + 6 * (noise[take] - 0.5))
+        if bursty is not None:
+            servers = rows[bursty]
+            values[bursty] = np.where(trigger < self.burst_probability[servers],
+                                      60 + 35 * level,
+                                      self.baseline[servers] + 4 * (noise[bursty] - 0.5))
+        return np.clip(values, 0, 100, out=values)
+
+    def profile_names(self, rows=None):
+        """rows 서버의 프로파일 이름 목록을 반환합니다."""
+        codes = self.codes if rows is None else self.codes[rows]
+        return [PROFILES[code] for code in codes]